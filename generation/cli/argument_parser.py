@@ -11,6 +11,7 @@ from typing import Any, Optional, Tuple
 
 from shared.logging.logger import get_logger
 from shared.config.planet_gen_config import PlanetGenConfig
+from generation.pipeline.provenance import STAGE_LAYERS
 
 logger = get_logger(__name__)
 
@@ -24,7 +25,8 @@ def parse_args(argv: Optional[list[str]] = None) -> Tuple[PlanetGenConfig, Optio
 
     Returns:
         Tuple[PlanetGenConfig, Optional[str], Optional[str], dict[str, Any]]:
-            Planet config, output path, input path, craton argument overrides
+            Planet config, output path, input path, and per-stage argument overrides
+            keyed by stage (e.g. "mesh", "craton_seeding", "plate_motion", "elevation", "drainage", "erosion", "climate", "biomes", "regions", "political_map", "export", "cache", plus "pipeline" control options)
     """
     parser = argparse.ArgumentParser(description="Generate a procedural planet.")
 
@@ -32,6 +34,9 @@ def parse_args(argv: Optional[list[str]] = None) -> Tuple[PlanetGenConfig, Optio
     parser.add_argument("--config", type=str, help="Path to JSON config file")
     parser.add_argument("--output", type=str, help="Output file path for .planetbin export")
     parser.add_argument("--input", type=str, help="Path to existing .planetbin file to load instead of generating")
+    parser.add_argument("--rerun", type=str, choices=list(STAGE_LAYERS),
+                        help="With --input: re-run one stage and update only its layers in the file")
+    parser.add_argument("--batch", type=int, help="Generate this many planets with consecutive seeds, starting at --seed")
 
     # === Mesh Generation CLI Support ===
     parser.add_argument("--radius", type=float, help="Planet radius in kilometers")
@@ -44,8 +49,60 @@ def parse_args(argv: Optional[list[str]] = None) -> Tuple[PlanetGenConfig, Optio
     parser.add_argument("--craton_count", type=int, help="Number of cratons to seed")
     parser.add_argument("--craton_spacing", type=float, help="Spacing factor between cratons")
 
+    # === Plate Motion CLI Support ===
+    parser.add_argument("--plate_strategy", type=str, help="Plate motion strategy (e.g. euler_pole)")
+    parser.add_argument("--plate_min_speed", type=float, help="Minimum plate angular velocity (degrees per million years)")
+    parser.add_argument("--plate_max_speed", type=float, help="Maximum plate angular velocity (degrees per million years)")
+
+    # === Elevation CLI Support ===
+    parser.add_argument("--elevation_strategy", type=str, help="Elevation strategy (e.g. tectonic)")
+    parser.add_argument("--smoothing_passes", type=int, help="Number of elevation smoothing passes")
+
+    # === Drainage CLI Support ===
+    parser.add_argument("--drainage_strategy", type=str, help="Drainage strategy (e.g. priority_flood)")
+
+    # === Erosion CLI Support ===
+    parser.add_argument("--erosion_strategy", type=str, help="Erosion strategy (e.g. stream_power)")
+    parser.add_argument("--erosion_iterations", type=int, help="Number of erosion timesteps")
+    parser.add_argument("--erosion_workers", type=int, help="Worker processes for tile-parallel erosion")
+
+    # === Climate CLI Support ===
+    parser.add_argument("--climate_strategy", type=str, help="Climate strategy (e.g. wind_advection)")
+
+    # === Biome CLI Support ===
+    parser.add_argument("--biome_strategy", type=str, help="Biome strategy (e.g. whittaker)")
+    parser.add_argument("--biome_table", type=str, help="JSON biome lookup table")
+
+    # === Region CLI Support ===
+    parser.add_argument("--region_strategy", type=str, help="Region labeling strategy (e.g. connected_components)")
+
+    # === Political Map CLI Support ===
+    parser.add_argument("--political_strategy", type=str, help="Political map strategy (e.g. cost_flood)")
+    parser.add_argument("--nation_count", type=int, help="Number of nations to place")
+
+    # === Export CLI Support ===
+    parser.add_argument("--export_strategy", type=str, help="Export strategy: hdf5 or flat (memory-mappable)")
+    parser.add_argument("--compression", type=str, help="Dataset compression for export: gzip, lzf or none")
+    parser.add_argument("--export_background", type=str, choices=["none", "thread", "process"],
+                        help="Write the output file in a background thread or process while generation continues")
+    parser.add_argument("--no_topology", action="store_true", help="Leave mesh faces and adjacency out of the file (rebuilt on load)")
+    parser.add_argument("--no_vertices", action="store_true", help="Leave mesh vertices out of the file (rebuilt on load)")
+    parser.add_argument("--quantize", action="store_true",
+                        help="Store elevation, climate and ID layers as 16/8-bit codes (smaller, lossy for floats)")
+    parser.add_argument("--tile_level", type=int,
+                        help="Store faces in icosphere tiles of this level (0 = 20 base faces) for regional reads")
+    parser.add_argument("--no_preview", action="store_true", help="Do not embed a low-resolution preview in the output file")
+
+    # === Stage Cache CLI Support ===
+    parser.add_argument("--cache_dir", type=str, help="Directory caching stage results; unchanged leading stages are loaded instead of re-run")
+    parser.add_argument("--cache_max_mb", type=int, help="Stage cache size limit in MB (least recently used entries are evicted)")
+
     args = parser.parse_args(argv)
     cli_dict = vars(args)
+    if args.rerun and not args.input:
+        parser.error("--rerun requires --input")
+    if args.batch is not None and (args.batch < 1 or args.input):
+        parser.error("--batch needs a positive count and cannot be combined with --input")
 
     # === Load config file if provided ===
     config_data = {}
@@ -81,4 +138,102 @@ def parse_args(argv: Optional[list[str]] = None) -> Tuple[PlanetGenConfig, Optio
     if args.craton_spacing is not None:
         craton_args["spacing_factor"] = args.craton_spacing
 
-    return config, args.output, args.input, craton_args
+    # === Build plate motion args override dict ===
+    plate_args = {}
+    if args.plate_strategy:
+        plate_args["strategy"] = args.plate_strategy
+    if args.plate_min_speed is not None:
+        plate_args["min_angular_velocity"] = args.plate_min_speed
+    if args.plate_max_speed is not None:
+        plate_args["max_angular_velocity"] = args.plate_max_speed
+
+    # === Build elevation args override dict ===
+    elevation_args = {}
+    if args.elevation_strategy:
+        elevation_args["strategy"] = args.elevation_strategy
+    if args.smoothing_passes is not None:
+        elevation_args["smoothing_passes"] = args.smoothing_passes
+
+    # === Build drainage args override dict ===
+    drainage_args = {}
+    if args.drainage_strategy:
+        drainage_args["strategy"] = args.drainage_strategy
+
+    # === Build erosion args override dict ===
+    erosion_args = {}
+    if args.erosion_strategy:
+        erosion_args["strategy"] = args.erosion_strategy
+    if args.erosion_iterations is not None:
+        erosion_args["iterations"] = args.erosion_iterations
+    if args.erosion_workers is not None:
+        erosion_args["workers"] = args.erosion_workers
+
+    # === Build climate args override dict ===
+    climate_args = {}
+    if args.climate_strategy:
+        climate_args["strategy"] = args.climate_strategy
+
+    # === Build biome args override dict ===
+    biome_args = {}
+    if args.biome_strategy:
+        biome_args["strategy"] = args.biome_strategy
+    if args.biome_table:
+        biome_args["table_path"] = args.biome_table
+
+    # === Build region args override dict ===
+    region_args = {}
+    if args.region_strategy:
+        region_args["strategy"] = args.region_strategy
+
+    # === Build political map args override dict ===
+    political_args = {}
+    if args.political_strategy:
+        political_args["strategy"] = args.political_strategy
+    if args.nation_count is not None:
+        political_args["nation_count"] = args.nation_count
+
+    # === Build export args override dict ===
+    export_args = {}
+    if args.export_strategy:
+        export_args["strategy"] = args.export_strategy
+    if args.compression:
+        export_args["compression"] = args.compression
+    if args.export_background:
+        export_args["background"] = args.export_background
+    if args.no_topology:
+        export_args["store_topology"] = False
+    if args.no_vertices:
+        export_args["store_vertices"] = False
+    if args.quantize:
+        export_args["quantize"] = True
+    if args.tile_level is not None:
+        export_args["tile_level"] = args.tile_level
+    if args.no_preview:
+        export_args["preview_level"] = -1
+
+    # === Build stage cache args override dict ===
+    cache_args = {}
+    if args.cache_dir:
+        cache_args["directory"] = args.cache_dir
+    if args.cache_max_mb is not None:
+        cache_args["max_size_mb"] = args.cache_max_mb
+
+    # Overrides are namespaced per stage so shared keys like "strategy" don't collide
+    stage_args = {
+        "mesh": {"strategy": config.mesh_strategy},
+        "craton_seeding": craton_args,
+        "plate_motion": plate_args,
+        "elevation": elevation_args,
+        "drainage": drainage_args,
+        "erosion": erosion_args,
+        "climate": climate_args,
+        "biomes": biome_args,
+        "regions": region_args,
+        "political_map": political_args,
+        "export": export_args,
+        "cache": cache_args,
+        # Pipeline control rather than a stage: which stage to re-run on a loaded planet, how many planets to generate
+        "pipeline": {"rerun": args.rerun, "batch": args.batch or 1},
+    }
+
+    return config, args.output, args.input, stage_args
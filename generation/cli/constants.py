@@ -20,6 +20,343 @@ CRATON_PARAMS = {
     # "min_distance" is not exposed via CLI yet, but can be added later if needed
 }
 
+PLATE_MOTION_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "euler_pole",
+    },
+    "min_angular_velocity": {
+        "type": float,
+        "default": 0.1,  # degrees per million years
+    },
+    "max_angular_velocity": {
+        "type": float,
+        "default": 1.0,  # degrees per million years
+    },
+    "transform_threshold": {
+        "type": float,
+        "default": 0.5,
+    },
+    "min_growth_rate": {
+        "type": float,
+        "default": 0.3,
+    },
+    "growth_noise": {
+        "type": float,
+        "default": 0.5,
+    },
+    "craton_fraction": {
+        "type": float,
+        "default": 0.2,
+    },
+}
+
+ELEVATION_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "tectonic",
+    },
+    "continent_height": {
+        "type": float,
+        "default": 800.0,  # meters
+    },
+    "ocean_depth": {
+        "type": float,
+        "default": -4000.0,  # meters
+    },
+    "shelf_width": {
+        "type": float,
+        "default": 600.0,  # km
+    },
+    "mountain_height": {
+        "type": float,
+        "default": 4000.0,  # meters
+    },
+    "mountain_width": {
+        "type": float,
+        "default": 400.0,  # km
+    },
+    "ridge_height": {
+        "type": float,
+        "default": 2000.0,  # meters
+    },
+    "rift_depth": {
+        "type": float,
+        "default": 1500.0,  # meters
+    },
+    "smoothing_passes": {
+        "type": int,
+        "default": 3,
+    },
+    "smoothing_strength": {
+        "type": float,
+        "default": 0.5,
+    },
+    "sea_level": {
+        "type": float,
+        "default": 0.0,  # meters
+    },
+    "noise_amplitude": {
+        "type": float,
+        "default": 400.0,  # meters
+    },
+    "noise_frequency": {
+        "type": float,
+        "default": 4.0,
+    },
+}
+
+DRAINAGE_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "priority_flood",
+    },
+    "epsilon": {
+        "type": float,
+        "default": 1e-3,  # meters
+    },
+}
+
+EROSION_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "stream_power",
+    },
+    "iterations": {
+        "type": int,
+        "default": 200,
+    },
+    "timestep": {
+        "type": float,
+        "default": 10000.0,  # years
+    },
+    "erodibility": {
+        "type": float,
+        "default": 1e-7,
+    },
+    "area_exponent": {
+        "type": float,
+        "default": 0.5,
+    },
+    "slope_exponent": {
+        "type": float,
+        "default": 1.0,
+    },
+    "diffusivity": {
+        "type": float,
+        "default": 10000.0,  # m²/yr
+    },
+    "reroute_interval": {
+        "type": int,
+        "default": 50,
+    },
+    "workers": {
+        "type": int,
+        "default": 0,  # 0 or 1 = in-process
+    },
+    "halo_width": {
+        "type": int,
+        "default": 8,
+    },
+    "epsilon": {
+        "type": float,
+        "default": 1e-3,  # meters
+    },
+}
+
+CLIMATE_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "wind_advection",
+    },
+    "equator_temperature": {
+        "type": float,
+        "default": 27.0,  # °C
+    },
+    "pole_temperature": {
+        "type": float,
+        "default": -25.0,  # °C
+    },
+    "lapse_rate": {
+        "type": float,
+        "default": 6.5,  # °C per km
+    },
+    "ocean_evaporation": {
+        "type": float,
+        "default": 1200.0,  # mm/yr
+    },
+    "rainout_length": {
+        "type": float,
+        "default": 1500.0,  # km
+    },
+    "orographic_strength": {
+        "type": float,
+        "default": 0.2,
+    },
+    "land_recycling": {
+        "type": float,
+        "default": 0.4,
+    },
+    "transport_distance": {
+        "type": float,
+        "default": 4000.0,  # km
+    },
+    "mixing": {
+        "type": float,
+        "default": 0.2,
+    },
+    "temperature_noise": {
+        "type": float,
+        "default": 2.0,  # °C
+    },
+    "precipitation_noise": {
+        "type": float,
+        "default": 0.3,
+    },
+}
+
+BIOMES_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "whittaker",
+    },
+    "table_path": {
+        "type": str,
+        "default": "",  # empty = built-in Whittaker table
+    },
+    "table": {
+        "type": dict,
+        "default": None,  # inline table description, see generate_biomes/lookup_table.py
+    },
+}
+
+REGIONS_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "connected_components",
+    },
+    "continent_min_area": {
+        "type": float,
+        "default": 3e6,  # km²
+    },
+    "ocean_min_area": {
+        "type": float,
+        "default": 1e7,  # km²
+    },
+    "min_named_faces": {
+        "type": int,
+        "default": 10,
+    },
+}
+
+POLITICAL_MAP_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "cost_flood",
+    },
+    "nation_count": {
+        "type": int,
+        "default": 12,
+    },
+    "min_capital_spacing": {
+        "type": float,
+        "default": 1500.0,  # km
+    },
+    "ocean_cost": {
+        "type": float,
+        "default": 20.0,
+    },
+    "slope_weight": {
+        "type": float,
+        "default": 50.0,
+    },
+    "biome_costs": {
+        "type": dict,
+        "default": None,  # biome name -> travel cost multiplier, see generate_political_map/cost_flood.py
+    },
+}
+
+EXPORT_PARAMS = {
+    "strategy": {
+        "type": str,
+        "default": "hdf5",  # "hdf5" or "flat" (memory-mappable, uncompressed)
+    },
+    "background": {
+        "type": str,
+        "default": "none",  # "none", "thread" or "process": write the file while the caller continues
+    },
+    "compression": {
+        "type": str,
+        "default": "gzip",  # "gzip", "lzf" or "none"
+    },
+    "compression_level": {
+        "type": int,
+        "default": 4,
+    },
+    "shuffle": {
+        "type": bool,
+        "default": True,
+    },
+    "chunk_rows": {
+        "type": int,
+        "default": 65536,
+    },
+    # False leaves generated mesh arrays out of the file; they are rebuilt on load
+    "store_topology": {
+        "type": bool,
+        "default": True,
+    },
+    "store_vertices": {
+        "type": bool,
+        "default": True,
+    },
+    # True stores elevation, climate and ID fields as int16/uint16/uint8 codes (lossy for floats)
+    "quantize": {
+        "type": bool,
+        "default": False,
+    },
+    # Chunk along icosphere tiles of this level for regional reads; None disables tiling
+    "tile_level": {
+        "type": int,
+        "default": None,
+    },
+    # Embedded low-resolution preview (coarse mesh + aggregated layers); negative disables it
+    "preview_level": {
+        "type": int,
+        "default": 3,
+    },
+    "thumbnail_width": {
+        "type": int,
+        "default": 256,
+    },
+    # Per-dataset-class overrides of the settings above, see generation/models/storage.py
+    "topology": {
+        "type": dict,
+        "default": None,
+    },
+    "geometry": {
+        "type": dict,
+        "default": None,
+    },
+    "layers": {
+        "type": dict,
+        "default": None,
+    },
+}
+
+# Content-addressed stage result cache, see generation/pipeline/stage_cache.py
+CACHE_PARAMS = {
+    "directory": {
+        "type": str,
+        "default": None,  # None disables the cache
+    },
+    # Least recently used entries are evicted beyond this size
+    "max_size_mb": {
+        "type": int,
+        "default": 2048,
+    },
+}
+
 # Example placeholder for future mesh configuration
 MESH_PARAMS = {
     "strategy": {
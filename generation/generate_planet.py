@@ -1,41 +1,125 @@
 # generation/generate_planet.py
 """
 CLI entry point for procedural planet generation.
-Delegates to pipeline stages: mesh, cratons, export.
+Delegates to pipeline stages: mesh, cratons, plate motion, elevation, drainage, erosion, climate, biomes, regions, political map, export.
 """
 
+from pathlib import Path
+
+from generation.models.flat_file import is_flat_file
 from generation.models.planet import Planet
 from shared.logging.logger import get_logger
 from generation.cli.argument_parser import parse_args
 from generation.pipeline.run_mesh import run_mesh
 from generation.pipeline.run_cratons import run_cratons
-from generation.pipeline.run_export import run_export
+from generation.pipeline.run_plate_motion import run_plate_motion
+from generation.pipeline.run_elevation import run_elevation
+from generation.pipeline.run_drainage import run_drainage
+from generation.pipeline.run_erosion import run_erosion
+from generation.pipeline.run_climate import run_climate
+from generation.pipeline.run_biomes import run_biomes
+from generation.pipeline.run_regions import run_regions
+from generation.pipeline.run_political_map import run_political_map
+from generation.pipeline.run_export import run_export, wait_for_exports
+from generation.pipeline.provenance import STAGE_LAYERS
+from generation.pipeline.stage_cache import open_stage_cache, stage_keys
 
 logger = get_logger(__name__)
 
+# Stage key (as in stage_args), runner and progress-log label, in pipeline order
+PIPELINE = [
+    ("mesh", run_mesh, "mesh generation"),
+    ("craton_seeding", run_cratons, "craton seeding"),
+    ("plate_motion", run_plate_motion, "plate motion"),
+    ("elevation", run_elevation, "elevation"),
+    ("drainage", run_drainage, "drainage"),
+    ("erosion", run_erosion, "erosion"),
+    ("climate", run_climate, "climate"),
+    ("biomes", run_biomes, "biomes"),
+    ("regions", run_regions, "regions"),
+    ("political_map", run_political_map, "political map"),
+]
+
+
+def generate(config, stage_args: dict, seed: int) -> Planet:
+    """
+    Run every pipeline stage on a new planet with the given seed.
+
+    With a stage cache configured (the "cache" block or --cache_dir), the longest run of
+    leading stages whose results are cached is loaded instead of run, and every stage that
+    does run stores its result; see generation/pipeline/stage_cache.py.
+    """
+    planet = Planet(
+        radius=config.radius,
+        subdivision_level=config.subdivision_level,
+        seed=seed,
+    )
+    logger.info("Initialized new planet: %s", planet.summary())
+
+    stages = [key for key, _, _ in PIPELINE]
+    cache = open_stage_cache(config, stage_args.get("cache", {}))
+    keys = stage_keys(stages, planet, config, stage_args) if cache else []
+    start = cache.cached_prefix(keys) if cache else 0
+    if start:
+        try:
+            planet = cache.restore(planet, stages[:start], keys[:start])
+            logger.info("Loaded stages up to %s from the stage cache:\n%s", PIPELINE[start - 1][2], planet.summary())
+        except OSError as e:
+            logger.warning("%s; running every stage", e)
+            planet = Planet(radius=config.radius, subdivision_level=config.subdivision_level, seed=seed)
+            start = 0
+
+    for index, (key, runner, label) in enumerate(PIPELINE[start:], start):
+        planet = runner(planet, config, stage_args[key])
+        if cache:
+            cache.store(keys[index], planet, key)
+        logger.info("Planet after %s:\n%s", label, planet.summary())
+    return planet
+
+
+def batch_output_path(output_path: str | None, seed: int) -> str | None:
+    """Output path of one batch member: the seed is appended to the file name."""
+    if not output_path:
+        return None
+    path = Path(output_path)
+    return str(path.with_name(f"{path.stem}_{seed}{path.suffix}"))
 
-def main():
-    config, output_path, input_path, cli_args = parse_args()
-
-    if input_path:
-        logger.info("Loading planet from file: %s", input_path)
-        planet = Planet.load(input_path)
-        logger.info("Planet loaded: %s", planet.summary())
-    else:
-        planet = Planet(
-            radius=config.radius,
-            subdivision_level=config.subdivision_level,
-            seed=config.seed,
-        )
-        logger.info("Initialized new planet: %s", planet.summary())
-
-        planet = run_mesh(planet, config, cli_args)
-        logger.info("Planet after mesh generation:\n%s", planet.summary())
 
-        planet = run_cratons(planet, config, cli_args)
-        logger.info("Planet after craton seeding:\n%s", planet.summary())
-
-    run_export(planet, output_path)
+def main():
+    config, output_path, input_path, stage_args = parse_args()
+    rerun = stage_args["pipeline"].get("rerun")
+    batch = stage_args["pipeline"].get("batch", 1)
+
+    try:
+        if input_path:
+            in_place = not output_path or Path(output_path).resolve() == Path(input_path).resolve()
+            if rerun and in_place and is_flat_file(input_path):
+                # Flat files are rewritten whole, and the loaded planet still maps the input file
+                raise ValueError(f"Cannot update flat planet file {input_path} in place; "
+                                 "pass --output to write the re-run planet to a new file")
+            logger.info("Loading planet from file: %s", input_path)
+            planet = Planet.load(input_path)
+            logger.info("Planet loaded: %s", planet.summary())
+
+            if rerun:
+                key, runner, label = next(stage for stage in PIPELINE if stage[0] == rerun)
+                planet = runner(planet, config, stage_args[key])
+                logger.info("Planet after re-running %s:\n%s", label, planet.summary())
+
+                # Write just this stage's layers back into the input file, leaving the rest untouched
+                if in_place:
+                    run_export(planet, input_path, config, stage_args["export"], layers=list(STAGE_LAYERS[key]))
+                    return
+            run_export(planet, output_path, config, stage_args["export"])
+        elif batch == 1:
+            run_export(generate(config, stage_args, config.seed), output_path, config, stage_args["export"])
+        else:
+            # With a background export mode, each file is written while the next planet is generated
+            for seed in range(config.seed, config.seed + batch):
+                planet = generate(config, stage_args, seed)
+                run_export(planet, batch_output_path(output_path, seed), config, stage_args["export"])
+    finally:
+        wait_for_exports()
 
 
 if __name__ == "__main__":
@@ -66,3 +150,30 @@ if __name__ == "__main__":
 
 # Run with craton seeding via CLI (not the config file):
 # python -m generation.generate_planet --craton_strategy spaced_random --craton_count 10 --craton_spacing 1.2 --output testplanet.planetbin
+
+# Run with faster plate motion:
+# python -m generation.generate_planet --plate_strategy euler_pole --plate_min_speed 0.5 --plate_max_speed 2.0
+
+# Run erosion tile-parallel on 4 worker processes:
+# python -m generation.generate_planet --erosion_iterations 400 --erosion_workers 4
+
+# Classify biomes with a custom lookup table:
+# python -m generation.generate_planet --biome_table my_biomes.json
+
+# Generate a world with 20 nations:
+# python -m generation.generate_planet --nation_count 20
+
+# Re-run one stage on a saved planet, rewriting only that stage's layers in the file:
+# python -m generation.generate_planet --input testplanet.planetbin --rerun plate_motion --plate_max_speed 2.0
+
+# Export with fast lzf compression instead of gzip:
+# python -m generation.generate_planet --compression lzf --output testplanet.planetbin
+
+# Export a memory-mappable flat binary file (opened zero-copy by Planet.open / Planet.load):
+# python -m generation.generate_planet --export_strategy flat --output testplanet.planetmm
+
+# Generate 8 planets (seeds 42-49), writing each file in the background while the next one is generated:
+# python -m generation.generate_planet --batch 8 --seed 42 --export_background process --output world.planetbin
+
+# Cache stage results, so a second run that only changes the craton count loads the mesh instead of rebuilding it:
+# python -m generation.generate_planet --cache_dir .stage_cache --craton_count 12 --output testplanet.planetbin
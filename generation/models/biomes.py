@@ -1,7 +1,9 @@
 # generation/models/biomes.py
 from dataclasses import dataclass
+from typing import List, Optional
 import numpy as np
 
 @dataclass
 class BiomeMap:
     biome_ids: np.ndarray            # shape (num_faces,)
+    names: Optional[List[str]] = None  # biome name per id, when known
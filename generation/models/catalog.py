@@ -0,0 +1,289 @@
+# generation/models/catalog.py
+# SQLite index over collections of planet files
+
+"""
+Seed and parameter sweeps produce thousands of planet files; answering "which level-7
+planets have at least 10 cratons" should not mean opening all of them. PlanetCatalog keeps
+one SQLite row per file with its core attributes and summary numbers (PlanetFile.stats(),
+which reads attributes and dataset shapes only) plus the file's mtime and size:
+
+    with PlanetCatalog("sweep/catalog.sqlite") as catalog:
+        catalog.scan("sweep/")
+        rows = catalog.query(["subdivision_level=7", "num_cratons>=10"], order_by="seed")
+
+scan() is incremental: files whose mtime and size match their row are skipped without being
+opened, new or changed files are (re)read, and rows of deleted files are dropped. Reading a
+file's metadata costs a few milliseconds (mostly HDF5 attribute reads, which hold the GIL),
+so large batches of new files are described by a pool of worker processes. Queries hit
+indexed columns, so they take milliseconds however many files are indexed.
+
+The table layout follows COLUMNS (one has_<layer> flag per planet_layers.LAYERS entry); a
+catalog written with another layout is rebuilt on open. scripts/planet_catalog.py is the
+command-line front end.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from generation.models.flat_file import FlatPlanetFile
+from generation.models.planet import Planet
+from generation.models.planet_layers import LAYERS
+from generation.models.preview import PREVIEW_GROUP
+from generation.models.tiles import TILES_GROUP
+from shared.logging.logger import get_logger
+
+log = get_logger(__name__)
+
+# HDF5 and flat binary (models/flat_file.py) planet files
+DEFAULT_PATTERNS = ("*.planetbin", "*.planetmm")
+TABLE = "planets"
+
+# Column -> SQLite type, in table order
+COLUMNS: Dict[str, str] = {
+    "path": "TEXT PRIMARY KEY",
+    "mtime": "REAL",
+    "size": "INTEGER",
+    "format": "TEXT",
+    "radius": "REAL",
+    "subdivision_level": "INTEGER",
+    "seed": "INTEGER",
+    "num_faces": "INTEGER",
+    "num_cratons": "INTEGER",
+    "num_plates": "INTEGER",
+    "num_nations": "INTEGER",
+    "num_regions": "INTEGER",
+    "sea_level": "REAL",
+    **{f"has_{name}": "INTEGER" for name in LAYERS},
+    "has_preview": "INTEGER",
+    "tile_level": "INTEGER",
+    "provenance": "TEXT",       # JSON: layer -> {"stage", "params_hash"}
+}
+INDEXED_COLUMNS = ("subdivision_level", "seed", "num_cratons", "num_plates", "num_nations")
+
+# Changed files needed before scan() spreads the reading over worker processes
+PARALLEL_SCAN_MIN_FILES = 256
+
+# Longest first, so "num_plates>=5" splits at ">=" rather than ">"
+FILTER_OPERATORS = ("<=", ">=", "!=", "=", "<", ">")
+
+
+@dataclass
+class ScanResult:
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: List[str] = field(default_factory=list)   # paths that could not be read
+
+
+class PlanetCatalog:
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path (Union[str, Path]): SQLite database file, created if missing.
+        """
+        self.path = Path(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def __enter__(self) -> "PlanetCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _ensure_schema(self):
+        existing = [row["name"] for row in self.connection.execute(f"PRAGMA table_info({TABLE})")]
+        if existing == list(COLUMNS):
+            return
+        if existing:
+            log.info("Catalog %s has an older layout; rebuilding it", self.path)
+        columns = ", ".join(f"{name} {kind}" for name, kind in COLUMNS.items())
+        with self.connection:
+            self.connection.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            self.connection.execute(f"CREATE TABLE {TABLE} ({columns})")
+            for name in INDEXED_COLUMNS:
+                self.connection.execute(f"CREATE INDEX idx_{TABLE}_{name} ON {TABLE} ({name})")
+
+    def scan(self, root: Union[str, Path], patterns: Union[str, Sequence[str]] = DEFAULT_PATTERNS,
+             workers: Optional[int] = None) -> ScanResult:
+        """
+        Bring the catalog up to date with the planet files under `root`.
+
+        Args:
+            root (Union[str, Path]): Directory searched recursively
+            patterns (Union[str, Sequence[str]]): Glob(s) for planet file names
+            workers (Optional[int]): Processes used to read new or changed files when there are
+                at least PARALLEL_SCAN_MIN_FILES of them; None uses every CPU, 1 reads in-process
+
+        Returns:
+            ScanResult: How many rows were added, updated, left unchanged and removed, and
+            which files failed to open (their rows are dropped until they can be read)
+        """
+        root = Path(root).resolve()
+        prefix = f"{root}{os.sep}"
+        known = {row["path"]: (row["mtime"], row["size"])
+                 for row in self.connection.execute(f"SELECT path, mtime, size FROM {TABLE}")
+                 if row["path"].startswith(prefix)}
+
+        result = ScanResult()
+        changed, previously_known = [], set()
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        for file in sorted({file for pattern in patterns for file in root.rglob(pattern)}):
+            if not file.is_file():
+                continue
+            stat = file.stat()
+            previous = known.pop(str(file), None)
+            if previous == (stat.st_mtime, stat.st_size):
+                result.unchanged += 1
+                continue
+            if previous is not None:
+                previously_known.add(str(file))
+            changed.append((file, stat.st_mtime, stat.st_size))
+
+        rows = []
+        for (file, _, _), (row, error) in zip(changed, self._describe_all(changed, workers)):
+            key = str(file)
+            if error is not None:
+                log.warning("Skipping unreadable planet file %s: %s", file, error)
+                result.failed.append(key)
+                if key in previously_known:
+                    known[key] = None   # drop the stale row below
+                continue
+            rows.append(row)
+            if key in previously_known:
+                result.updated += 1
+            else:
+                result.added += 1
+
+        result.removed = sum(1 for key in known if key not in result.failed)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self.connection:
+            self.connection.executemany(f"INSERT OR REPLACE INTO {TABLE} VALUES ({placeholders})",
+                                        [tuple(row[name] for name in COLUMNS) for row in rows])
+            self.connection.executemany(f"DELETE FROM {TABLE} WHERE path = ?", [(key,) for key in known])
+        return result
+
+    @staticmethod
+    def _describe_all(changed: List[Tuple[Path, float, int]],
+                      workers: Optional[int]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """Run describe() over the changed files, in worker processes for large batches."""
+        if len(changed) < PARALLEL_SCAN_MIN_FILES or workers == 1 or (workers is None and os.cpu_count() == 1):
+            return [_try_describe(item) for item in changed]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_try_describe, changed, chunksize=64))
+
+    def query(self, filters: Sequence[str] = (), order_by: Optional[str] = None, descending: bool = False,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the catalog rows matching every filter.
+
+        Args:
+            filters (Sequence[str]): Conditions such as "subdivision_level=7" or "num_cratons>=10";
+                see parse_filter
+            order_by (Optional[str]): Column to sort by (default: path)
+            descending (bool): Sort in descending order
+            limit (Optional[int]): Maximum number of rows
+
+        Returns:
+            List[Dict[str, Any]]: One dict per planet file, keyed by column name
+        """
+        conditions, values = [], []
+        for text in filters:
+            column, operator, value = parse_filter(text)
+            conditions.append(f"{column} {operator} ?")
+            values.append(value)
+
+        order_by = order_by or "path"
+        _check_column(order_by)
+        sql = f"SELECT * FROM {TABLE}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            values.append(int(limit))
+        return [dict(row) for row in self.connection.execute(sql, values)]
+
+    def __len__(self) -> int:
+        return self.connection.execute(f"SELECT COUNT(*) FROM {TABLE}").fetchone()[0]
+
+
+def describe(path: Path, mtime: float, size: int) -> Dict[str, Any]:
+    """
+    Build the catalog row of one planet file from its metadata.
+
+    Args:
+        path (Path): Planet file (HDF5 or flat binary)
+        mtime (float): Modification time recorded for change detection
+        size (int): File size recorded for change detection
+
+    Returns:
+        Dict[str, Any]: Values for every column in COLUMNS
+    """
+    with Planet.open(path) as planet:
+        stats = planet.stats()
+        f = planet.file
+        row = {
+            "path": str(path),
+            "mtime": mtime,
+            "size": size,
+            "format": "flat" if isinstance(planet, FlatPlanetFile) else "hdf5",
+            **{name: stats[name] for name in COLUMNS if name in stats},
+            **{f"has_{name}": int(name in stats["layers"]) for name in LAYERS},
+            "has_preview": int(PREVIEW_GROUP in f),
+            "tile_level": int(f[TILES_GROUP].attrs["tile_level"]) if TILES_GROUP in f else None,
+            "provenance": json.dumps(planet.provenance, sort_keys=True),
+        }
+    return row
+
+
+def _try_describe(item: Tuple[Path, float, int]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """describe() for worker processes: failures come back as messages instead of exceptions."""
+    try:
+        return describe(*item), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+def parse_filter(text: str) -> Tuple[str, str, Any]:
+    """
+    Split a filter such as "num_cratons>=10" into (column, operator, value).
+
+    Values are converted to int or float when they parse as numbers, so numeric columns
+    compare numerically.
+
+    Raises:
+        ValueError: If the text has no operator or names an unknown column
+    """
+    for operator in FILTER_OPERATORS:
+        column, found, value = text.partition(operator)
+        if found:
+            column, value = column.strip(), value.strip()
+            _check_column(column)
+            return column, operator, _number(value)
+    raise ValueError(f"Filter {text!r} needs one of the operators {', '.join(FILTER_OPERATORS)}")
+
+
+def _number(value: str) -> Union[int, float, str]:
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _check_column(column: str):
+    if column not in COLUMNS:
+        raise ValueError(f"Unknown catalog column: {column} (expected one of {', '.join(COLUMNS)})")
@@ -1,11 +1,15 @@
 # generation/models/elevation.py
 from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
 @dataclass
 class ElevationMap:
-    elevation: np.ndarray            # shape (num_vertices,) or (num_faces,)
+    elevation: np.ndarray            # shape (num_vertices,) or (num_faces,), meters relative to sea level
+    sea_level: float = 0.0           # elevation of the ocean surface, meters
 
 @dataclass
 class DrainageMap:
-    flow: np.ndarray                 # optional water flow vector or volume
+    flow: Optional[np.ndarray] = None              # accumulated upstream flow per face, shape (num_faces,)
+    receivers: Optional[np.ndarray] = None         # downstream face per face (self for outlets), shape (num_faces,)
+    filled_elevation: Optional[np.ndarray] = None  # depression-filled elevation, shape (num_faces,)
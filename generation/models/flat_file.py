@@ -0,0 +1,246 @@
+# generation/models/flat_file.py
+# Memory-mappable flat binary planet files
+
+"""
+A flat planet file is a small JSON header followed by raw little-endian arrays, each
+starting on a 64-byte boundary:
+
+    b"PLANETMM" | uint64 header length | JSON header | padding | array 0 | padding | array 1 ...
+
+The header lists every array's path (same names as the HDF5 format, e.g. "mesh/faces"),
+dtype, shape and offset from the start of the data section, plus core attributes, layer
+provenance and string columns. Opening a file maps it with np.memmap and wraps each array
+as a view of the mapping: no copies and no parsing beyond the header, so any number of
+processes can share one planet's pages through the OS page cache.
+
+Layers go through the same generation.models.planet_layers registry as the HDF5 format,
+so both formats always hold the same data. Flat files are never compressed or chunked.
+"""
+
+from dataclasses import replace
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+import h5py
+import numpy as np
+
+from generation.models.planet_file import PlanetFile
+from generation.models.planet_layers import LAYERS, write_layers
+from generation.models.preview import write_preview
+from generation.models.storage import StorageLayout
+from generation.models.tiles import write_tile_index
+
+MAGIC = b"PLANETMM"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _json_value(value: Any) -> Any:
+    """Attribute values come from numpy/h5py; store them as plain JSON types."""
+    return value.item() if hasattr(value, "item") else value
+
+
+class _StringColumn:
+    """Stands in for an h5py string dataset: supports .asstr()[()] and .shape."""
+
+    def __init__(self, values: List[str]):
+        self.values = list(values)
+        self.shape = (len(self.values),)
+
+    def asstr(self) -> "_StringColumn":
+        return self
+
+    def __getitem__(self, key):
+        return list(self.values) if key == () else self.values[key]
+
+
+class _Group:
+    """
+    Minimal in-memory stand-in for an h5py group, so the layer readers and writers in
+    planet_layers work unchanged on flat files. Paths may contain "/".
+    """
+
+    def __init__(self):
+        self.attrs: Dict[str, Any] = {}
+        self.children: Dict[str, Any] = {}
+
+    def _walk(self, path: str):
+        parts = path.strip("/").split("/")
+        node = self
+        for part in parts[:-1]:
+            node = node.children[part]
+            if not isinstance(node, _Group):
+                raise KeyError(path)
+        return node, parts[-1]
+
+    def __getitem__(self, path: str):
+        node, name = self._walk(path)
+        return node.children[name]
+
+    def __contains__(self, path: str) -> bool:
+        try:
+            self[path]
+            return True
+        except KeyError:
+            return False
+
+    def __delitem__(self, path: str):
+        node, name = self._walk(path)
+        del node.children[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.children)
+
+    def __len__(self) -> int:
+        return len(self.children)
+
+    def create_group(self, name: str) -> "_Group":
+        group = _Group()
+        self.children[name] = group
+        return group
+
+    def create_dataset(self, name: str, data=None, dtype=None, **_layout):
+        if dtype is not None and h5py.check_string_dtype(np.dtype(dtype)) is not None:
+            self.children[name] = _StringColumn(data)
+        else:
+            self.children[name] = np.asarray(data)
+        return self.children[name]
+
+    def items(self, prefix: str = ""):
+        """Yield (path, node) for every descendant, depth first."""
+        for name, child in self.children.items():
+            path = f"{prefix}{name}"
+            yield path, child
+            if isinstance(child, _Group):
+                yield from child.items(f"{path}/")
+
+    def close(self):
+        self.children = {}
+
+
+def save_flat(planet, path: Union[str, Path], store_topology: bool = True, store_vertices: bool = True,
+              quantize: bool = False, tile_level: Optional[int] = None, preview_level: Optional[int] = None,
+              thumbnail_width: int = 0):
+    """
+    Write a planet as a memory-mappable flat binary file.
+
+    Args:
+        planet (Planet): Planet to serialize
+        path (Union[str, Path]): Output file path
+        store_topology (bool): Store faces and adjacency of generated meshes
+        store_vertices (bool): Store vertices and face centers of generated meshes
+        quantize (bool): Store quantizable layer fields as integer codes
+        tile_level (Optional[int]): Write a tile index for PlanetFile.read_region; None omits it
+        preview_level (Optional[int]): Embed a coarse preview of this subdivision level; None omits it
+        thumbnail_width (int): Width of the preview's thumbnail image; 0 for none
+    """
+    root = _Group()
+    layout = replace(StorageLayout.uncompressed(), store_topology=store_topology, store_vertices=store_vertices,
+                     quantize=quantize)
+    if preview_level is not None:
+        write_preview(root, planet, preview_level, thumbnail_width, layout)
+    if tile_level is not None:
+        # Arrays are mapped, so any face range is read on its own; only the index is needed
+        write_tile_index(root, planet, tile_level)
+    write_layers(root, planet, LAYERS, layout)
+
+    arrays, strings, groups = {}, {}, {}
+    blobs: List[np.ndarray] = []
+    cursor = 0
+    for name, node in root.items():
+        if isinstance(node, _Group):
+            groups[name] = {key: _json_value(value) for key, value in node.attrs.items()}
+        elif isinstance(node, _StringColumn):
+            strings[name] = node.values
+        else:
+            array = np.ascontiguousarray(node, dtype=node.dtype.newbyteorder("<"))
+            arrays[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": cursor}
+            blobs.append(array)
+            cursor = _aligned(cursor + array.nbytes)
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "attrs": {"radius": planet.radius, "subdivision_level": planet.subdivision_level, "seed": planet.seed},
+        "groups": groups,
+        "arrays": arrays,
+        "strings": strings,
+    }).encode("utf-8")
+
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).astype("<u8").tobytes())
+        f.write(header)
+        for blob, entry in zip(blobs, arrays.values()):
+            f.seek(data_start + entry["offset"])
+            f.write(blob.tobytes())
+        # Make sure the file covers the padding after the last array
+        f.truncate(data_start + cursor)
+
+
+def is_flat_file(path: Union[str, Path]) -> bool:
+    """Whether `path` is a flat binary planet file (checked by its magic bytes)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _map(path: Path) -> _Group:
+    """Memory-map a flat file and rebuild its group tree around zero-copy array views."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a flat planet file: {path}")
+        header_length = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    if header["version"] > FORMAT_VERSION:
+        raise ValueError(f"Flat planet file version {header['version']} is newer than supported ({FORMAT_VERSION})")
+
+    data_start = _aligned(len(MAGIC) + 8 + header_length)
+    mapping = np.memmap(path, dtype=np.uint8, mode="r")
+
+    root = _Group()
+    root.attrs.update(header["attrs"])
+    for name, attrs in header["groups"].items():
+        node, leaf = root._walk(name)
+        node.create_group(leaf).attrs.update(attrs)
+    for name, entry in header["arrays"].items():
+        dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+        node, leaf = root._walk(name)
+        if int(np.prod(shape)) == 0:
+            node.children[leaf] = np.empty(shape, dtype=dtype)
+        else:
+            node.children[leaf] = np.ndarray(shape, dtype=dtype, buffer=mapping,
+                                             offset=data_start + entry["offset"])
+    for name, values in header["strings"].items():
+        node, leaf = root._walk(name)
+        node.children[leaf] = _StringColumn(values)
+    return root
+
+
+class FlatPlanetFile(PlanetFile):
+    """
+    PlanetFile over a memory-mapped flat file. Arrays handed out (by read() or inside the
+    loaded layers) are read-only views of the mapping, valid for as long as they are referenced.
+    """
+
+    def _open(self, path: Path) -> _Group:
+        return _map(path)
+
+
+def open_flat(path: Union[str, Path]) -> FlatPlanetFile:
+    """
+    Open a flat binary planet file with every array memory-mapped.
+
+    Args:
+        path (Union[str, Path]): File written by save_flat
+
+    Returns:
+        FlatPlanetFile: Lazy planet view; use as a context manager or call close()
+    """
+    return FlatPlanetFile(path)
@@ -0,0 +1,168 @@
+# generation/models/layer_store.py
+# Declarative storage for layers made of per-face / per-vertex arrays
+
+"""
+Most planet layers (PlateMap, ElevationMap, DrainageMap, ClimateData, BiomeMap, PoliticalMap,
+RegionLayer) are dataclasses of numpy arrays indexed by face, plus a few scalars. Instead of
+hand-written HDF5 code per layer, each one declares an ArraySchema:
+
+    ArraySchema(ClimateData, fields=(
+        FieldSpec("temperature", "float64", units="°C"),
+        FieldSpec("precipitation", "float64", units="mm/yr"),
+    ))
+
+and gets a writer and a reader for planet_layers.LAYERS from it. Each field becomes one
+dataset named after the dataclass attribute, cast to the declared dtype and laid out with
+the StorageLayout class it names; scalar attributes become group attributes. The group's
+"fields" attribute records every stored field's dtype, domain and units as JSON, which is
+what PlanetFile.fields() lists for tools such as the mesh viewer.
+
+Fields may also declare a Quantization (models/quantization.py). When the StorageLayout has
+`quantize` enabled those fields are stored as int16/uint16/uint8 codes and their "fields"
+entry gains an "encoding" dict with the decode parameters; read() and PlanetFile.read()
+dequantize transparently, while PlanetFile.read_raw() returns the codes as stored.
+
+A new stage's layer therefore needs a dataclass, a schema and one LAYERS entry.
+"""
+
+from dataclasses import dataclass, fields as dataclass_fields, is_dataclass
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+import h5py
+import numpy as np
+
+from generation.models.quantization import Quantization, decode, encode
+from generation.models.storage import StorageLayout, read_strings, write_dataset, write_strings
+
+DOMAINS = ("face", "vertex", "other")
+FIELDS_ATTR = "fields"
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    name: str                       # dataclass attribute, also the dataset name
+    dtype: Optional[str] = None     # storage dtype; None keeps the array's own dtype
+    domain: str = "face"            # "face" or "vertex" rows, or "other" (edges, regions, ...)
+    units: str = ""
+    optional: bool = False          # the attribute may be None, in which case nothing is stored
+    dataset_class: str = "layers"   # StorageLayout class: "topology", "geometry" or "layers"
+    quantization: Optional[Quantization] = None     # compact encoding used when the layout quantizes
+
+    def __post_init__(self):
+        if self.domain not in DOMAINS:
+            raise ValueError(f"Unknown field domain: {self.domain} (expected one of {', '.join(DOMAINS)})")
+
+    def info(self, data: np.ndarray) -> Dict[str, Any]:
+        """Metadata recorded in the group's "fields" attribute for a stored array."""
+        return {"dtype": data.dtype.str, "domain": self.domain, "units": self.units, "shape": list(data.shape)}
+
+
+@dataclass(frozen=True)
+class ArraySchema:
+    cls: type                           # layer dataclass
+    fields: Tuple[FieldSpec, ...]       # array attributes
+    attrs: Tuple[str, ...] = ()         # scalar attributes, stored as group attributes
+    strings: Tuple[str, ...] = ()       # Optional[List[str]] attributes, stored as string columns
+
+    def write(self, group: h5py.Group, value: Any, layout: StorageLayout):
+        """Store every array field, scalar attribute and string column of `value` in `group`."""
+        info = {}
+        for spec in self.fields:
+            array = getattr(value, spec.name)
+            if array is None:
+                if not spec.optional:
+                    raise ValueError(f"{self.cls.__name__}.{spec.name} is required")
+                continue
+            data = np.asarray(array, dtype=spec.dtype)
+            encoded = encode(data, spec.quantization, layout.quantize_anchor) if layout.quantize and spec.quantization else None
+            if encoded is not None:
+                data, encoding = encoded
+            write_dataset(group, spec.name, data, getattr(layout, spec.dataset_class))
+            info[spec.name] = spec.info(data)
+            if encoded is not None:
+                info[spec.name]["encoding"] = encoding
+        for name in self.attrs:
+            group.attrs[name] = getattr(value, name)
+        for name in self.strings:
+            strings = getattr(value, name)
+            if strings is not None:
+                write_strings(group, name, strings)
+        group.attrs[FIELDS_ATTR] = json.dumps(info)
+
+    def read(self, group: h5py.Group) -> Any:
+        """Rebuild the layer dataclass from a group written by write()."""
+        kwargs = {}
+        info = field_info(group)
+        for spec in self.fields:
+            if spec.name in group:
+                kwargs[spec.name] = dequantize(group[spec.name][()], info.get(spec.name, {}))
+            elif spec.optional:
+                kwargs[spec.name] = None
+            else:
+                raise KeyError(f"{self.cls.__name__} group is missing required field {spec.name!r}")
+        for name in self.attrs:
+            if name in group.attrs:
+                kwargs[name] = attr_value(group.attrs[name])
+        for name in self.strings:
+            kwargs[name] = read_strings(group, name) if name in group else None
+        return self.cls(**kwargs)
+
+
+def attr_value(value: Any) -> Any:
+    """Attribute values come back as numpy scalars; return plain Python values."""
+    return value.item() if hasattr(value, "item") else value
+
+
+def field_info(group: h5py.Group) -> Dict[str, Dict[str, Any]]:
+    """Return the "fields" metadata of a group written by an ArraySchema ({} for other groups)."""
+    raw = group.attrs.get(FIELDS_ATTR)
+    return json.loads(raw) if raw is not None else {}
+
+
+def dequantize(data: np.ndarray, info: Dict[str, Any]) -> np.ndarray:
+    """Decode stored rows using a field's "fields" entry; unencoded fields pass through."""
+    encoding = info.get("encoding")
+    return decode(data, encoding) if encoding else data
+
+
+def iter_field_groups(group: h5py.Group, prefix: str = "") -> Iterable[Tuple[str, h5py.Group]]:
+    """Yield (path, group) for `group`'s descendants that carry field metadata, depth first."""
+    for name in group:
+        child = group[name]
+        # h5py groups and flat-file groups both create subgroups; datasets do not
+        if not callable(getattr(child, "create_group", None)):
+            continue
+        path = f"{prefix}{name}"
+        if FIELDS_ATTR in child.attrs:
+            yield path, child
+        yield from iter_field_groups(child, f"{path}/")
+
+
+def nbytes(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Bytes of array data held by a layer value (dataclasses, lists and dicts are walked).
+
+    Arrays reachable more than once are counted once; memory-mapped or shared buffers are
+    counted at their full view size.
+
+    Args:
+        value (Any): A planet layer, e.g. MeshData, a list of Plates or a RegionMap
+
+    Returns:
+        int: Total ndarray bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(nbytes(item, seen) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(nbytes(item, seen) for item in value)
+    if is_dataclass(value):
+        return sum(nbytes(getattr(value, f.name), seen) for f in dataclass_fields(value))
+    if hasattr(value, "__dict__"):
+        return nbytes(vars(value), seen)
+    return 0
@@ -1,15 +1,322 @@
 # generation/models/mesh.py
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import chain
+import hashlib
 import numpy as np
-from typing import Dict, List, Optional
+import scipy.sparse as sp
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from typing import Tuple
 
+
+class CSRAdjacency(Mapping):
+    """
+    Read-only face -> neighbors mapping backed by CSR arrays.
+
+    Behaves like the Dict[int, List[int]] adjacency built by mesh generation, but holds
+    only the (indptr, indices) arrays, so wrapping arrays read from a file is O(1) and
+    MeshData.adjacency_csr() returns them without conversion.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+
+    @staticmethod
+    def from_lengths(lengths: np.ndarray, flat: np.ndarray) -> "CSRAdjacency":
+        """Wrap the legacy ragged layout (neighbor count per face + concatenated neighbors)."""
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return CSRAdjacency(indptr, flat)
+
+    def __getitem__(self, face: int) -> List[int]:
+        if not 0 <= face < len(self.indptr) - 1:
+            raise KeyError(face)
+        return self.indices[self.indptr[face]:self.indptr[face + 1]].tolist()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.indptr) - 1))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
 @dataclass
 class MeshData:
     vertices: np.ndarray              # shape (N, 3)
     faces: np.ndarray                 # shape (M, 3)
-    adjacency: Dict[int, List[int]]  # face index -> neighboring face indices
+    adjacency: Mapping[int, List[int]]  # face index -> neighboring face indices (dict or CSRAdjacency)
     face_ids: Optional[np.ndarray] = None  # optional face IDs
     face_centers: Optional[np.ndarray] = None  # optional face centroids, shape (M, 3)
+    # Attributes of the deterministic generator that built this mesh (see models/icosphere.py);
+    # None for meshes that cannot be rebuilt and must always be stored
+    generator: Optional[Dict[str, Any]] = None
+
+    # Derived arrays (CSR adjacency, edge table, ...) memoized per mesh instance
+    _derived: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached(self, key: str, builder: Callable[[], Any]) -> Any:
+        """
+        Return a derived value for this mesh, building it on first request.
+
+        Args:
+            key (str): Cache key naming the derived value
+            builder (Callable[[], Any]): Zero-argument function that computes the value
+
+        Returns:
+            Any: The cached (or freshly built) value
+        """
+        if key not in self._derived:
+            self._derived[key] = builder()
+        return self._derived[key]
+
+    def fingerprint(self) -> str:
+        """
+        Return a digest of the mesh geometry and topology.
+
+        Meshes with equal fingerprints are interchangeable, so derived data keyed by the
+        fingerprint (e.g. climate operators) can be shared across planets and seeds.
+
+        Returns:
+            str: Hex digest of the vertex and face arrays
+        """
+        def build():
+            digest = hashlib.blake2b(digest_size=16)
+            for array in (self.vertices, self.faces):
+                array = np.ascontiguousarray(array)
+                digest.update(f"{array.dtype.str}{array.shape}".encode())
+                digest.update(array.tobytes())
+            return digest.hexdigest()
+        return self.cached("fingerprint", build)
+
+    def adjacency_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return face adjacency as CSR arrays.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (indptr, indices) where the neighbors of face i
+            are indices[indptr[i]:indptr[i + 1]]
+        """
+        if isinstance(self.adjacency, CSRAdjacency):
+            return self.adjacency.indptr, self.adjacency.indices
+        return self.cached("adjacency_csr", lambda: adjacency_to_csr(self.adjacency, len(self.faces)))
+
+    def edge_pairs(self) -> np.ndarray:
+        """
+        Return each undirected face-face edge exactly once.
+
+        Returns:
+            np.ndarray: Array of shape (E, 2) with face_a < face_b in every row
+        """
+        return self.cached("edge_pairs", lambda: csr_edge_pairs(*self.adjacency_csr()))
+
+    def neighbor_mean_operator(self) -> sp.csr_matrix:
+        """
+        Return the row-normalized face adjacency matrix A, so (A @ x)[i] is the mean of x
+        over the neighbors of face i. Used for smoothing and diffusion passes.
+
+        Returns:
+            sp.csr_matrix: Sparse (M, M) operator
+        """
+        def build():
+            indptr, indices = self.adjacency_csr()
+            counts = np.diff(indptr)
+            weights = np.repeat(1.0 / np.maximum(counts, 1), counts)
+            return sp.csr_matrix((weights, indices, indptr), shape=(len(counts), len(counts)))
+        return self.cached("neighbor_mean_operator", build)
+
+    def centers(self) -> np.ndarray:
+        """
+        Return face centroids, computing them from the vertices if they were not stored.
+
+        Returns:
+            np.ndarray: Array of shape (M, 3)
+        """
+        if self.face_centers is not None:
+            return self.face_centers
+        return self.cached("face_centers", lambda: self.vertices[self.faces].mean(axis=1))
+
+    def is_icosphere(self) -> bool:
+        """
+        Whether this mesh was built by the icosphere generator, so face i of each level
+        subdivides into faces 4i..4i+3 of the next. A matching face count is not enough:
+        other meshes may have 20 * 4^L faces numbered differently.
+        """
+        from generation.models.icosphere import GENERATOR
+
+        return self.generator is not None and self.generator.get("generator") == GENERATOR
+
+    def base_tiles(self) -> np.ndarray:
+        """
+        Return the base-icosahedron face each face descends from.
+
+        Icosphere subdivision replaces face i with faces 4i..4i+3, so the 20 base faces
+        partition the mesh into contiguous index ranges of equal size.
+
+        Returns:
+            np.ndarray: Tile index (0-19) per face
+
+        Raises:
+            ValueError: If the mesh was not built by the icosphere generator
+        """
+        if not self.is_icosphere():
+            raise ValueError("Base tiles are only defined for icosphere meshes")
+        num_faces = len(self.faces)
+        return np.arange(num_faces) // (num_faces // 20)
+
+    def face_areas(self) -> np.ndarray:
+        """
+        Return the planar area of each triangular face, in squared mesh units.
+
+        Returns:
+            np.ndarray: Array of shape (M,)
+        """
+        def build():
+            a, b, c = (self.vertices[self.faces[:, k]] for k in range(3))
+            return 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+        return self.cached("face_areas", build)
+
+
+def adjacency_to_csr(adjacency: Dict[int, List[int]], num_faces: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a face adjacency mapping into CSR (indptr, indices) arrays.
+
+    Args:
+        adjacency (Dict[int, List[int]]): Face index -> neighboring face indices
+        num_faces (int): Total number of faces in the mesh
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (indptr, indices) as int64/int32 arrays
+    """
+    faces = np.fromiter(adjacency.keys(), dtype=np.int64, count=len(adjacency))
+    counts = np.fromiter(map(len, adjacency.values()), dtype=np.int64, count=len(adjacency))
+    flat = np.fromiter(chain.from_iterable(adjacency.values()), dtype=np.int32, count=int(counts.sum()))
+
+    lengths = np.zeros(num_faces, dtype=np.int64)
+    lengths[faces] = counts
+    indptr = np.zeros(num_faces + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+
+    # Scatter each face's neighbors into its slot, independent of dict iteration order
+    owner = np.repeat(faces, counts)
+    position = np.arange(len(flat)) - np.repeat(np.cumsum(counts) - counts, counts)
+    indices = np.empty(len(flat), dtype=np.int32)
+    indices[indptr[owner] + position] = flat
+    return indptr, indices
+
+
+def csr_edge_pairs(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Build a deduplicated undirected edge table from CSR adjacency.
+
+    Args:
+        indptr (np.ndarray): CSR row pointer, shape (M + 1,)
+        indices (np.ndarray): CSR neighbor indices
+
+    Returns:
+        np.ndarray: Array of shape (E, 2) with face_a < face_b, sorted by face_a
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+    keep = rows < indices
+    return np.stack([rows[keep], indices[keep]], axis=1).astype(np.int32)
+
+
+def csr_gather(indptr: np.ndarray, indices: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather the neighbors of a batch of faces in one vectorized step.
+
+    Args:
+        indptr (np.ndarray): CSR row pointer
+        indices (np.ndarray): CSR neighbor indices
+        rows (np.ndarray): Face indices whose neighbors are requested
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (sources, neighbors) where sources[k] is the row that
+        neighbors[k] was gathered from
+    """
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    sources = np.repeat(rows, counts)
+    # Offset of each output slot within its own row
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return sources, indices[np.repeat(starts, counts) + offsets]
+
+
+def csr_bfs(indptr: np.ndarray, indices: np.ndarray, sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Multi-source breadth-first search over CSR adjacency, one vectorized frontier per hop.
+
+    Args:
+        indptr (np.ndarray): CSR row pointer
+        indices (np.ndarray): CSR neighbor indices
+        sources (np.ndarray): Starting faces
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Hop distance to the nearest source per face (-1 if
+        unreachable) and the position in `sources` of that nearest source (-1 if unreachable)
+    """
+    num_faces = len(indptr) - 1
+    distance = np.full(num_faces, -1, dtype=np.int32)
+    origin = np.full(num_faces, -1, dtype=np.int64)
+    sources = np.asarray(sources, dtype=np.int64)
+
+    # Duplicate sources keep their first position
+    unique_sources, first = np.unique(sources, return_index=True)
+    distance[unique_sources] = 0
+    origin[unique_sources] = first
+
+    frontier = unique_sources
+    hop = 0
+    while frontier.size:
+        hop += 1
+        parents, neighbors = csr_gather(indptr, indices, frontier)
+        fresh = distance[neighbors] < 0
+        parents, neighbors = parents[fresh], neighbors[fresh]
+        # Ties between parents are broken by the first occurrence
+        frontier, first = np.unique(neighbors, return_index=True)
+        distance[frontier] = hop
+        origin[frontier] = origin[parents[first]]
+    return distance, origin
+
+
+def label_components(num_nodes: int, edges: np.ndarray, labels: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Label connected components with an array-based union-find (hook, then pointer-jump).
+
+    Each round hooks the larger root of every still-split edge onto the smaller one, then
+    compresses all paths by repeated parent[parent]; edges whose ends already share a root
+    drop out, so later rounds only touch the remaining frontier.
+
+    Args:
+        num_nodes (int): Number of nodes (faces)
+        edges (np.ndarray): Undirected edge table, shape (E, 2)
+        labels (Optional[np.ndarray]): Per-node class; when given, only edges joining nodes of
+            the same class connect them
+
+    Returns:
+        np.ndarray: Component id per node, numbered 0..k-1 in order of each component's smallest node
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if labels is not None:
+        edges = edges[labels[edges[:, 0]] == labels[edges[:, 1]]]
+    a, b = edges[:, 0], edges[:, 1]
+
+    parent = np.arange(num_nodes, dtype=np.int64)
+    while a.size:
+        root_a, root_b = parent[a], parent[b]
+        split = root_a != root_b
+        a, b, root_a, root_b = a[split], b[split], root_a[split], root_b[split]
+        if not a.size:
+            break
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        # Pointer jumping until every node points straight at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # Roots are the smallest node of their component, so unique() keeps that order
+    _, component = np.unique(parent, return_inverse=True)
+    return component
@@ -1,10 +1,10 @@
 # generation/models/planet.py
 # Data structure representing a procedurally generated planet
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, is_dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, Optional
 import h5py
-import numpy as np
 
 from generation.models.mesh import MeshData
 from generation.models.tectonics import Craton, Plate, PlateMap
@@ -13,6 +13,13 @@ from generation.models.climate import ClimateData
 from generation.models.biomes import BiomeMap
 from generation.models.regions import RegionMap
 from generation.models.politics import Nation, PoliticalMap
+from generation.models.flat_file import FlatPlanetFile, is_flat_file
+from generation.models.layer_store import nbytes
+from generation.models.planet_file import PlanetFile, PreviewFile
+from generation.models.planet_layers import LAYERS, write_layers
+from generation.models.preview import PREVIEW_GROUP, THUMBNAIL, write_preview
+from generation.models.storage import StorageLayout
+from generation.models.tiles import TILES_GROUP, faces_per_tile, write_tile_index
 
 
 @dataclass
@@ -47,6 +54,45 @@ class Planet:
     political_map: Optional[PoliticalMap] = None
     nations: list[Nation] = field(default_factory=list)
 
+    # Layer name -> {"stage": ..., "params_hash": ...} of the stage run that produced it
+    provenance: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def snapshot(self) -> "Planet":
+        """
+        Return a copy that later changes to this planet's attributes cannot affect.
+
+        Arrays are shared, not copied: stages replace layers rather than writing into them,
+        so the snapshot is cheap and stays consistent while e.g. a background export reads it.
+
+        Returns:
+            Planet: Shallow copy with its own lists, provenance and mesh object
+        """
+        # Layer dataclasses are copied one level deep, so reassigning e.g. elevation.elevation
+        # later does not reach the snapshot. A fresh MeshData also drops its derived-array cache.
+        layers = {name: replace(getattr(self, name)) for name in LAYERS if is_dataclass(getattr(self, name))}
+        return replace(
+            self,
+            **layers,
+            cratons=list(self.cratons),
+            plates=list(self.plates),
+            nations=list(self.nations),
+            provenance={name: dict(attrs) for name, attrs in self.provenance.items()},
+        )
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Return the bytes of array data held by each layer, including cached derived arrays.
+
+        Returns:
+            Dict[str, int]: Layer name -> bytes, for the layers this planet has
+        """
+        usage = {}
+        for name in LAYERS:
+            value = getattr(self, name)
+            if value is not None and not (isinstance(value, list) and not value):
+                usage[name] = nbytes(value)
+        return usage
+
     def summary(self) -> str:
         mesh_info = "✘"
         if self.mesh:
@@ -62,90 +108,90 @@ class Planet:
             f" - Cratons: {len(self.cratons)}\n"
             f" - Plates: {len(self.plates)}\n"
             f" - Elevation: {'✔' if self.elevation is not None else '✘'}\n"
+            f" - Drainage: {'✔' if self.drainage is not None else '✘'}\n"
             f" - Climate: {'✔' if self.climate is not None else '✘'}\n"
             f" - Biomes: {'✔' if self.biomes is not None else '✘'}\n"
+            f" - Regions: {len(self.regions.named_regions) if self.regions is not None else 0}\n"
             f" - Nations: {len(self.nations)}"
         )
 
-    def save(self, path: str):
-        """Save the current planet to a .planetbin HDF5 file."""
-        with h5py.File(path, "w") as f:
-            # Core
-            f.attrs["radius"] = self.radius
-            f.attrs["subdivision_level"] = self.subdivision_level
-            f.attrs["seed"] = self.seed
-
-            # Mesh
-            if self.mesh:
-                mesh_grp = f.create_group("mesh")
-                mesh_grp.create_dataset("vertices", data=self.mesh.vertices)
-                mesh_grp.create_dataset("faces", data=self.mesh.faces)
-                # Convert adjacency dict to ragged array
-                adj = [np.array(v, dtype=np.int32) for v in self.mesh.adjacency.values()]
-                mesh_grp.create_dataset("adjacency_lengths", data=[len(v) for v in adj])
-                mesh_grp.create_dataset("adjacency_flat", data=np.concatenate(adj))
-                # Save face IDs
-                if self.mesh.face_ids is None:
-                    print("Generating face IDs before export...")
-                    self.mesh.face_ids = np.arange(self.mesh.faces.shape[0], dtype=np.int32)
-                mesh_grp.create_dataset("face_ids", data=self.mesh.face_ids)
-                if self.mesh.face_centers is not None:
-                    mesh_grp.create_dataset("face_centers", data=self.mesh.face_centers)
-
-            # Cratons
-            if self.cratons:
-                craton_grp = f.create_group("cratons")
-                for craton in self.cratons:
-                    cgrp = craton_grp.create_group(str(craton.id))
-                    cgrp.attrs["center_index"] = craton.center_index
-                    cgrp.attrs["id"] = craton.id
-                    if craton.name:
-                        cgrp.attrs["name"] = craton.name
-                    if craton.face_ids:
-                        cgrp.create_dataset("face_ids", data=np.array(craton.face_ids, dtype=np.int32))
+    def save(self, path: str, layout: Optional[StorageLayout] = None, layers: Optional[Iterable[str]] = None):
+        """
+        Save the current planet to a .planetbin HDF5 file.
+
+        With `layers`, only those layer groups are written into an existing file (replacing
+        any previous version) and everything else in it is left untouched, so re-running a
+        late stage does not rewrite the mesh. HDF5 does not reclaim the space of replaced
+        groups; `h5repack` compacts a file after many incremental saves.
+
+        Args:
+            path (str): Output file path
+            layout (Optional[StorageLayout]): Chunking and compression per dataset class;
+                defaults to chunked gzip with the shuffle filter
+            layers (Optional[Iterable[str]]): Layer names (see planet_layers.LAYERS) to write
+                incrementally; None rewrites the whole file
+        """
+        layout = layout or StorageLayout()
+        if layers is None:
+            with h5py.File(path, "w") as f:
+                # Core
+                f.attrs["radius"] = self.radius
+                f.attrs["subdivision_level"] = self.subdivision_level
+                f.attrs["seed"] = self.seed
+                if layout.preview_level is not None:
+                    write_preview(f, self, layout.preview_level, layout.thumbnail_width, layout)
+                if layout.tile_level is not None:
+                    write_tile_index(f, self, layout.tile_level)
+                    layout = layout.with_chunk_rows(faces_per_tile(self.subdivision_level, layout.tile_level))
+                write_layers(f, self, LAYERS, layout)
+            return
+
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"Incremental save needs an existing planet file: {path}")
+        with h5py.File(path, "r+") as f:
+            core = (f.attrs["radius"], f.attrs["subdivision_level"], f.attrs["seed"])
+            if core != (self.radius, self.subdivision_level, self.seed):
+                raise ValueError(f"Planet file {path} belongs to a different planet (radius, subdivision, seed = {core})")
+            if TILES_GROUP in f:
+                # Keep replaced layers aligned with the file's existing tiles
+                tile_level = int(f[TILES_GROUP].attrs["tile_level"])
+                layout = layout.with_chunk_rows(faces_per_tile(self.subdivision_level, tile_level))
+            write_layers(f, self, layers, layout)
+            if PREVIEW_GROUP in f:
+                # Refresh the preview at its existing resolution so it matches the new layers
+                preview = f[PREVIEW_GROUP]
+                thumbnail_width = preview[THUMBNAIL].shape[1] if THUMBNAIL in preview else 0
+                write_preview(f, self, int(preview.attrs["subdivision_level"]), thumbnail_width, layout)
+
+    @staticmethod
+    def open(path: str) -> PlanetFile:
+        """
+        Open a .planetbin file lazily; parts of the planet are read on first access.
+
+        Flat binary files (see flat_file.save_flat) are detected by their magic bytes and
+        memory-mapped instead. Use as a context manager or call close() when done.
+        """
+        if is_flat_file(path):
+            return FlatPlanetFile(path)
+        return PlanetFile(path)
+
+    @staticmethod
+    def open_preview(path: str) -> PreviewFile:
+        """
+        Open only the low-resolution preview embedded in a planet file, for instant display
+        or catalog listings. Closing the preview closes the file.
+
+        Raises:
+            ValueError: If the file was saved without a preview
+        """
+        planet_file = Planet.open(path)
+        if planet_file.preview() is None:
+            planet_file.close()
+            raise ValueError(f"{path} has no embedded preview (export preview_level)")
+        return PreviewFile(planet_file, owns_parent=True)
 
     @staticmethod
     def load(path: str) -> "Planet":
         """Load a Planet from a .planetbin HDF5 file."""
-        with h5py.File(path, "r") as f:
-            radius = f.attrs["radius"]
-            subdivision_level = f.attrs["subdivision_level"]
-            seed = f.attrs["seed"]
-
-            mesh = None
-            if "mesh" in f:
-                mesh_grp = f["mesh"]
-                vertices = mesh_grp["vertices"][:]
-                faces = mesh_grp["faces"][:]
-                face_ids = mesh_grp["face_ids"][:] if "face_ids" in mesh_grp else None
-                face_centers = mesh_grp["face_centers"][:] if "face_centers" in mesh_grp else None
-
-                # Reconstruct adjacency dict
-                lengths = mesh_grp["adjacency_lengths"][:]
-                flat = mesh_grp["adjacency_flat"][:]
-                adjacency = {}
-                cursor = 0
-                for i, length in enumerate(lengths):
-                    adjacency[i] = flat[cursor:cursor+length].tolist()
-                    cursor += length
-
-                mesh = MeshData(vertices=vertices, faces=faces, adjacency=adjacency, face_ids=face_ids, face_centers=face_centers)
-
-            cratons = []
-            if "cratons" in f:
-                craton_grp = f["cratons"]
-                for key in craton_grp:
-                    cgrp = craton_grp[key]
-                    center_index = int(cgrp.attrs["center_index"])
-                    craton_id = int(cgrp.attrs["id"])
-                    name = cgrp.attrs.get("name", None)
-                    face_ids = cgrp["face_ids"][:] if "face_ids" in cgrp else None
-                    cratons.append(Craton(center_index=center_index, id=craton_id, face_ids=face_ids, name=name))
-
-            return Planet(
-                radius=radius,
-                subdivision_level=subdivision_level,
-                seed=seed,
-                mesh=mesh,
-                cratons=cratons
-            )
+        with Planet.open(path) as planet_file:
+            return planet_file.load()
@@ -0,0 +1,414 @@
+# generation/models/planet_file.py
+# Lazy, read-only view of a .planetbin file
+
+"""
+PlanetFile keeps the HDF5 handle open and reads each part of the planet only when it is
+first accessed. Core attributes and dataset shapes come from the file's metadata, so
+opening a file and printing its summary never reads array data, whatever the file size.
+
+    with Planet.open("world.planetbin") as planet:
+        print(planet.summary())
+        plates = planet.read("plate_map/face_to_plate", faces=slice(0, 10000))
+        africa = planet.read_region(planet.tiles_for(nation_faces))   # files saved with tile_level
+
+Attributes mirror Planet, so code that only reads a planet (the mesh viewer, overlays) can
+take a PlanetFile in place of a fully loaded Planet. Planet.load is open + load().
+"""
+
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import h5py
+import numpy as np
+
+from generation.models.mesh import MeshData
+from generation.models.layer_store import dequantize, field_info, iter_field_groups, nbytes
+from generation.models.planet_layers import LAYERS, read_provenance
+from generation.models.politics import Nation
+from generation.models.preview import PREVIEW_GROUP, THUMBNAIL
+from generation.models.tectonics import Craton, Plate, PlateMap
+from generation.models.tiles import TILES_GROUP, tiles_for_faces
+
+FaceSelection = Union[slice, np.ndarray, None]
+
+# Mesh datasets a topology-free file may leave out, and where read() finds them instead
+REGENERATED_MESH_DATASETS: Dict[str, Callable[[MeshData], np.ndarray]] = {
+    "mesh/vertices": lambda mesh: mesh.vertices,
+    "mesh/faces": lambda mesh: mesh.faces,
+    "mesh/face_ids": lambda mesh: mesh.face_ids,
+    "mesh/face_centers": lambda mesh: mesh.face_centers,
+    "mesh/adjacency_indptr": lambda mesh: mesh.adjacency_csr()[0],
+    "mesh/adjacency_indices": lambda mesh: mesh.adjacency_csr()[1],
+}
+
+
+class PlanetFile:
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path (Union[str, Path]): The .planetbin file to open read-only.
+        """
+        self.path = Path(path)
+        self._file = self._open(self.path)
+        self._loaded: Dict[str, Any] = {}
+        self.radius = float(self._file.attrs["radius"])
+        self.subdivision_level = int(self._file.attrs["subdivision_level"])
+        self.seed = int(self._file.attrs["seed"])
+
+    def _open(self, path: Path):
+        """Open the underlying file; subclasses for other formats return an h5py.Group look-alike."""
+        return h5py.File(path, "r")
+
+    # === Lifetime ===
+
+    def __enter__(self) -> "PlanetFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the file handle. Parts already read stay available."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    @property
+    def file(self) -> h5py.File:
+        """The open HDF5 handle."""
+        if self._file is None:
+            raise ValueError(f"Planet file is closed: {self.path}")
+        return self._file
+
+    # === Lazy planet attributes ===
+
+    def _get(self, name: str) -> Any:
+        if name not in self._loaded:
+            self._loaded[name] = LAYERS[name].read(self.file[name]) if name in self.file else _default(name)
+        return self._loaded[name]
+
+    @property
+    def provenance(self) -> Dict[str, Dict[str, str]]:
+        """Stage name and params hash recorded for each layer (attributes only)."""
+        if "provenance" not in self._loaded:
+            self._loaded["provenance"] = read_provenance(self.file)
+        return self._loaded["provenance"]
+
+    @property
+    def mesh(self) -> Optional[MeshData]:
+        return self._get("mesh")
+
+    @property
+    def cratons(self) -> List[Craton]:
+        return self._get("cratons")
+
+    @property
+    def plates(self) -> List[Plate]:
+        return self._get("plates")
+
+    @property
+    def plate_map(self) -> Optional[PlateMap]:
+        return self._get("plate_map")
+
+    @property
+    def nations(self) -> List[Nation]:
+        return self._get("nations")
+
+    def __getattr__(self, name: str) -> Any:
+        # Other stored layers (elevation, climate, ...) load on first access; Planet fields
+        # the file format does not store read as their empty defaults
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in LAYERS:
+            return self._get(name)
+        return _default(name)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes of array data held for each layer read so far."""
+        return {name: nbytes(value) for name, value in self._loaded.items() if name in LAYERS}
+
+    # === Direct dataset access ===
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.file or self._regenerated(name)
+
+    def _regenerated(self, name: str) -> bool:
+        """Whether `name` is a mesh dataset this file leaves out and rebuilds from its generator."""
+        return (name in REGENERATED_MESH_DATASETS and name not in self.file
+                and "mesh" in self.file and "generator" in self.file["mesh"].attrs)
+
+    @property
+    def num_faces(self) -> int:
+        """Face count, taken from dataset shapes (or mesh generator attributes) without reading data."""
+        for name in ("mesh/faces", "plate_map/face_to_plate"):
+            if name in self.file:
+                return int(self.file[name].shape[0])
+        if "mesh" in self.file and "subdivision_level" in self.file["mesh"].attrs:
+            return 20 * 4 ** int(self.file["mesh"].attrs["subdivision_level"])
+        return 0
+
+    def read(self, name: str, faces: FaceSelection = None) -> np.ndarray:
+        """
+        Read a dataset, or only some of its rows.
+
+        For per-face datasets (mesh/faces, plate_map/face_to_plate, ...) rows are faces, so
+        `faces` selects a face range; with chunked files only the covering chunks are read.
+        Quantized fields are decoded to their original dtype.
+
+        Args:
+            name (str): Dataset path inside the file, e.g. "plate_map/face_to_plate"
+            faces (FaceSelection): Row slice, sorted row indices, or None for everything
+
+        Returns:
+            np.ndarray: The selected rows
+        """
+        return dequantize(self.read_raw(name, faces), self.field(name))
+
+    def read_raw(self, name: str, faces: FaceSelection = None) -> np.ndarray:
+        """
+        Read rows exactly as stored, without decoding quantized fields.
+
+        Meant for uploading compact codes straight to the GPU; field(name)["encoding"] holds
+        the scale/offset (or ID offset) needed to decode them there.
+
+        Args:
+            name (str): Dataset path inside the file
+            faces (FaceSelection): Row slice, sorted row indices, or None for everything
+
+        Returns:
+            np.ndarray: The selected rows in their storage dtype
+        """
+        if self._regenerated(name):
+            # Topology-free file: take the rows from the rebuilt mesh
+            dataset = REGENERATED_MESH_DATASETS[name](self.mesh)
+        else:
+            dataset = self.file[name]
+        if faces is None:
+            return dataset[()]
+        if isinstance(faces, slice):
+            return dataset[faces]
+        # h5py fancy indexing wants strictly increasing indices
+        faces = np.asarray(faces)
+        order, inverse = np.unique(faces, return_inverse=True)
+        return dataset[order][inverse]
+
+    def field(self, name: str) -> Dict[str, Any]:
+        """
+        Return one dataset's "fields" metadata (dtype, domain, units, shape and, for quantized
+        fields, "encoding"), or {} for datasets outside schema-based layers.
+        """
+        parent, _, leaf = name.rpartition("/")
+        if not parent or parent not in self.file:
+            return {}
+        return field_info(self.file[parent]).get(leaf, {})
+
+    @property
+    def tile_index(self) -> Optional[np.ndarray]:
+        """(T, 2) [first_face, end_face) range of every tile, or None if the file was saved untiled."""
+        if TILES_GROUP not in self.file:
+            return None
+        if TILES_GROUP not in self._loaded:
+            self._loaded[TILES_GROUP] = self.file[TILES_GROUP]["face_ranges"][()]
+        return self._loaded[TILES_GROUP]
+
+    def tiles_for(self, faces: Iterable[int]) -> np.ndarray:
+        """Sorted IDs of the tiles that contain the given faces (e.g. one nation's territory)."""
+        return tiles_for_faces(self._require_tiles(), faces)
+
+    def read_region(self, tile_ids: Iterable[int], names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Read per-face datasets for a set of tiles only.
+
+        Each tile is one contiguous face range stored in its own chunks, so only those chunks
+        are read and decompressed.
+
+        Args:
+            tile_ids (Iterable[int]): Tiles to read, see tile_index / tiles_for
+            names (Optional[Iterable[str]]): Per-face dataset paths (e.g. "mesh/faces");
+                defaults to every face field listed by fields("face")
+
+        Returns:
+            Dict[str, np.ndarray]: "face_ids" (the faces covered, in tile order) plus the rows of
+            each dataset for those faces
+
+        Raises:
+            ValueError: If the file has no tile index or a tile ID is out of range
+        """
+        ranges = self._require_tiles()
+        tile_ids = np.asarray(list(tile_ids), dtype=np.int64)
+        if tile_ids.size and (tile_ids.min() < 0 or tile_ids.max() >= len(ranges)):
+            raise ValueError(f"Tile IDs must be between 0 and {len(ranges) - 1}")
+        names = list(self.fields("face")) if names is None else list(names)
+
+        slices = [slice(int(start), int(end)) for start, end in ranges[tile_ids]]
+        if not slices:
+            slices = [slice(0, 0)]
+        region = {"face_ids": np.concatenate([np.arange(s.start, s.stop, dtype=np.int64) for s in slices])}
+        for name in names:
+            region[name] = np.concatenate([self.read(name, faces=s) for s in slices])
+        return region
+
+    def _require_tiles(self) -> np.ndarray:
+        ranges = self.tile_index
+        if ranges is None:
+            raise ValueError(f"{self.path} was saved without a tile layout (export tile_level)")
+        return ranges
+
+    # === Preview ===
+
+    def preview(self) -> Optional["PreviewFile"]:
+        """
+        Open the embedded low-resolution preview, if the file has one.
+
+        The preview is a planet of its own (coarse mesh plus aggregated plate, elevation,
+        climate, biome and nation fields) read through this file's handle; it reads nothing
+        from the full-resolution layers.
+
+        Returns:
+            Optional[PreviewFile]: Lazy view of the preview, or None for files without one
+        """
+        return PreviewFile(self) if PREVIEW_GROUP in self.file else None
+
+    @property
+    def thumbnail(self) -> Optional[np.ndarray]:
+        """Equirectangular RGB thumbnail (uint8, height x width x 3) stored with the preview, or None."""
+        path = f"{PREVIEW_GROUP}/{THUMBNAIL}"
+        return self.file[path][()] if path in self.file else None
+
+    def fields(self, domain: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        List the stored array fields of every schema-based layer, from metadata only.
+
+        Args:
+            domain (Optional[str]): Only fields of this domain ("face", "vertex" or "other")
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Dataset path (e.g. "climate/temperature") -> its dtype,
+            domain, units and shape; paths can be passed to read()
+        """
+        found = {}
+        for path, group in iter_field_groups(self.file):
+            if path.startswith(f"{PREVIEW_GROUP}/"):
+                continue
+            for name, info in field_info(group).items():
+                if domain is None or info["domain"] == domain:
+                    found[f"{path}/{name}"] = info
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Headline numbers of the planet, from attributes and dataset shapes only (used by the
+        planet catalog, see models/catalog.py).
+
+        Returns:
+            Dict[str, Any]: Core attributes, face and entity counts, sea level (None without
+            an elevation layer) and the names of the stored layers
+        """
+        f = self.file
+        stored = set(f)
+        sea_level = None
+        if "elevation" in stored:
+            elevation_attrs = f["elevation"].attrs
+            if "sea_level" in elevation_attrs:
+                sea_level = float(elevation_attrs["sea_level"])
+        return {
+            "radius": self.radius,
+            "subdivision_level": self.subdivision_level,
+            "seed": self.seed,
+            "num_faces": self.num_faces,
+            "num_cratons": _entity_count(f, "cratons", "id"),
+            "num_plates": _entity_count(f, "plates", "id"),
+            "num_nations": _entity_count(f, "nations", "capital"),
+            "num_regions": _entity_count(f, "regions", "region_names"),
+            "sea_level": sea_level,
+            "layers": [name for name in LAYERS if name in stored],
+        }
+
+    def summary(self) -> str:
+        """Planet.summary() computed from attributes and dataset shapes only."""
+        f = self.file
+        mesh_info = "✘"
+        if "mesh" in f:
+            mesh = f["mesh"]
+            if "faces" in mesh:
+                face_ids = '✔' if "face_ids" in mesh else '✘'
+                adjacency = '✔' if "adjacency_indptr" in mesh or "adjacency_flat" in mesh else '✘'
+                mesh_info = f"✔ ({mesh['faces'].shape[0]} faces, face_ids: {face_ids}, adjacency: {adjacency})"
+            else:
+                mesh_info = f"✔ ({self.num_faces} faces, rebuilt from {mesh.attrs['generator']} generator)"
+
+        return (
+            f"Planet(radius={self.radius}, subdivision_level={self.subdivision_level}, seed={self.seed})\n"
+            f" - File: {self.path}\n"
+            f" - Mesh: {mesh_info}\n"
+            f" - Cratons: {_entity_count(f, 'cratons', 'id')}\n"
+            f" - Plates: {_entity_count(f, 'plates', 'id')}\n"
+            f" - Plate map: {'✔' if 'plate_map' in f else '✘'}\n"
+            f" - Elevation: {'✔' if 'elevation' in f else '✘'}\n"
+            f" - Drainage: {'✔' if 'drainage' in f else '✘'}\n"
+            f" - Climate: {'✔' if 'climate' in f else '✘'}\n"
+            f" - Biomes: {'✔' if 'biomes' in f else '✘'}\n"
+            f" - Regions: {_entity_count(f, 'regions', 'region_names')}\n"
+            f" - Nations: {_entity_count(f, 'nations', 'capital')}"
+            + (f"\n - Preview: level {f[PREVIEW_GROUP].attrs['subdivision_level']}" if PREVIEW_GROUP in f else "")
+        )
+
+    def load(self):
+        """
+        Read everything into a regular in-memory Planet.
+
+        Returns:
+            Planet: The fully loaded planet
+        """
+        from generation.models.planet import Planet
+
+        return Planet(
+            radius=self.radius,
+            subdivision_level=self.subdivision_level,
+            seed=self.seed,
+            provenance=self.provenance,
+            **{name: self._get(name) for name in LAYERS},
+        )
+
+
+class PreviewFile(PlanetFile):
+    """
+    PlanetFile over the "preview" group of another planet file. Closing it leaves the
+    parent open unless it was opened by Planet.open_preview, which hands over ownership.
+    """
+
+    def __init__(self, parent: PlanetFile, owns_parent: bool = False):
+        self._parent = parent
+        self._owns_parent = owns_parent
+        super().__init__(parent.path)
+
+    def _open(self, path: Path):
+        return self._parent.file[PREVIEW_GROUP]
+
+    def close(self):
+        self._file = None
+        if self._owns_parent:
+            self._parent.close()
+
+
+def _entity_count(f: h5py.File, name: str, column: str) -> int:
+    """Number of entities in a columnar collection, from the shape of one column."""
+    if name not in f:
+        return 0
+    group = f[name]
+    # Legacy craton files hold one subgroup per entity
+    return int(group[column].shape[0]) if column in group else len(group)
+
+
+def _default(name: str) -> Any:
+    """Return the value a Planet field has when the file does not store it."""
+    from generation.models.planet import Planet
+
+    for f in fields(Planet):
+        if f.name == name:
+            return f.default_factory() if f.default_factory is not MISSING else f.default
+    raise AttributeError(f"Planet has no attribute {name!r}")
@@ -0,0 +1,313 @@
+# generation/models/planet_layers.py
+# Per-layer readers and writers for the .planetbin format
+
+"""
+A .planetbin file holds core attributes (radius, subdivision_level, seed) plus one HDF5
+group per stored Planet attribute ("layer"). Each layer has a writer and a reader here,
+registered in LAYERS; Planet.save and PlanetFile go through the registry, so a layer can
+be written or replaced on its own without touching the others.
+
+Layers made of per-face arrays (plate map, elevation, drainage, climate, biomes, political
+map, region layers) are declared as layer_store.ArraySchema entries rather than coded by hand.
+
+Each layer group also carries its provenance as attributes: the pipeline stage that
+produced it and a hash of that stage's resolved parameters.
+"""
+
+from dataclasses import dataclass, replace
+import json
+from typing import Any, Callable, Dict, Iterable, List
+import h5py
+import numpy as np
+
+from generation.models.biomes import BiomeMap
+from generation.models.climate import ClimateData
+from generation.models.elevation import DrainageMap, ElevationMap
+from generation.models.icosphere import regenerate_mesh
+from generation.models.layer_store import ArraySchema, FieldSpec, attr_value
+from generation.models.mesh import CSRAdjacency, MeshData
+from generation.models.politics import Nation, PoliticalMap
+from generation.models.quantization import (
+    CATEGORICAL_UINT8, CATEGORICAL_UINT16, ELEVATION_INT16, LINEAR_INT16, LINEAR_UINT16,
+)
+from generation.models.regions import RegionLayer, RegionMap
+from generation.models.storage import (
+    StorageLayout, read_ragged, read_strings, write_dataset, write_ragged, write_strings,
+)
+from generation.models.tectonics import Craton, Plate, PlateMap
+
+PROVENANCE_ATTRS = ("stage", "params_hash")
+
+
+# === Array layer schemas ===
+
+PLATE_MAP_SCHEMA = ArraySchema(PlateMap, fields=(
+    FieldSpec("face_to_plate", "int32", quantization=CATEGORICAL_UINT8),
+    FieldSpec("claim_order", "int32", optional=True, quantization=CATEGORICAL_UINT16),
+    FieldSpec("boundary_edges", "int32", domain="other", optional=True),
+    FieldSpec("boundary_types", "int8", domain="other", optional=True),
+    FieldSpec("boundary_convergence", "float64", domain="other", optional=True),
+))
+
+ELEVATION_SCHEMA = ArraySchema(ElevationMap, fields=(
+    FieldSpec("elevation", "float64", units="m", quantization=ELEVATION_INT16),
+), attrs=("sea_level",))
+
+DRAINAGE_SCHEMA = ArraySchema(DrainageMap, fields=(
+    FieldSpec("flow", "float64", units="km²", optional=True),
+    FieldSpec("receivers", "int32", optional=True),
+    FieldSpec("filled_elevation", "float64", units="m", optional=True, quantization=ELEVATION_INT16),
+))
+
+CLIMATE_SCHEMA = ArraySchema(ClimateData, fields=(
+    FieldSpec("temperature", "float64", units="°C", quantization=LINEAR_INT16),
+    FieldSpec("precipitation", "float64", units="mm/yr", quantization=LINEAR_UINT16),
+))
+
+BIOMES_SCHEMA = ArraySchema(BiomeMap, fields=(
+    FieldSpec("biome_ids", "int16", quantization=CATEGORICAL_UINT8),
+), strings=("names",))
+
+POLITICAL_MAP_SCHEMA = ArraySchema(PoliticalMap, fields=(
+    FieldSpec("face_to_nation", "int32", quantization=CATEGORICAL_UINT16),
+    FieldSpec("travel_cost", "float64", units="weighted km", optional=True),
+))
+
+REGION_LAYER_SCHEMA = ArraySchema(RegionLayer, fields=(
+    FieldSpec("face_to_region", "int32", quantization=CATEGORICAL_UINT16),
+    FieldSpec("region_class", domain="other"),
+    FieldSpec("face_counts", "int64", domain="other"),
+    FieldSpec("areas", "float64", domain="other", units="km²"),
+    FieldSpec("centroids", "float64", domain="other", units="km"),
+))
+
+
+# === Writers ===
+
+def write_mesh(group: h5py.Group, mesh: MeshData, layout: StorageLayout):
+    # Generated meshes record how to rebuild themselves; their arrays are then optional
+    generated = mesh.generator is not None
+    if generated:
+        group.attrs.update(mesh.generator)
+    store_vertices = layout.store_vertices or not generated
+    store_topology = layout.store_topology or not generated
+
+    if store_vertices:
+        write_dataset(group, "vertices", mesh.vertices, layout.geometry)
+    if store_topology:
+        write_dataset(group, "faces", mesh.faces, layout.topology)
+        # Adjacency as CSR arrays: neighbors of face i are indices[indptr[i]:indptr[i + 1]]
+        indptr, indices = mesh.adjacency_csr()
+        write_dataset(group, "adjacency_indptr", indptr, layout.topology)
+        write_dataset(group, "adjacency_indices", indices, layout.topology)
+        # Save face IDs
+        if mesh.face_ids is None:
+            print("Generating face IDs before export...")
+            mesh.face_ids = np.arange(mesh.faces.shape[0], dtype=np.int32)
+        write_dataset(group, "face_ids", mesh.face_ids, layout.topology)
+    if store_vertices and mesh.face_centers is not None:
+        write_dataset(group, "face_centers", mesh.face_centers, layout.geometry)
+
+
+def write_cratons(group: h5py.Group, cratons: List[Craton], layout: StorageLayout):
+    write_dataset(group, "id", [c.id for c in cratons], layout.topology)
+    write_dataset(group, "center_index", [c.center_index for c in cratons], layout.topology)
+    write_strings(group, "name", [c.name for c in cratons])
+    write_ragged(group, "face_ids", [c.face_ids for c in cratons], layout.topology)
+
+
+def write_plates(group: h5py.Group, plates: List[Plate], layout: StorageLayout):
+    write_dataset(group, "id", [p.id for p in plates], layout.topology)
+    write_ragged(group, "craton_ids", [p.craton_ids for p in plates], layout.topology)
+    write_dataset(group, "motion_vector", [p.motion_vector for p in plates], layout.geometry)
+    # Plates without an Euler pole are stored as NaN rows
+    poles = [p.euler_pole if p.euler_pole is not None else np.full(3, np.nan) for p in plates]
+    write_dataset(group, "euler_pole", poles, layout.geometry)
+    write_dataset(group, "angular_velocity", [p.angular_velocity for p in plates], layout.geometry)
+
+
+def write_regions(group: h5py.Group, regions: RegionMap, layout: StorageLayout):
+    # Named regions as one JSON document per region; each region layer in its own subgroup
+    write_strings(group, "region_names", list(regions.named_regions))
+    write_strings(group, "region_metadata", [json.dumps(meta, default=_json_default) for meta in regions.named_regions.values()])
+    layers = group.create_group("layers")
+    for name, layer in regions.layers.items():
+        REGION_LAYER_SCHEMA.write(layers.create_group(name), layer, layout)
+
+
+def _json_default(value: Any) -> Any:
+    """Region metadata may hold numpy scalars and arrays; store them as JSON numbers and lists."""
+    return value.tolist() if hasattr(value, "tolist") else str(value)
+
+
+def write_nations(group: h5py.Group, nations: List[Nation], layout: StorageLayout):
+    write_strings(group, "name", [n.name for n in nations])
+    write_dataset(group, "capital", [n.capital for n in nations], layout.topology)
+    write_ragged(group, "territory", [n.territory for n in nations], layout.topology)
+    write_strings(group, "metadata", [json.dumps(n.metadata) for n in nations])
+
+
+# === Readers ===
+
+def read_mesh(group: h5py.Group) -> MeshData:
+    """Build MeshData from a file's "mesh" group, rebuilding arrays a topology-free file left out."""
+    generator = None
+    if "generator" in group.attrs:
+        generator = {key: attr_value(value) for key, value in group.attrs.items() if key not in PROVENANCE_ATTRS}
+    generated = None
+    if "faces" not in group or "vertices" not in group:
+        if generator is None:
+            raise ValueError("Mesh group stores neither its arrays nor the generator to rebuild them")
+        generated = regenerate_mesh(generator)
+
+    if "vertices" in group:
+        vertices = group["vertices"][:]
+        face_centers = group["face_centers"][:] if "face_centers" in group else None
+    else:
+        vertices, face_centers = generated.vertices, generated.face_centers
+
+    if "faces" not in group:
+        return MeshData(vertices=vertices, faces=generated.faces, adjacency=generated.adjacency,
+                        face_ids=generated.face_ids, face_centers=face_centers, generator=generator)
+
+    faces = group["faces"][:]
+    face_ids = group["face_ids"][:] if "face_ids" in group else None
+    # CSR adjacency; files written before it was introduced store per-face lengths instead
+    if "adjacency_indptr" in group:
+        adjacency = CSRAdjacency(group["adjacency_indptr"][:], group["adjacency_indices"][:])
+    else:
+        adjacency = CSRAdjacency.from_lengths(group["adjacency_lengths"][:], group["adjacency_flat"][:])
+
+    return MeshData(vertices=vertices, faces=faces, adjacency=adjacency, face_ids=face_ids,
+                    face_centers=face_centers, generator=generator)
+
+
+def read_cratons(group: h5py.Group) -> List[Craton]:
+    """Build the craton list from a file's columnar "cratons" group."""
+    if "id" not in group:
+        return _read_legacy_cratons(group)
+    ids = group["id"][:].tolist()
+    centers = group["center_index"][:].tolist()
+    names = read_strings(group, "name")
+    face_ids = read_ragged(group, "face_ids")
+    return [
+        Craton(center_index=center, id=craton_id, face_ids=faces if len(faces) else None, name=name)
+        for craton_id, center, name, faces in zip(ids, centers, names, face_ids)
+    ]
+
+
+def _read_legacy_cratons(group: h5py.Group) -> List[Craton]:
+    """Read cratons from files that stored one subgroup per craton."""
+    cratons = []
+    for key in group:
+        cgrp = group[key]
+        center_index = int(cgrp.attrs["center_index"])
+        craton_id = int(cgrp.attrs["id"])
+        name = cgrp.attrs.get("name", None)
+        face_ids = cgrp["face_ids"][:] if "face_ids" in cgrp else None
+        cratons.append(Craton(center_index=center_index, id=craton_id, face_ids=face_ids, name=name))
+    return cratons
+
+
+def read_plates(group: h5py.Group) -> List[Plate]:
+    """Build the plate list from a file's columnar "plates" group."""
+    poles = group["euler_pole"][:]
+    return [
+        Plate(id=plate_id, craton_ids=craton_ids.tolist(), motion_vector=motion,
+              euler_pole=None if np.isnan(pole).any() else pole, angular_velocity=velocity)
+        for plate_id, craton_ids, motion, pole, velocity in zip(
+            group["id"][:].tolist(), read_ragged(group, "craton_ids"), group["motion_vector"][:],
+            poles, group["angular_velocity"][:].tolist())
+    ]
+
+
+def read_nations(group: h5py.Group) -> List[Nation]:
+    """Build the nation list from a file's columnar "nations" group."""
+    return [
+        Nation(name=name, capital=capital, territory=territory, metadata=json.loads(metadata))
+        for name, capital, territory, metadata in zip(
+            read_strings(group, "name"), group["capital"][:].tolist(), read_ragged(group, "territory"),
+            read_strings(group, "metadata"))
+    ]
+
+
+def read_regions(group: h5py.Group) -> RegionMap:
+    """Build a RegionMap from a file's "regions" group."""
+    named_regions = {
+        name: json.loads(metadata)
+        for name, metadata in zip(read_strings(group, "region_names"), read_strings(group, "region_metadata"))
+    }
+    layers = group["layers"]
+    return RegionMap(named_regions=named_regions,
+                     layers={name: REGION_LAYER_SCHEMA.read(layers[name]) for name in layers})
+
+
+# === Registry ===
+
+@dataclass(frozen=True)
+class LayerIO:
+    write: Callable[[h5py.Group, Any, StorageLayout], None]
+    read: Callable[[h5py.Group], Any]
+
+    @staticmethod
+    def of(schema: ArraySchema) -> "LayerIO":
+        return LayerIO(schema.write, schema.read)
+
+
+# Planet attribute -> group I/O, in file write order
+LAYERS: Dict[str, LayerIO] = {
+    "mesh": LayerIO(write_mesh, read_mesh),
+    "cratons": LayerIO(write_cratons, read_cratons),
+    "plates": LayerIO(write_plates, read_plates),
+    "plate_map": LayerIO.of(PLATE_MAP_SCHEMA),
+    "elevation": LayerIO.of(ELEVATION_SCHEMA),
+    "drainage": LayerIO.of(DRAINAGE_SCHEMA),
+    "climate": LayerIO.of(CLIMATE_SCHEMA),
+    "biomes": LayerIO.of(BIOMES_SCHEMA),
+    "regions": LayerIO(write_regions, read_regions),
+    "political_map": LayerIO.of(POLITICAL_MAP_SCHEMA),
+    "nations": LayerIO(write_nations, read_nations),
+}
+
+
+def write_layers(f: h5py.File, planet, names: Iterable[str], layout: StorageLayout):
+    """
+    Write (or replace) the named layer groups of a planet.
+
+    Existing groups are deleted first; layers the planet does not have (None or empty)
+    are removed from the file. Provenance from planet.provenance is stored as group attributes.
+
+    Args:
+        f (h5py.File): File open for writing
+        planet (Planet): Source planet
+        names (Iterable[str]): Layer names from LAYERS
+        layout (StorageLayout): Chunking and compression settings
+    """
+    if layout.quantize and planet.elevation is not None:
+        # Elevation-like fields of every layer share one grid anchored at sea level
+        layout = replace(layout, quantize_anchor=float(planet.elevation.sea_level))
+    for name in names:
+        if name not in LAYERS:
+            raise ValueError(f"Unknown planet layer: {name}")
+        if name in f:
+            del f[name]
+        value = getattr(planet, name)
+        if value is None or (isinstance(value, list) and not value):
+            continue
+        group = f.create_group(name)
+        LAYERS[name].write(group, value, layout)
+        for key, attr in planet.provenance.get(name, {}).items():
+            group.attrs[key] = attr
+
+
+def read_provenance(f: h5py.File) -> Dict[str, Dict[str, str]]:
+    """Collect the provenance attributes of every stored layer."""
+    provenance = {}
+    stored = set(f)
+    for name in LAYERS:
+        if name in stored:
+            group_attrs = f[name].attrs
+            attrs = {key: str(group_attrs[key]) for key in PROVENANCE_ATTRS if key in group_attrs}
+            if attrs:
+                provenance[name] = attrs
+    return provenance
@@ -1,15 +1,16 @@
 # generation/models/politics.py
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional
 import numpy as np
 
 @dataclass
 class Nation:
     name: str
     capital: int                     # face index
-    territory: List[int]             # face indices
+    territory: np.ndarray            # face indices, sorted ascending
     metadata: Dict[str, Any]         # optional tags (color, culture, etc.)
 
 @dataclass
 class PoliticalMap:
-    face_to_nation: np.ndarray       # shape (num_faces,)
+    face_to_nation: np.ndarray       # shape (num_faces,), -1 for unclaimed faces
+    travel_cost: Optional[np.ndarray] = None  # cost from the owning nation's capital, shape (num_faces,)
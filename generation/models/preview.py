@@ -0,0 +1,178 @@
+# generation/models/preview.py
+# Low-resolution preview embedded in planet files
+
+"""
+Browsing many planets should not mean loading each one. A file can carry a "preview"
+group holding a small planet of its own:
+
+- a coarse icosphere mesh (subdivision level `preview_level`, e.g. 1280 faces at level 3);
+- the required per-face fields of the array layers (plate map, elevation, climate, biomes,
+  political map) aggregated onto it: each coarse face covers the 4^(L - level) fine faces
+  numbered below it (see models/tiles.py), floats take their mean and IDs their most
+  common value;
+- optionally an equirectangular RGB thumbnail of the elevation.
+
+The group is laid out like a planet file root (radius, subdivision_level and seed attributes
+plus layer groups written through planet_layers.LAYERS), so PlanetFile.preview() opens it
+with the regular reader and the mesh viewer can display it like any planet.
+"""
+
+from dataclasses import replace
+from typing import Optional
+import h5py
+import numpy as np
+from scipy.spatial import cKDTree
+
+from generation.models.icosphere import DEFAULT_RELAX_ITERATIONS, icosphere_mesh, normalize
+from generation.models.planet_layers import (
+    BIOMES_SCHEMA, CLIMATE_SCHEMA, ELEVATION_SCHEMA, LAYERS, PLATE_MAP_SCHEMA, POLITICAL_MAP_SCHEMA,
+    write_layers,
+)
+from generation.models.storage import StorageLayout, write_dataset
+from shared.logging.logger import get_logger
+
+log = get_logger(__name__)
+
+PREVIEW_GROUP = "preview"
+THUMBNAIL = "thumbnail"
+
+# Layers carried into the preview; their required face fields are aggregated, the rest dropped
+PREVIEW_SCHEMAS = {
+    "plate_map": PLATE_MAP_SCHEMA,
+    "elevation": ELEVATION_SCHEMA,
+    "climate": CLIMATE_SCHEMA,
+    "biomes": BIOMES_SCHEMA,
+    "political_map": POLITICAL_MAP_SCHEMA,
+}
+
+
+def aggregate_faces(values: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Reduce each run of `factor` consecutive face values to one value.
+
+    Floats are averaged (ignoring NaN); integers take the most common value, ties going to
+    the smallest.
+
+    Args:
+        values (np.ndarray): Per-face values, shape (M,)
+        factor (int): Fine faces per coarse face
+
+    Returns:
+        np.ndarray: Shape (M // factor,), same dtype as `values`
+    """
+    rows = values.reshape(-1, factor)
+    if not np.issubdtype(values.dtype, np.integer):
+        mean = np.nanmean(rows, axis=1) if np.isnan(rows).any() else rows.mean(axis=1)
+        return mean.astype(values.dtype)
+
+    ordered = np.sort(rows, axis=1)
+    position = np.arange(factor)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    # Length of the run of equal values ending at each position
+    run_length = position - np.maximum.accumulate(np.where(starts, position, 0), axis=1) + 1
+    return ordered[np.arange(len(ordered)), np.argmax(run_length, axis=1)]
+
+
+def build_preview(planet, level: int):
+    """
+    Build the coarse preview planet.
+
+    Args:
+        planet (Planet): Full-resolution planet with an icosphere mesh
+        level (int): Preview subdivision level; clipped to the planet's own level
+
+    Returns:
+        Planet: Coarse planet with the mesh and aggregated array layers only
+    """
+    level = min(level, planet.subdivision_level)
+    factor = 4 ** (planet.subdivision_level - level)
+    generator = planet.mesh.generator or {}
+    mesh = icosphere_mesh(level, planet.radius, generator.get("relax_iterations", DEFAULT_RELAX_ITERATIONS))
+
+    layers = {}
+    for name, schema in PREVIEW_SCHEMAS.items():
+        value = getattr(planet, name)
+        if value is None:
+            continue
+        kwargs = {spec.name: aggregate_faces(np.asarray(getattr(value, spec.name)), factor)
+                  for spec in schema.fields if spec.domain == "face" and not spec.optional}
+        kwargs.update({attr: getattr(value, attr) for attr in schema.attrs + schema.strings})
+        layers[name] = schema.cls(**kwargs)
+
+    return replace(
+        planet, subdivision_level=level, mesh=mesh, cratons=[], plates=[], drainage=None,
+        regions=None, nations=[], provenance={name: dict(planet.provenance[name])
+                                              for name in layers if name in planet.provenance},
+        **{name: layers.get(name) for name in PREVIEW_SCHEMAS},
+    )
+
+
+def elevation_thumbnail(planet, width: int) -> Optional[np.ndarray]:
+    """
+    Render an equirectangular RGB image of the planet's elevation.
+
+    Each pixel takes the elevation of the face whose center is nearest to the pixel's
+    direction; oceans are shaded blue by depth, land green to brown to white by height.
+
+    Args:
+        planet (Planet): Planet with a mesh and an elevation layer
+        width (int): Image width in pixels; the height is width // 2
+
+    Returns:
+        Optional[np.ndarray]: uint8 array of shape (width // 2, width, 3), or None without elevation
+    """
+    if planet.elevation is None or width <= 0:
+        return None
+    height = max(width // 2, 1)
+    lat = np.pi / 2 - (np.arange(height) + 0.5) * np.pi / height
+    lon = (np.arange(width) + 0.5) * 2 * np.pi / width - np.pi
+    lon, lat = np.meshgrid(lon, lat)
+    directions = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+    _, nearest = cKDTree(normalize(planet.mesh.face_centers)).query(directions.reshape(-1, 3))
+    elevation = np.asarray(planet.elevation.elevation)[nearest] - planet.elevation.sea_level
+    return _hypsometric(elevation).reshape(height, width, 3)
+
+
+def _hypsometric(elevation: np.ndarray) -> np.ndarray:
+    """Color elevations relative to sea level as uint8 RGB."""
+    depth = np.clip(-elevation / 6000.0, 0.0, 1.0)[:, None]
+    height = np.clip(elevation / 5000.0, 0.0, 1.0)[:, None]
+    ocean = (1 - depth) * np.array([70, 130, 200]) + depth * np.array([10, 30, 90])
+    lowland, highland, peak = np.array([60, 140, 60]), np.array([140, 110, 70]), np.array([245, 245, 245])
+    land = np.where(height < 0.6, lowland + (highland - lowland) * (height / 0.6),
+                    highland + (peak - highland) * ((height - 0.6) / 0.4))
+    return np.where(elevation[:, None] < 0, ocean, land).astype(np.uint8)
+
+
+def write_preview(f: h5py.Group, planet, level: int, thumbnail_width: int, layout: StorageLayout):
+    """
+    Write (or replace) a planet's preview group.
+
+    Planets without an icosphere mesh get no preview.
+
+    Args:
+        f (h5py.Group): File root
+        planet (Planet): Full-resolution planet
+        level (int): Preview subdivision level
+        thumbnail_width (int): Thumbnail width in pixels; 0 stores no thumbnail
+        layout (StorageLayout): Settings for the preview's datasets
+    """
+    if PREVIEW_GROUP in f:
+        del f[PREVIEW_GROUP]
+    if planet.mesh is None or not planet.mesh.is_icosphere():
+        log.warning("Skipping preview: planet has no icosphere mesh")
+        return
+
+    preview = build_preview(planet, level)
+    group = f.create_group(PREVIEW_GROUP)
+    group.attrs["radius"] = preview.radius
+    group.attrs["subdivision_level"] = preview.subdivision_level
+    group.attrs["seed"] = preview.seed
+    write_layers(group, preview, LAYERS, layout)
+
+    thumbnail = elevation_thumbnail(planet, thumbnail_width)
+    if thumbnail is not None:
+        write_dataset(group, THUMBNAIL, thumbnail, layout.layers)
+    log.debug("Wrote level %d preview (%d faces)", preview.subdivision_level, len(preview.mesh.faces))
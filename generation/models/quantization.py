@@ -0,0 +1,126 @@
+# generation/models/quantization.py
+# Lossy and compact integer encodings for per-face layer fields
+
+"""
+Two encodings shrink per-face fields on disk (and for GPU upload) by storing small integers:
+
+- "linear": floats are mapped onto the full range of an int16/uint16 code,
+      value = code * scale + offset
+  with scale and offset fitted to the field's finite range, so the round-trip error is at
+  most scale / 2. The largest code is reserved for NaN.
+  Fields that are compared with each other or with the sea level (elevation and the
+  drainage stage's filled elevation) use a fixed `step` instead: every such field of a
+  planet is stored on the same grid, anchored at its sea level. Rounding onto one grid is
+  monotonic, so orderings like filled_elevation >= elevation survive a round trip, and a
+  value above the anchor always keeps a code above it, so no face crosses sea level.
+- "categorical": integer IDs (plates, biomes, nations, -1 for "none") are stored as
+      value = code + offset
+  in uint8/uint16 when their range fits, which is lossless; fields whose range does not fit
+  are stored unencoded.
+
+encode() returns the codes together with a small JSON-able dict of decode parameters, which
+the layer store keeps in the group's "fields" attribute; decode() inverts it in one
+vectorized pass. Consumers that upload to the GPU can read the codes directly and apply
+scale/offset in a shader.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+KINDS = ("linear", "categorical")
+
+
+@dataclass(frozen=True)
+class Quantization:
+    kind: str       # "linear" or "categorical"
+    dtype: str      # code type: "int16"/"uint16" for linear, "uint8"/"uint16" for categorical
+    step: Optional[float] = None    # linear only: fixed grid spacing around an anchor instead of a fitted range
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"Unknown quantization kind: {self.kind} (expected one of {', '.join(KINDS)})")
+        if not np.issubdtype(np.dtype(self.dtype), np.integer):
+            raise ValueError(f"Quantized codes must be integers, got {self.dtype}")
+        if self.step is not None and (self.kind != "linear" or self.step <= 0):
+            raise ValueError("A quantization step needs the linear kind and a positive value")
+
+
+# Encodings used by the planet layer schemas
+LINEAR_INT16 = Quantization("linear", "int16")          # signed fields, e.g. elevation, temperature
+LINEAR_UINT16 = Quantization("linear", "uint16")        # non-negative fields, e.g. precipitation
+ELEVATION_INT16 = Quantization("linear", "int16", step=1.0)  # meters around sea level, ±32 km
+CATEGORICAL_UINT8 = Quantization("categorical", "uint8")    # small ID sets: plates, biomes
+CATEGORICAL_UINT16 = Quantization("categorical", "uint16")  # larger ID sets: nations, regions
+
+
+def encode(data: np.ndarray, quantization: Quantization,
+           anchor: float = 0.0) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+    """
+    Encode an array with the given quantization.
+
+    Args:
+        data (np.ndarray): Values to encode
+        quantization (Quantization): Target encoding
+        anchor (float): Value stored exactly as code 0 by fixed-step quantizations (the
+            planet's sea level); ignored otherwise
+
+    Returns:
+        Optional[Tuple[np.ndarray, Dict[str, Any]]]: (codes, decode parameters), or None when a
+        categorical field's value range does not fit the code type
+    """
+    data = np.asarray(data)
+    code_type = np.dtype(quantization.dtype)
+    limits = np.iinfo(code_type)
+
+    if quantization.kind == "categorical":
+        if data.size == 0:
+            return data.astype(code_type), {"kind": "categorical", "offset": 0, "dtype": data.dtype.str}
+        offset = int(data.min())
+        if int(data.max()) - offset > limits.max:
+            return None
+        codes = (data.astype(np.int64) - offset).astype(code_type)
+        return codes, {"kind": "categorical", "offset": offset, "dtype": data.dtype.str}
+
+    finite = np.isfinite(data)
+    fill = int(limits.max)
+    if quantization.step is not None:
+        scale, offset = float(quantization.step), float(anchor)
+        above = np.where(finite, data, offset) > offset
+        codes = np.rint((np.where(finite, data, offset) - offset) / scale)
+        # Values just above the anchor would round onto it; keep them above
+        codes = np.where(above, np.maximum(codes, 1), codes)
+        codes = np.clip(codes, limits.min, fill - 1).astype(code_type)
+        codes[~finite] = fill
+        return codes, {"kind": "linear", "scale": scale, "offset": offset, "fill": fill, "dtype": data.dtype.str}
+
+    low, high = (float(data[finite].min()), float(data[finite].max())) if finite.any() else (0.0, 0.0)
+    # Codes span [limits.min, limits.max - 1]; limits.max marks NaN
+    steps = fill - 1 - int(limits.min)
+    scale = (high - low) / steps if high > low else 1.0
+    offset = low - int(limits.min) * scale
+
+    codes = np.rint((np.where(finite, data, low) - offset) / scale)
+    codes = np.clip(codes, limits.min, fill - 1).astype(code_type)
+    codes[~finite] = fill
+    return codes, {"kind": "linear", "scale": scale, "offset": offset, "fill": fill, "dtype": data.dtype.str}
+
+
+def decode(codes: np.ndarray, encoding: Dict[str, Any]) -> np.ndarray:
+    """
+    Invert encode().
+
+    Args:
+        codes (np.ndarray): Stored codes (any subset of rows)
+        encoding (Dict[str, Any]): Decode parameters returned by encode()
+
+    Returns:
+        np.ndarray: Values in the field's original dtype
+    """
+    dtype = np.dtype(encoding["dtype"])
+    if encoding["kind"] == "categorical":
+        return (codes.astype(np.int64) + encoding["offset"]).astype(dtype)
+
+    values = codes.astype(np.float64) * encoding["scale"] + encoding["offset"]
+    values[codes == encoding["fill"]] = np.nan
+    return values.astype(dtype)
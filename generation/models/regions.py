@@ -1,7 +1,22 @@
 # generation/models/regions.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any
+import numpy as np
+
+@dataclass
+class RegionLayer:
+    face_to_region: np.ndarray       # component id per face, shape (num_faces,)
+    region_class: np.ndarray         # class value of each component (e.g. land/ocean, biome id), shape (num_regions,)
+    face_counts: np.ndarray          # faces per component, shape (num_regions,)
+    areas: np.ndarray                # surface area per component (km²), shape (num_regions,)
+    centroids: np.ndarray            # area-weighted centroid per component on the sphere, shape (num_regions, 3)
+
+    @property
+    def num_regions(self) -> int:
+        """Number of connected components in this layer."""
+        return len(self.face_counts)
 
 @dataclass
 class RegionMap:
     named_regions: Dict[str, Any]    # name -> metadata (location, type, faces)
+    layers: Dict[str, RegionLayer] = field(default_factory=dict)  # layer name (e.g. "landmass") -> components
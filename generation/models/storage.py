@@ -0,0 +1,198 @@
+# generation/models/storage.py
+# HDF5 dataset layout (chunking, compression, columnar entity tables) used when saving planets
+
+"""
+Every dataset in a .planetbin file belongs to one of three classes:
+
+- "topology": integer connectivity (faces, adjacency, face IDs, craton face lists)
+- "geometry": float coordinates (vertices, face centers)
+- "layers":   per-face data produced by the pipeline stages (plate map, elevation, ...)
+
+Each class gets its own DatasetLayout. Chunks span whole rows and are sized in rows, so a
+face-range read touches only the chunks that cover it. The shuffle filter groups the bytes
+of each element before compression, which is what makes integer index arrays and smooth
+float fields compress well.
+
+Meshes built by a deterministic generator (MeshData.generator) can instead be stored as
+just their generator attributes; see store_topology/store_vertices and models/icosphere.py.
+With `quantize`, layer fields that declare a quantization are stored as small integer codes;
+see models/quantization.py. With `tile_level`, chunks follow icosphere tiles so a region
+can be read on its own; see models/tiles.py.
+
+Entity collections (cratons, plates, nations) are stored columnar: one dataset per field
+with one row per entity, and ragged per-entity face lists as a CSR pair (write_ragged), so
+reading a collection costs a fixed number of dataset reads however many entities it has.
+"""
+
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Dict, List, Optional, Sequence
+import h5py
+import numpy as np
+
+DATASET_CLASSES = ("topology", "geometry", "layers")
+COMPRESSIONS = ("gzip", "lzf", "none")
+
+
+@dataclass(frozen=True)
+class DatasetLayout:
+    compression: str = "gzip"      # "gzip", "lzf" or "none"
+    compression_level: int = 4     # gzip only, 0-9
+    shuffle: bool = True
+    chunk_rows: int = 65536        # rows per chunk; 0 stores the dataset contiguously
+
+    def __post_init__(self):
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {self.compression} (expected one of {', '.join(COMPRESSIONS)})")
+
+    def dataset_kwargs(self, data: np.ndarray) -> Dict[str, Any]:
+        """
+        Return the create_dataset keyword arguments for storing `data` with this layout.
+
+        Filters need chunked storage, so empty and scalar arrays (which cannot be chunked)
+        and layouts with chunk_rows=0 are stored contiguously and uncompressed.
+        """
+        if data.ndim == 0 or data.size == 0 or self.chunk_rows <= 0:
+            return {}
+        kwargs: Dict[str, Any] = {"chunks": (min(self.chunk_rows, data.shape[0]),) + data.shape[1:]}
+        if self.compression != "none":
+            kwargs["compression"] = self.compression
+            if self.compression == "gzip":
+                kwargs["compression_opts"] = self.compression_level
+        if self.shuffle and self.compression != "none":
+            kwargs["shuffle"] = True
+        return kwargs
+
+
+@dataclass(frozen=True)
+class StorageLayout:
+    topology: DatasetLayout = field(default_factory=DatasetLayout)
+    geometry: DatasetLayout = field(default_factory=DatasetLayout)
+    layers: DatasetLayout = field(default_factory=DatasetLayout)
+    # Generated meshes can be rebuilt from their generator attributes on load, so their
+    # connectivity (faces, adjacency, face IDs) and coordinates may be left out of the file
+    store_topology: bool = True
+    store_vertices: bool = True
+    # Store fields that declare a Quantization as compact integer codes (lossy for floats)
+    quantize: bool = False
+    # Sea level of the planet being written; fixed-step quantized fields (elevations) are
+    # stored on a grid anchored there. Set by write_layers
+    quantize_anchor: float = 0.0
+    # Chunk datasets along icosphere tiles of this subdivision level (see models/tiles.py)
+    tile_level: Optional[int] = None
+    # Embed a coarse preview planet of this subdivision level (see models/preview.py)
+    preview_level: Optional[int] = None
+    thumbnail_width: int = 0
+
+    def with_chunk_rows(self, chunk_rows: int) -> "StorageLayout":
+        """Return this layout with every dataset class chunked at `chunk_rows` rows."""
+        return replace(self, **{name: replace(getattr(self, name), chunk_rows=chunk_rows)
+                                for name in DATASET_CLASSES})
+
+    @staticmethod
+    def uncompressed() -> "StorageLayout":
+        """Contiguous, unfiltered storage for every class (the pre-chunking file layout)."""
+        plain = DatasetLayout(compression="none", shuffle=False, chunk_rows=0)
+        return StorageLayout(topology=plain, geometry=plain, layers=plain)
+
+    @staticmethod
+    def from_params(compression: str = "gzip", compression_level: int = 4, shuffle: bool = True,
+                    chunk_rows: int = 65536, store_topology: bool = True, store_vertices: bool = True,
+                    quantize: bool = False, tile_level: Optional[int] = None,
+                    preview_level: Optional[int] = None, thumbnail_width: int = 0, **overrides: Optional[Dict[str, Any]]) -> "StorageLayout":
+        """
+        Build a layout from shared settings plus optional per-class override dicts.
+
+        Args:
+            compression (str): Default compression for every class
+            compression_level (int): Default gzip level
+            shuffle (bool): Default shuffle filter setting
+            chunk_rows (int): Default chunk length in rows
+            store_topology (bool): Store faces and adjacency of generated meshes
+            store_vertices (bool): Store vertices and face centers of generated meshes
+            quantize (bool): Store quantizable layer fields as integer codes
+            tile_level (Optional[int]): Chunk along icosphere tiles of this level; None disables tiling
+            preview_level (Optional[int]): Subdivision level of the embedded preview; None or
+                negative writes no preview
+            thumbnail_width (int): Width of the preview's equirectangular thumbnail; 0 for none
+            **overrides: Per-class dicts keyed by "topology", "geometry" or "layers", holding any
+                DatasetLayout field, e.g. {"geometry": {"compression": "lzf"}}
+
+        Returns:
+            StorageLayout: The merged layout
+        """
+        base = DatasetLayout(compression=compression, compression_level=compression_level,
+                             shuffle=shuffle, chunk_rows=chunk_rows)
+        known = {f.name for f in fields(DatasetLayout)}
+        layouts = {}
+        for name, override in overrides.items():
+            if name not in DATASET_CLASSES:
+                raise ValueError(f"Unknown dataset class: {name}")
+            override = override or {}
+            unknown = set(override) - known
+            if unknown:
+                raise ValueError(f"Unknown {name} layout settings: {', '.join(sorted(unknown))}")
+            layouts[name] = replace(base, **override)
+        return StorageLayout(store_topology=store_topology, store_vertices=store_vertices,
+                             quantize=quantize, tile_level=tile_level,
+                             preview_level=preview_level if preview_level is not None and preview_level >= 0 else None,
+                             thumbnail_width=thumbnail_width, **{name: layouts.get(name, base) for name in DATASET_CLASSES})
+
+
+def write_dataset(group: h5py.Group, name: str, data, layout: DatasetLayout) -> h5py.Dataset:
+    """
+    Create a dataset in `group` using the given layout.
+
+    Args:
+        group (h5py.Group): Parent group
+        name (str): Dataset name
+        data: Array-like contents
+        layout (DatasetLayout): Chunking and compression settings
+
+    Returns:
+        h5py.Dataset: The new dataset
+    """
+    data = np.asarray(data)
+    return group.create_dataset(name, data=data, **layout.dataset_kwargs(data))
+
+
+def write_ragged(group: h5py.Group, name: str, rows: Sequence[Optional[Sequence[int]]], layout: DatasetLayout,
+                 dtype=np.int32):
+    """
+    Store variable-length rows as one CSR pair: `{name}_indptr` and the concatenated `{name}`.
+
+    Row i is values[indptr[i]:indptr[i + 1]]; None is stored as an empty row.
+
+    Args:
+        group (h5py.Group): Parent group
+        name (str): Base dataset name
+        rows (Sequence[Optional[Sequence[int]]]): One array-like (or None) per entity
+        layout (DatasetLayout): Chunking and compression settings for both datasets
+        dtype: Element type of the values dataset
+    """
+    arrays = [np.asarray(row if row is not None else (), dtype=dtype) for row in rows]
+    indptr = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(a) for a in arrays], out=indptr[1:])
+    write_dataset(group, f"{name}_indptr", indptr, layout)
+    write_dataset(group, name, np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype), layout)
+
+
+def read_ragged(group: h5py.Group, name: str) -> List[np.ndarray]:
+    """
+    Read rows written by write_ragged with two dataset reads, whatever the row count.
+
+    Returns:
+        List[np.ndarray]: One view into the values array per entity
+    """
+    indptr = group[f"{name}_indptr"][:]
+    values = group[name][:]
+    return np.split(values, indptr[1:-1])
+
+
+def write_strings(group: h5py.Group, name: str, values: Sequence[Optional[str]]):
+    """Store a column of UTF-8 strings; None is stored as an empty string."""
+    group.create_dataset(name, data=[value or "" for value in values], dtype=h5py.string_dtype())
+
+
+def read_strings(group: h5py.Group, name: str) -> List[Optional[str]]:
+    """Read a write_strings column back, mapping empty strings to None."""
+    return [value or None for value in group[name].asstr()[()]]
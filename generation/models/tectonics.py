@@ -9,9 +9,19 @@ Geological data structures for tectonic modeling.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 import numpy as np
 
+# Boundary classification codes stored in PlateMap.boundary_types
+BOUNDARY_TRANSFORM = 0
+BOUNDARY_CONVERGENT = 1
+BOUNDARY_DIVERGENT = 2
+BOUNDARY_NAMES = {
+    BOUNDARY_TRANSFORM: "transform",
+    BOUNDARY_CONVERGENT: "convergent",
+    BOUNDARY_DIVERGENT: "divergent",
+}
+
 @dataclass
 class Craton:
     """
@@ -20,7 +30,7 @@ class Craton:
     Attributes:
         center_index: The mesh face index representing the core of the craton
         id: A unique identifier for this craton
-        face_ids: Optional list of face indices that make up the craton's region
+        face_ids: Optional array of face indices that make up the craton's region
         name: Optional human-readable name for display or debugging
     """
     center_index: int
@@ -33,14 +43,39 @@ class Plate:
     """
     Represents a tectonic plate that moves and deforms under geophysical forces.
 
+    Plate motion on a sphere is a rigid rotation about an Euler pole, so the surface
+    velocity at a point r is omega x r with omega = angular_velocity * euler_pole.
+
     Attributes:
         id: Unique plate ID
         craton_ids: List of craton IDs that form the structural core of the plate
-        motion_vector: A 3D unit vector representing motion direction in world space
+        motion_vector: A 3D unit vector representing motion direction at the plate's seed face
+        euler_pole: Unit rotation axis through the planet's center (shape: 3,)
+        angular_velocity: Rotation rate about the Euler pole in radians per million years
     """
     id: int
     craton_ids: List[int]
     motion_vector: np.ndarray        # shape (3,)
+    euler_pole: Optional[np.ndarray] = None  # shape (3,)
+    angular_velocity: float = 0.0
+
+    def rotation_vector(self) -> np.ndarray:
+        """Return the angular velocity vector omega = angular_velocity * euler_pole."""
+        if self.euler_pole is None:
+            return np.zeros(3)
+        return self.angular_velocity * np.asarray(self.euler_pole, dtype=float)
+
+    def velocity_at(self, points: np.ndarray) -> np.ndarray:
+        """
+        Compute the surface velocity of this plate at one or more points.
+
+        Args:
+            points: Positions on the sphere, shape (3,) or (N, 3)
+
+        Returns:
+            np.ndarray: Velocities (omega x r) in distance units per million years
+        """
+        return np.cross(self.rotation_vector(), points)
 
 @dataclass
 class PlateMap:
@@ -49,5 +84,37 @@ class PlateMap:
 
     Attributes:
         face_to_plate: Array mapping face index to a plate ID (shape: num_faces,)
+        boundary_edges: Face pairs (a < b) whose faces belong to different plates (shape: E, 2)
+        boundary_types: BOUNDARY_* classification code per boundary edge (shape: E,)
+        boundary_convergence: Relative normal velocity per boundary edge, positive when
+            the plates approach each other (shape: E,)
+        claim_order: Growth iteration in which each face was claimed, -1 if never claimed
+            (shape: num_faces,). Claims are final, so face_to_plate is also the claiming plate.
     """
     face_to_plate: np.ndarray        # shape (num_faces,)
+    boundary_edges: Optional[np.ndarray] = None        # shape (E, 2)
+    boundary_types: Optional[np.ndarray] = None        # shape (E,)
+    boundary_convergence: Optional[np.ndarray] = None  # shape (E,)
+    claim_order: Optional[np.ndarray] = None           # shape (num_faces,)
+
+    @property
+    def growth_iterations(self) -> int:
+        """Number of recorded growth iterations (0 if growth was not recorded)."""
+        if self.claim_order is None or self.claim_order.size == 0:
+            return 0
+        return int(self.claim_order.max())
+
+    def growth_frame(self, iteration: int) -> np.ndarray:
+        """
+        Reconstruct the plate assignment as it was after a given growth iteration.
+
+        Args:
+            iteration: Growth iteration to reconstruct (0 = seeds only)
+
+        Returns:
+            np.ndarray: Plate ID per face, -1 for faces not yet claimed at that iteration
+        """
+        if self.claim_order is None:
+            raise ValueError("PlateMap has no recorded claim order")
+        claimed = (self.claim_order >= 0) & (self.claim_order <= iteration)
+        return np.where(claimed, self.face_to_plate, -1)
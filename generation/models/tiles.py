@@ -0,0 +1,85 @@
+# generation/models/tiles.py
+# Tile index for regional reads of per-face datasets
+
+"""
+Icosphere subdivision replaces face i with faces 4i..4i+3, so after L passes the faces that
+descend from one face of a coarser level t form a contiguous ID range of 4^(L - t) faces.
+A "tile" is such a range: tile level 0 gives the 20 base-icosahedron faces, level t gives
+20 * 4^t tiles. No reordering is needed, only chunk boundaries that follow the tiles.
+
+With StorageLayout.tile_level set, Planet.save chunks every dataset at one tile's worth of
+rows and writes a "tiles" group holding the tile level and a (T, 2) array of
+[first_face, end_face) ranges. PlanetFile.read_region(tile_ids) then reads only the chunks of
+the requested tiles, so I/O is proportional to the region's size rather than the planet's.
+"""
+
+from typing import Iterable
+import h5py
+import numpy as np
+
+TILES_GROUP = "tiles"
+
+
+def faces_per_tile(subdivision_level: int, tile_level: int) -> int:
+    """
+    Number of faces in one tile.
+
+    Raises:
+        ValueError: If tile_level is not between 0 and subdivision_level
+    """
+    if not 0 <= tile_level <= subdivision_level:
+        raise ValueError(f"tile_level must be between 0 and the subdivision level ({subdivision_level}), got {tile_level}")
+    return 4 ** (subdivision_level - tile_level)
+
+
+def tile_face_ranges(subdivision_level: int, tile_level: int) -> np.ndarray:
+    """
+    Face-ID range of every tile.
+
+    Args:
+        subdivision_level (int): Subdivision level of the planet mesh
+        tile_level (int): Subdivision level whose faces are the tiles (0 = base icosahedron)
+
+    Returns:
+        np.ndarray: Shape (20 * 4^tile_level, 2); row i is [first_face, end_face) of tile i
+    """
+    size = faces_per_tile(subdivision_level, tile_level)
+    starts = np.arange(20 * 4 ** tile_level, dtype=np.int64) * size
+    return np.stack([starts, starts + size], axis=1)
+
+
+def write_tile_index(f: h5py.Group, planet, tile_level: int):
+    """
+    Store the tile index of a planet in its "tiles" group, replacing any previous one.
+
+    Args:
+        f (h5py.Group): File root
+        planet (Planet): Planet being saved
+        tile_level (int): Subdivision level whose faces are the tiles
+
+    Raises:
+        ValueError: If the mesh was not built by the icosphere generator
+    """
+    subdivision_level = planet.subdivision_level
+    if planet.mesh is not None and not planet.mesh.is_icosphere():
+        raise ValueError("Tiled storage needs a mesh built by the icosphere generator")
+    if TILES_GROUP in f:
+        del f[TILES_GROUP]
+    group = f.create_group(TILES_GROUP)
+    group.attrs["tile_level"] = tile_level
+    group.create_dataset("face_ranges", data=tile_face_ranges(subdivision_level, tile_level))
+
+
+def tiles_for_faces(face_ranges: np.ndarray, faces: Iterable[int]) -> np.ndarray:
+    """
+    Return the sorted IDs of the tiles containing the given faces.
+
+    Args:
+        face_ranges (np.ndarray): Tile index as written by write_tile_index
+        faces (Iterable[int]): Face IDs, e.g. the faces of one nation or region
+
+    Returns:
+        np.ndarray: Unique tile IDs, ascending
+    """
+    faces = np.asarray(faces if isinstance(faces, np.ndarray) else list(faces), dtype=np.int64)
+    return np.unique(np.searchsorted(face_ranges[:, 0], faces, side="right") - 1)
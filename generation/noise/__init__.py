@@ -0,0 +1,8 @@
+# generation/noise/__init__.py
+
+"""
+Coherent noise shared by the generation stages.
+"""
+
+from .fields import SALT_CLIMATE, SALT_PLATE_GROWTH, SALT_TERRAIN, NoiseParams, face_noise
+from .simplex import fbm3, permutation_table, simplex3
@@ -0,0 +1,55 @@
+# generation/noise/fields.py
+
+"""
+Per-face noise fields shared across pipeline stages.
+
+A field is fBm noise sampled at the mesh's face centroids (projected to the unit sphere), seeded
+from the planet seed plus a per-purpose salt. Results are memoized on the mesh itself, keyed by
+the seed and NoiseParams, so stages asking for the same field get the cached array and the
+cache lives exactly as long as the mesh.
+"""
+
+from dataclasses import astuple, dataclass
+import numpy as np
+
+from generation.models.mesh import MeshData
+from .simplex import fbm3, permutation_table
+
+
+# Salts in use, one per purpose; stages that want the same field share a salt
+SALT_PLATE_GROWTH = 1
+SALT_TERRAIN = 2
+SALT_CLIMATE = 3
+
+
+@dataclass(frozen=True)
+class NoiseParams:
+    frequency: float = 2.0     # features per unit-sphere radius at the first octave
+    octaves: int = 5
+    persistence: float = 0.5
+    lacunarity: float = 2.0
+    salt: int = 0              # decorrelates fields drawn for different purposes from the same seed
+
+
+def face_noise(mesh: MeshData, seed: int, params: NoiseParams = NoiseParams()) -> np.ndarray:
+    """
+    Return an fBm noise value per face, computing it only on the first request.
+
+    The returned array is shared between callers and marked read-only.
+
+    Args:
+        mesh (MeshData): Mesh whose face centroids are sampled
+        seed (int): Planet seed
+        params (NoiseParams): Noise shape parameters and salt
+
+    Returns:
+        np.ndarray: Noise per face in roughly [-1, 1], shape (M,)
+    """
+    def build():
+        centers = mesh.centers()
+        unit = centers / np.maximum(np.linalg.norm(centers, axis=1, keepdims=True), 1e-12)
+        perm = permutation_table(np.random.default_rng([seed, params.salt]))
+        values = fbm3(unit * params.frequency, perm, params.octaves, params.persistence, params.lacunarity)
+        values.flags.writeable = False
+        return values
+    return mesh.cached(f"noise:{seed}:{astuple(params)}", build)
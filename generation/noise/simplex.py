@@ -0,0 +1,108 @@
+# generation/noise/simplex.py
+
+"""
+Vectorized 3D simplex noise (Gustavson's formulation) and fractal Brownian motion.
+
+All functions take (N, 3) point arrays and evaluate every point at once; there are no
+per-point Python loops. The permutation table is the only source of randomness, so the
+same table always yields the same field.
+"""
+
+import numpy as np
+
+# Edge midpoints of a cube: the 12 gradient directions of 3D simplex noise
+_GRADIENTS = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+], dtype=np.float64)
+
+_SKEW = 1.0 / 3.0
+_UNSKEW = 1.0 / 6.0
+
+
+def permutation_table(rng: np.random.Generator) -> np.ndarray:
+    """
+    Build a doubled 256-entry permutation table, so lookups never need wrapping.
+
+    Args:
+        rng (np.random.Generator): Seeded random generator
+
+    Returns:
+        np.ndarray: int64 array of length 512
+    """
+    perm = rng.permutation(256)
+    return np.concatenate([perm, perm]).astype(np.int64)
+
+
+def simplex3(points: np.ndarray, perm: np.ndarray) -> np.ndarray:
+    """
+    Evaluate 3D simplex noise at every point.
+
+    Args:
+        points (np.ndarray): Sample positions, shape (N, 3)
+        perm (np.ndarray): Table from permutation_table()
+
+    Returns:
+        np.ndarray: Noise values in roughly [-1, 1], shape (N,)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    x, y, z = points[:, 0], points[:, 1], points[:, 2]
+
+    # Skew into the simplex grid and find the containing cell
+    s = (x + y + z) * _SKEW
+    i, j, k = np.floor(x + s), np.floor(y + s), np.floor(z + s)
+    t = (i + j + k) * _UNSKEW
+    x0, y0, z0 = x - (i - t), y - (j - t), z - (k - t)
+
+    # Rank the offsets to pick which of the six tetrahedra holds the point
+    x_ge_y, y_ge_z, x_ge_z = x0 >= y0, y0 >= z0, x0 >= z0
+    i1 = (x_ge_y & x_ge_z).astype(np.int64)
+    j1 = (~x_ge_y & y_ge_z).astype(np.int64)
+    k1 = (~x_ge_z & ~y_ge_z).astype(np.int64)
+    i2 = (x_ge_y | x_ge_z).astype(np.int64)
+    j2 = (~x_ge_y | y_ge_z).astype(np.int64)
+    k2 = (~(x_ge_z & y_ge_z)).astype(np.int64)
+
+    corners = (
+        (0, 0, 0, x0, y0, z0),
+        (i1, j1, k1, x0 - i1 + _UNSKEW, y0 - j1 + _UNSKEW, z0 - k1 + _UNSKEW),
+        (i2, j2, k2, x0 - i2 + 2 * _UNSKEW, y0 - j2 + 2 * _UNSKEW, z0 - k2 + 2 * _UNSKEW),
+        (1, 1, 1, x0 - 1 + 3 * _UNSKEW, y0 - 1 + 3 * _UNSKEW, z0 - 1 + 3 * _UNSKEW),
+    )
+
+    ii = i.astype(np.int64) & 255
+    jj = j.astype(np.int64) & 255
+    kk = k.astype(np.int64) & 255
+    total = np.zeros(len(points))
+    for di, dj, dk, cx, cy, cz in corners:
+        gradient = _GRADIENTS[perm[ii + di + perm[jj + dj + perm[kk + dk]]] % 12]
+        falloff = np.maximum(0.6 - cx * cx - cy * cy - cz * cz, 0.0)
+        total += falloff ** 4 * (gradient[:, 0] * cx + gradient[:, 1] * cy + gradient[:, 2] * cz)
+    return 32.0 * total
+
+
+def fbm3(points: np.ndarray, perm: np.ndarray, octaves: int = 5, persistence: float = 0.5,
+         lacunarity: float = 2.0) -> np.ndarray:
+    """
+    Sum octaves of simplex noise into fractal Brownian motion.
+
+    Args:
+        points (np.ndarray): Sample positions, shape (N, 3)
+        perm (np.ndarray): Table from permutation_table()
+        octaves (int): Number of octaves
+        persistence (float): Amplitude multiplier per octave
+        lacunarity (float): Frequency multiplier per octave
+
+    Returns:
+        np.ndarray: Values normalized by the total amplitude (roughly [-1, 1]), shape (N,)
+    """
+    total = np.zeros(len(points))
+    amplitude, frequency, norm = 1.0, 1.0, 0.0
+    for octave in range(octaves):
+        # Offset each octave so their lattices don't line up at the origin
+        total += amplitude * simplex3(points * frequency + 17.31 * octave, perm)
+        norm += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+    return total / norm if norm > 0 else total
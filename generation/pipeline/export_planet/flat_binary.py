@@ -0,0 +1,49 @@
+# generation/pipeline/export_planet/flat_binary.py
+
+from typing import List, Optional
+
+from generation.models.flat_file import save_flat
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from .base import BaseExportPlanetStrategy
+
+log = get_logger(__name__)
+
+
+class FlatBinaryExportStrategy(BaseExportPlanetStrategy):
+    def __init__(self, output_path: str, only_layers: Optional[List[str]] = None, store_topology: bool = True,
+                 store_vertices: bool = True, quantize: bool = False,
+                 tile_level: Optional[int] = None, preview_level: Optional[int] = None,
+                 thumbnail_width: int = 0, **layout_params):
+        """
+        Args:
+            output_path (str): Path of the flat binary file to write.
+            only_layers (Optional[List[str]]): Not supported; flat files are always written whole.
+            store_topology (bool): Store faces and adjacency of generated meshes.
+            store_vertices (bool): Store vertices and face centers of generated meshes.
+            quantize (bool): Store quantizable layer fields as integer codes.
+            tile_level (Optional[int]): Store a tile index for PlanetFile.read_region.
+            preview_level (Optional[int]): Subdivision level of the embedded preview; None or
+                negative writes no preview.
+            thumbnail_width (int): Width of the preview's thumbnail; 0 for none.
+            **layout_params: HDF5 chunking/compression settings from the export config. Flat
+                files store raw arrays, so these are ignored.
+        """
+        if only_layers is not None:
+            raise ValueError("The flat export strategy cannot update individual layers; use hdf5")
+        self.output_path = output_path
+        self.store_topology = store_topology
+        self.store_vertices = store_vertices
+        self.quantize = quantize
+        self.tile_level = tile_level
+        self.preview_level = preview_level if preview_level is not None and preview_level >= 0 else None
+        self.thumbnail_width = thumbnail_width
+        if layout_params:
+            log.debug("Flat export ignores storage layout settings: %s", ", ".join(sorted(layout_params)))
+
+    def run(self, planet: Planet) -> Planet:
+        log.info("Exporting memory-mappable planet to: %s", self.output_path)
+        save_flat(planet, self.output_path, self.store_topology, self.store_vertices, self.quantize,
+                  self.tile_level, self.preview_level, self.thumbnail_width)
+        log.info("Export complete.")
+        return planet
@@ -1,17 +1,59 @@
 # generation/pipeline/export_planet/hdf5_export.py
 
+from typing import Any, Dict, List, Optional
+
 from generation.models.planet import Planet
+from generation.models.storage import StorageLayout
 from shared.logging.logger import get_logger
+from .base import BaseExportPlanetStrategy
 
 log = get_logger(__name__)
 
 
-class HDF5ExportStrategy:
-    def __init__(self, output_path: str):
+class HDF5ExportStrategy(BaseExportPlanetStrategy):
+    def __init__(self, output_path: str, compression: str = "gzip", compression_level: int = 4,
+                 shuffle: bool = True, chunk_rows: int = 65536, topology: Optional[Dict[str, Any]] = None,
+                 geometry: Optional[Dict[str, Any]] = None, layers: Optional[Dict[str, Any]] = None,
+                 store_topology: bool = True, store_vertices: bool = True, quantize: bool = False,
+                 tile_level: Optional[int] = None, preview_level: Optional[int] = None, thumbnail_width: int = 0,
+                 only_layers: Optional[List[str]] = None):
+        """
+        Args:
+            output_path (str): Path of the .planetbin file to write.
+            compression (str): "gzip", "lzf" or "none" for every dataset class.
+            compression_level (int): gzip level, 0-9.
+            shuffle (bool): Apply the byte-shuffle filter before compressing.
+            chunk_rows (int): Rows per chunk; 0 writes contiguous, unfiltered datasets.
+            topology (Optional[Dict[str, Any]]): Layout overrides for connectivity datasets.
+            geometry (Optional[Dict[str, Any]]): Layout overrides for coordinate datasets.
+            layers (Optional[Dict[str, Any]]): Layout overrides for per-face stage layers.
+            store_topology (bool): Store faces and adjacency of generated meshes; False writes only
+                the mesh generator attributes and Planet.load rebuilds them.
+            store_vertices (bool): Store vertices and face centers of generated meshes.
+            quantize (bool): Store elevation, climate and ID fields as int16/uint16/uint8 codes
+                (lossy for floats); reads decode them transparently.
+            tile_level (Optional[int]): Chunk datasets along icosphere tiles of this level (0 = the 20
+                base faces) and store a tile index for PlanetFile.read_region; None disables tiling.
+            preview_level (Optional[int]): Subdivision level of the embedded preview planet; None
+                or negative writes no preview.
+            thumbnail_width (int): Width of the preview's equirectangular thumbnail; 0 for none.
+            only_layers (Optional[List[str]]): Write just these planet layers into the existing
+                file at output_path (incremental save); None writes the whole planet.
+        """
         self.output_path = output_path
+        self.only_layers = only_layers
+        self.layout = StorageLayout.from_params(
+            compression=compression, compression_level=compression_level, shuffle=shuffle,
+            chunk_rows=chunk_rows, store_topology=store_topology, store_vertices=store_vertices, quantize=quantize,
+            tile_level=tile_level, preview_level=preview_level, thumbnail_width=thumbnail_width, topology=topology, geometry=geometry, layers=layers,
+        )
 
     def run(self, planet: Planet) -> Planet:
-        log.info("Exporting planet to: %s", self.output_path)
-        planet.save(self.output_path)
+        if self.only_layers is None:
+            log.info("Exporting planet to: %s", self.output_path)
+        else:
+            log.info("Updating layers %s in: %s", ", ".join(self.only_layers) or "(none)", self.output_path)
+        log.debug("Storage layout: %s", self.layout)
+        planet.save(self.output_path, self.layout, layers=self.only_layers)
         log.info("Export complete.")
         return planet
@@ -0,0 +1,24 @@
+# generation/pipeline/generate_biomes/__init__.py
+
+"""
+Strategy loader for biome pipeline.
+"""
+
+from .base import GenerateBiomesStrategy
+from .whittaker import WhittakerBiomes
+
+
+def get_strategy(name: str, **kwargs) -> GenerateBiomesStrategy:
+    """
+    Load a biome strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "whittaker")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        GenerateBiomesStrategy: An instance of the selected strategy
+    """
+    if name == "whittaker":
+        return WhittakerBiomes(**kwargs)
+    raise ValueError(f"Unknown biome strategy: {name}")
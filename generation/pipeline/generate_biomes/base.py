@@ -0,0 +1,31 @@
+# generation/pipeline/generate_biomes/base.py
+
+"""
+Base interface for biome strategies.
+Each strategy takes a Planet with elevation and climate and returns it with a BiomeMap assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class GenerateBiomesStrategy(ABC):
+    """
+    Abstract base class for biome strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `biomes` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply biome classification logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with a biome map populated.
+        """
+        pass
@@ -0,0 +1,154 @@
+# generation/pipeline/generate_biomes/lookup_table.py
+
+"""
+Precomputed biome lookup table.
+
+A table is defined by bin edges on three axes (elevation relative to sea level, temperature,
+precipitation) and a dense array of biome ids with one cell per bin combination. Classifying
+any number of faces is three np.digitize calls and one fancy-index gather.
+
+Tables are plain JSON-compatible dicts:
+    {
+        "biomes": ["ocean", "tundra", ...],
+        "elevation_bins": [0.0, 3000.0],        # N edges -> N + 1 elevation bands
+        "temperature_bins": [-5.0, 20.0],       # °C
+        "precipitation_bins": [250.0, 1000.0],  # mm/yr
+        "bands": [...]                          # one entry per elevation band
+    }
+Each band is either a single biome name (covers every temperature/precipitation cell) or a
+2D list of names, rows by temperature bin and columns by precipitation bin.
+
+A custom table is a JSON file in this format, passed as the biomes `table_path`
+(--biome_table); json.dumps(DEFAULT_WHITTAKER_TABLE, indent=2) makes a starting point.
+DEFAULT_WHITTAKER_TABLE is the single definition of the built-in table.
+
+Elevation bands include their upper edge, so with an edge at 0.0 a face exactly at sea
+level falls in the band below it, matching the `elevation <= sea_level` water convention
+of the other stages.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+import numpy as np
+
+DEFAULT_WHITTAKER_TABLE: Dict[str, Any] = {
+    "biomes": [
+        "deep_ocean", "ocean", "ice", "polar_desert", "tundra", "cold_desert", "steppe", "taiga",
+        "desert", "grassland", "woodland", "temperate_forest", "temperate_rainforest",
+        "savanna", "tropical_seasonal_forest", "tropical_rainforest", "alpine",
+    ],
+    "elevation_bins": [-2000.0, 0.0, 3000.0],
+    "temperature_bins": [-15.0, -5.0, 3.0, 20.0],
+    "precipitation_bins": [250.0, 500.0, 1000.0, 2000.0],
+    "bands": [
+        "deep_ocean",
+        "ocean",
+        [
+            ["ice", "ice", "ice", "ice", "ice"],
+            ["polar_desert", "tundra", "tundra", "tundra", "tundra"],
+            ["cold_desert", "steppe", "taiga", "taiga", "taiga"],
+            ["desert", "grassland", "woodland", "temperate_forest", "temperate_rainforest"],
+            ["desert", "savanna", "savanna", "tropical_seasonal_forest", "tropical_rainforest"],
+        ],
+        [
+            ["ice", "ice", "ice", "ice", "ice"],
+            ["alpine", "alpine", "alpine", "alpine", "alpine"],
+            ["alpine", "alpine", "alpine", "alpine", "alpine"],
+            ["alpine", "alpine", "alpine", "alpine", "alpine"],
+            ["alpine", "alpine", "alpine", "alpine", "alpine"],
+        ],
+    ],
+}
+
+
+class BiomeLookupTable:
+    """
+    Dense (elevation, temperature, precipitation) -> biome id table with bin edges per axis.
+    """
+
+    def __init__(self, biomes: List[str], elevation_bins: List[float], temperature_bins: List[float],
+                 precipitation_bins: List[float], table: np.ndarray):
+        """
+        Args:
+            biomes (List[str]): Biome names; ids index into this list
+            elevation_bins (List[float]): Increasing elevation edges, meters above sea level
+            temperature_bins (List[float]): Increasing temperature edges (°C)
+            precipitation_bins (List[float]): Increasing precipitation edges (mm/yr)
+            table (np.ndarray): Biome ids, shape (len(elevation_bins) + 1, len(temperature_bins) + 1,
+                len(precipitation_bins) + 1)
+        """
+        self.biomes = list(biomes)
+        self.elevation_bins = np.asarray(elevation_bins, dtype=np.float64)
+        self.temperature_bins = np.asarray(temperature_bins, dtype=np.float64)
+        self.precipitation_bins = np.asarray(precipitation_bins, dtype=np.float64)
+        self.table = np.asarray(table, dtype=np.int16)
+
+        expected = (len(self.elevation_bins) + 1, len(self.temperature_bins) + 1, len(self.precipitation_bins) + 1)
+        if self.table.shape != expected:
+            raise ValueError(f"Biome table shape {self.table.shape} does not match bins {expected}")
+        for name, edges in (("elevation", self.elevation_bins), ("temperature", self.temperature_bins),
+                            ("precipitation", self.precipitation_bins)):
+            if np.any(np.diff(edges) <= 0):
+                raise ValueError(f"Biome {name} bins must be strictly increasing")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BiomeLookupTable":
+        """
+        Build a table from its JSON-compatible description (see module docstring).
+
+        Args:
+            data (Dict[str, Any]): Table description
+
+        Returns:
+            BiomeLookupTable: The expanded dense table
+        """
+        biomes = list(data["biomes"])
+        ids = {name: i for i, name in enumerate(biomes)}
+        shape = (len(data["temperature_bins"]) + 1, len(data["precipitation_bins"]) + 1)
+        if len(data["bands"]) != len(data["elevation_bins"]) + 1:
+            raise ValueError("Biome table needs one band per elevation bin")
+
+        slices = []
+        for band in data["bands"]:
+            names = np.full(shape, band, dtype=object) if isinstance(band, str) else np.asarray(band, dtype=object)
+            if names.shape != shape:
+                raise ValueError(f"Biome band shape {names.shape} does not match temperature x precipitation {shape}")
+            unknown = set(names.ravel()) - ids.keys()
+            if unknown:
+                raise ValueError(f"Unknown biome names in table: {sorted(unknown)}")
+            slices.append(np.vectorize(ids.__getitem__, otypes=[np.int16])(names))
+
+        return cls(biomes, data["elevation_bins"], data["temperature_bins"], data["precipitation_bins"],
+                   np.stack(slices))
+
+    @classmethod
+    def from_json(cls, path: str) -> "BiomeLookupTable":
+        """
+        Load a table description from a JSON file.
+
+        Args:
+            path (str): Path to the JSON file
+
+        Returns:
+            BiomeLookupTable: The expanded dense table
+        """
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def classify(self, elevation: np.ndarray, temperature: np.ndarray, precipitation: np.ndarray) -> np.ndarray:
+        """
+        Look up the biome id for every sample.
+
+        Args:
+            elevation (np.ndarray): Elevation above sea level (meters)
+            temperature (np.ndarray): Temperature (°C)
+            precipitation (np.ndarray): Precipitation (mm/yr)
+
+        Returns:
+            np.ndarray: Biome id per sample (int16)
+        """
+        # right=True: an elevation equal to an edge belongs to the band below (sea level is water)
+        e = np.digitize(elevation, self.elevation_bins, right=True)
+        t = np.digitize(temperature, self.temperature_bins)
+        p = np.digitize(precipitation, self.precipitation_bins)
+        return self.table[e, t, p]
@@ -0,0 +1,47 @@
+# generation/pipeline/generate_biomes/whittaker.py
+
+"""
+Biome strategy based on a Whittaker-style lookup table.
+
+Faces are classified by elevation band, temperature and precipitation through a dense
+BiomeLookupTable; the table can be replaced from JSON (file or inline config block).
+"""
+
+from typing import Any, Dict, Optional
+import numpy as np
+
+from generation.models.biomes import BiomeMap
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from .base import GenerateBiomesStrategy
+from .lookup_table import DEFAULT_WHITTAKER_TABLE, BiomeLookupTable
+
+log = get_logger(__name__)
+
+
+class WhittakerBiomes(GenerateBiomesStrategy):
+    def __init__(self, table_path: str = "", table: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            table_path (str): JSON file with a biome table; empty for the built-in Whittaker table.
+            table (Optional[Dict[str, Any]]): Inline table description, used when no path is given.
+        """
+        if table_path:
+            self.table = BiomeLookupTable.from_json(table_path)
+        else:
+            self.table = BiomeLookupTable.from_dict(table or DEFAULT_WHITTAKER_TABLE)
+
+    def run(self, planet: Planet) -> Planet:
+        if planet.elevation is None or planet.climate is None:
+            raise ValueError("Biome classification requires elevation and climate data")
+
+        log.info("[Biomes] Classifying faces with a %s lookup table...", "x".join(map(str, self.table.table.shape)))
+        altitude = np.asarray(planet.elevation.elevation) - planet.elevation.sea_level
+        biome_ids = self.table.classify(altitude, planet.climate.temperature, planet.climate.precipitation)
+        planet.biomes = BiomeMap(biome_ids=biome_ids, names=list(self.table.biomes))
+
+        counts = np.bincount(biome_ids, minlength=len(self.table.biomes))
+        top = np.argsort(counts)[::-1][:5]
+        log.info("[Biomes] Most common: %s",
+                 ", ".join(f"{self.table.biomes[i]} {100.0 * counts[i] / len(biome_ids):.1f}%" for i in top))
+        return planet
@@ -0,0 +1,24 @@
+# generation/pipeline/generate_elevation/__init__.py
+
+"""
+Strategy loader for elevation generation pipeline.
+"""
+
+from .base import GenerateElevationStrategy
+from .tectonic import TectonicElevationStrategy
+
+
+def get_strategy(name: str, **kwargs) -> GenerateElevationStrategy:
+    """
+    Load an elevation generation strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "tectonic")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        GenerateElevationStrategy: An instance of the selected strategy
+    """
+    if name == "tectonic":
+        return TectonicElevationStrategy(**kwargs)
+    raise ValueError(f"Unknown elevation strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/generate_elevation/base.py
+
+"""
+Base interface for elevation strategies.
+Each strategy takes a Planet with tectonic data and returns it with an ElevationMap assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class GenerateElevationStrategy(ABC):
+    """
+    Abstract base class for elevation generation strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `elevation` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply elevation generation logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with elevation data populated.
+        """
+        pass
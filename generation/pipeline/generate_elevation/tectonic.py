@@ -0,0 +1,135 @@
+# generation/pipeline/generate_elevation/tectonic.py
+
+"""
+Elevation strategy driven by plate tectonics.
+
+Per-face elevation is assembled from whole-mesh array kernels:
+- crustal base height: continental near cratons and along convergent margins, oceanic elsewhere
+- boundary relief: convergent uplift and divergent rifts/ridges, scaled by convergence rate and
+  falling off with distance to the nearest plate boundary
+- smoothing: repeated sparse neighbor-mean matrix products
+- detail: shared fBm terrain noise, strongest on land
+
+Distances come from vectorized multi-source BFS over the CSR face adjacency; there are no per-face loops.
+"""
+
+import numpy as np
+
+from generation.models.elevation import ElevationMap
+from generation.models.mesh import csr_bfs
+from generation.models.planet import Planet
+from generation.models.tectonics import BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT
+from generation.noise import SALT_TERRAIN, NoiseParams, face_noise
+from shared.logging.logger import get_logger
+from .base import GenerateElevationStrategy
+
+log = get_logger(__name__)
+
+
+class TectonicElevationStrategy(GenerateElevationStrategy):
+    def __init__(self, continent_height: float = 800.0, ocean_depth: float = -4000.0, shelf_width: float = 600.0,
+                 mountain_height: float = 4000.0, mountain_width: float = 400.0, ridge_height: float = 2000.0,
+                 rift_depth: float = 1500.0, smoothing_passes: int = 3, smoothing_strength: float = 0.5,
+                 sea_level: float = 0.0, noise_amplitude: float = 400.0, noise_frequency: float = 4.0):
+        """
+        Args:
+            continent_height (float): Base elevation of continental crust (meters).
+            ocean_depth (float): Base elevation of oceanic crust (meters, negative below sea level).
+            shelf_width (float): Distance from cratons at which continental crust gives way to ocean floor (km).
+            mountain_height (float): Peak uplift at the fastest convergent boundaries (meters).
+            mountain_width (float): Falloff width of boundary relief (km).
+            ridge_height (float): Uplift of oceanic spreading ridges at divergent boundaries (meters).
+            rift_depth (float): Depression of continental rifts at divergent boundaries (meters).
+            smoothing_passes (int): Number of sparse neighbor-mean smoothing passes.
+            smoothing_strength (float): Blend factor per smoothing pass, in [0, 1].
+            sea_level (float): Sea level recorded on the ElevationMap (meters).
+            noise_amplitude (float): Peak fBm terrain perturbation on land (meters); half that at sea.
+            noise_frequency (float): Base frequency of the terrain noise (features per planet radius).
+        """
+        self.continent_height = continent_height
+        self.ocean_depth = ocean_depth
+        self.shelf_width = shelf_width
+        self.mountain_height = mountain_height
+        self.mountain_width = mountain_width
+        self.ridge_height = ridge_height
+        self.rift_depth = rift_depth
+        self.smoothing_passes = smoothing_passes
+        self.smoothing_strength = smoothing_strength
+        self.sea_level = sea_level
+        self.noise_amplitude = noise_amplitude
+        self.noise_frequency = noise_frequency
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        plate_map = planet.plate_map
+        if mesh is None or plate_map is None or plate_map.boundary_edges is None:
+            raise ValueError("Tectonic elevation requires a mesh and a classified plate map")
+
+        log.info("[Elevation] Building tectonic elevation field...")
+        indptr, indices = mesh.adjacency_csr()
+        centers = mesh.centers()
+        edge_pairs = mesh.edge_pairs()
+
+        # Mean spacing between neighboring face centers converts hop counts into km
+        spacing = float(np.linalg.norm(centers[edge_pairs[:, 0]] - centers[edge_pairs[:, 1]], axis=1).mean())
+        log.debug("Mean face spacing: %.3f km", spacing)
+
+        # === Crustal base: continental near cratons, oceanic elsewhere ===
+        craton_faces = [c.face_ids for c in planet.cratons if c.face_ids is not None and len(c.face_ids)]
+        continental = np.zeros(len(mesh.faces))
+        if craton_faces:
+            craton_distance, _ = csr_bfs(indptr, indices, np.concatenate(craton_faces))
+            reachable = craton_distance >= 0
+            # Logistic falloff: full continental crust out to about shelf_width, then a steep slope
+            distance_km = craton_distance[reachable] * spacing
+            continental[reachable] = 1.0 / (1.0 + np.exp((distance_km - self.shelf_width) / (0.25 * self.shelf_width)))
+
+        # === Boundary relief: nearest boundary edge drives type and magnitude ===
+        relief = np.zeros(len(mesh.faces))
+        edges = plate_map.boundary_edges
+        if len(edges):
+            boundary_distance, origin = csr_bfs(indptr, indices, edges.ravel())
+            reachable = np.flatnonzero(boundary_distance >= 0)
+            nearest_edge = origin[reachable] // 2  # sources are (face_a, face_b) pairs flattened
+
+            # Relative speed normalized so the fastest 10% of boundaries reach full strength
+            convergence = plate_map.boundary_convergence[nearest_edge]
+            scale = np.percentile(np.abs(plate_map.boundary_convergence), 90)
+            strength = np.minimum(np.abs(convergence) / scale, 1.0) if scale > 0 else np.zeros_like(convergence)
+
+            distance_km = boundary_distance[reachable] * spacing
+            profile = np.exp(-(distance_km / self.mountain_width) ** 2) * strength
+            boundary_type = plate_map.boundary_types[nearest_edge]
+            is_convergent = boundary_type == BOUNDARY_CONVERGENT
+            is_divergent = boundary_type == BOUNDARY_DIVERGENT
+            convergent, divergent = reachable[is_convergent], reachable[is_divergent]
+
+            # Subduction and collision thicken the crust into continental arcs and orogens;
+            # ranges are highest where the crust is fully continental
+            continental[convergent] = np.maximum(continental[convergent], profile[is_convergent])
+            relief[convergent] = self.mountain_height * profile[is_convergent] * continental[convergent]
+
+            # Oceanic spreading ridges rise, continental rifts sink
+            land = continental[divergent]
+            relief[divergent] = profile[is_divergent] * (self.ridge_height * (1.0 - land) - self.rift_depth * land)
+
+        elevation = self.ocean_depth + (self.continent_height - self.ocean_depth) * continental + relief
+
+        # === Terrain detail from the shared noise field ===
+        if self.noise_amplitude:
+            noise = face_noise(mesh, planet.seed, NoiseParams(frequency=self.noise_frequency, salt=SALT_TERRAIN))
+            elevation = elevation + self.noise_amplitude * (0.5 + 0.5 * continental) * noise
+
+        # === Smoothing as sparse matrix products ===
+        neighbor_mean = mesh.neighbor_mean_operator()
+        for _ in range(self.smoothing_passes):
+            elevation = (1.0 - self.smoothing_strength) * elevation + self.smoothing_strength * (neighbor_mean @ elevation)
+
+        planet.elevation = ElevationMap(elevation=elevation, sea_level=self.sea_level)
+
+        land_fraction = float(np.mean(elevation > self.sea_level))
+        log.info(
+            "[Elevation] Elevation range %.0f m to %.0f m, %.1f%% above sea level.",
+            elevation.min(), elevation.max(), 100.0 * land_fraction,
+        )
+        return planet
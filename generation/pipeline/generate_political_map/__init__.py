@@ -0,0 +1,24 @@
+# generation/pipeline/generate_political_map/__init__.py
+
+"""
+Strategy loader for political map pipeline.
+"""
+
+from .base import GeneratePoliticalMapStrategy
+from .cost_flood import CostFloodPoliticalMap
+
+
+def get_strategy(name: str, **kwargs) -> GeneratePoliticalMapStrategy:
+    """
+    Load a political map strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "cost_flood")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        GeneratePoliticalMapStrategy: An instance of the selected strategy
+    """
+    if name == "cost_flood":
+        return CostFloodPoliticalMap(**kwargs)
+    raise ValueError(f"Unknown political map strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/generate_political_map/base.py
+
+"""
+Base interface for political map strategies.
+Each strategy takes a Planet with terrain layers and returns it with nations and a PoliticalMap assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class GeneratePoliticalMapStrategy(ABC):
+    """
+    Abstract base class for political map strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `nations` and `political_map` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply political map logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with nations and territories assigned.
+        """
+        pass
@@ -0,0 +1,164 @@
+# generation/pipeline/generate_political_map/cost_flood.py
+
+"""
+Political map strategy: competitive flood fill over a terrain travel-cost field.
+
+- Capitals are placed on the most habitable land, spaced apart by great-circle distance
+- Each face-to-face step costs its length scaled by biome difficulty and steepness
+- One multi-source Dijkstra from all capitals at once gives every face its cheapest-reaching
+  nation (scipy's csgraph implementation, so the heap pass runs in compiled code)
+- Nation territories are cut from face_to_nation with one argsort and split
+"""
+
+from typing import Dict, List, Optional
+import colorsys
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import dijkstra
+
+from generation.models.mesh import MeshData
+from generation.models.planet import Planet
+from generation.models.politics import Nation, PoliticalMap
+from shared.logging.logger import get_logger
+from .base import GeneratePoliticalMapStrategy
+
+log = get_logger(__name__)
+
+# Relative cost of crossing one km of each biome; biomes not listed cost 1.0
+DEFAULT_BIOME_COSTS: Dict[str, float] = {
+    "deep_ocean": 40.0, "ocean": 20.0, "ice": 15.0, "polar_desert": 8.0, "alpine": 8.0,
+    "desert": 6.0, "tundra": 5.0, "cold_desert": 5.0, "tropical_rainforest": 4.0, "taiga": 3.0,
+    "tropical_seasonal_forest": 3.0, "temperate_rainforest": 2.5, "temperate_forest": 2.0,
+    "steppe": 1.5, "savanna": 1.5, "woodland": 1.5, "grassland": 1.0,
+}
+
+
+def split_territories(face_to_nation: np.ndarray, num_nations: int) -> List[np.ndarray]:
+    """
+    Group face indices by owning nation with one stable argsort.
+
+    Args:
+        face_to_nation (np.ndarray): Nation index per face (-1 for unclaimed)
+        num_nations (int): Number of nations
+
+    Returns:
+        List[np.ndarray]: Sorted face indices per nation
+    """
+    order = np.argsort(face_to_nation, kind="stable")
+    bounds = np.searchsorted(face_to_nation[order], np.arange(num_nations + 1))
+    return [order[bounds[i]:bounds[i + 1]] for i in range(num_nations)]
+
+
+class CostFloodPoliticalMap(GeneratePoliticalMapStrategy):
+    def __init__(self, nation_count: int = 12, min_capital_spacing: float = 1500.0, ocean_cost: float = 20.0,
+                 slope_weight: float = 50.0, biome_costs: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            nation_count (int): Number of nations (capitals) to place.
+            min_capital_spacing (float): Minimum great-circle distance between capitals (km).
+            ocean_cost (float): Travel cost multiplier of water when no biome map is present.
+            slope_weight (float): Cost added per unit grade (m/m) of a step.
+            biome_costs (Optional[Dict[str, float]]): Travel cost multiplier per biome name.
+        """
+        self.nation_count = nation_count
+        self.min_capital_spacing = min_capital_spacing
+        self.ocean_cost = ocean_cost
+        self.slope_weight = slope_weight
+        self.biome_costs = dict(DEFAULT_BIOME_COSTS if biome_costs is None else biome_costs)
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        if mesh is None or planet.elevation is None:
+            raise ValueError("Political map generation requires a mesh and an elevation map")
+        if self.nation_count < 1:
+            raise ValueError(f"Political map generation requires at least one nation (nation_count={self.nation_count})")
+
+        log.info("[Politics] Placing %d capitals and flooding territories...", self.nation_count)
+        elevation = np.asarray(planet.elevation.elevation, dtype=np.float64)
+        land = elevation > planet.elevation.sea_level
+        if not land.any():
+            raise ValueError("Political map generation requires land")
+
+        face_cost = self._face_cost(planet, land)
+        rng = np.random.default_rng(planet.seed)
+        capitals = self._place_capitals(mesh, land, face_cost, rng)
+
+        # === Multi-source Dijkstra from every capital at once ===
+        graph = self._travel_graph(mesh, np.maximum(elevation, planet.elevation.sea_level), face_cost)
+        travel_cost, _, nearest = dijkstra(graph, directed=True, indices=capitals,
+                                           min_only=True, return_predecessors=True)
+
+        # `nearest` holds the winning capital's face index; map it to a nation index
+        nation_of_capital = np.full(len(elevation), -1, dtype=np.int64)
+        nation_of_capital[capitals] = np.arange(len(capitals))
+        face_to_nation = np.where(nearest >= 0, nation_of_capital[np.maximum(nearest, 0)], -1)
+        face_to_nation[~land] = -1  # nations extend across straits but claim only land
+
+        planet.political_map = PoliticalMap(face_to_nation=face_to_nation, travel_cost=travel_cost)
+        planet.nations = self._build_nations(mesh, capitals, face_to_nation)
+
+        sizes = [len(n.territory) for n in planet.nations]
+        log.info("[Politics] %d nations, territory sizes %d-%d faces, %.1f%% of land unclaimed.",
+                 len(planet.nations), min(sizes), max(sizes), 100.0 * np.mean(face_to_nation[land] < 0))
+        return planet
+
+    def _face_cost(self, planet: Planet, land: np.ndarray) -> np.ndarray:
+        """Return the per-km travel cost multiplier of each face."""
+        if planet.biomes is not None and planet.biomes.names is not None:
+            by_id = np.array([self.biome_costs.get(name, 1.0) for name in planet.biomes.names])
+            return by_id[planet.biomes.biome_ids]
+        return np.where(land, 1.0, self.ocean_cost)
+
+    def _place_capitals(self, mesh: MeshData, land: np.ndarray, face_cost: np.ndarray,
+                        rng: np.random.Generator) -> np.ndarray:
+        """
+        Pick capitals one at a time: the best randomly-jittered habitable land face that is at
+        least min_capital_spacing from every earlier capital. Each pick is one vectorized pass.
+        """
+        centers = mesh.centers()
+        radius = float(np.linalg.norm(centers, axis=1).mean())
+        unit = centers / np.linalg.norm(centers, axis=1, keepdims=True)
+        min_cos = np.cos(self.min_capital_spacing / radius) if radius > 0 else 1.0
+
+        score = np.where(land, rng.random(len(land)) / face_cost, -np.inf)
+        capitals = []
+        for _ in range(self.nation_count):
+            best = int(np.argmax(score))
+            if not np.isfinite(score[best]):
+                log.warning("[Politics] Only %d capitals fit at %.0f km spacing.",
+                            len(capitals), self.min_capital_spacing)
+                break
+            capitals.append(best)
+            # Exclude everything within the spacing radius of the new capital
+            score[unit @ unit[best] > min_cos] = -np.inf
+        return np.array(capitals, dtype=np.int64)
+
+    def _travel_graph(self, mesh: MeshData, surface: np.ndarray, face_cost: np.ndarray) -> sp.csr_matrix:
+        """Build the directed CSR graph of step costs between neighboring faces."""
+        indptr, indices = mesh.adjacency_csr()
+        centers = mesh.centers()
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+        length_km = np.linalg.norm(centers[rows] - centers[indices], axis=1)
+        grade = np.abs(surface[rows] - surface[indices]) / np.maximum(length_km * 1000.0, 1e-9)
+        cost = length_km * 0.5 * (face_cost[rows] + face_cost[indices]) * (1.0 + self.slope_weight * grade)
+        # csgraph treats explicit zeros as missing edges
+        cost = np.maximum(cost, 1e-9)
+        return sp.csr_matrix((cost, indices, indptr), shape=(len(indptr) - 1, len(indptr) - 1))
+
+    @staticmethod
+    def _build_nations(mesh: MeshData, capitals: np.ndarray, face_to_nation: np.ndarray) -> List[Nation]:
+        """Create Nation records with territories split out of face_to_nation."""
+        territories = split_territories(face_to_nation, len(capitals))
+        areas = mesh.face_areas()
+        nations = []
+        for i, (capital, territory) in enumerate(zip(capitals.tolist(), territories)):
+            # Evenly spaced hues give each nation a distinct display color
+            color = colorsys.hsv_to_rgb(i / max(len(capitals), 1), 0.6, 0.9)
+            nations.append(Nation(
+                name=f"Nation {i + 1}",
+                capital=capital,
+                territory=territory,
+                metadata={"color": list(color), "area": float(areas[territory].sum())},
+            ))
+        return nations
@@ -0,0 +1,24 @@
+# generation/pipeline/populate_regions/__init__.py
+
+"""
+Strategy loader for region pipeline.
+"""
+
+from .base import PopulateRegionsStrategy
+from .connected_components import ConnectedComponentRegions
+
+
+def get_strategy(name: str, **kwargs) -> PopulateRegionsStrategy:
+    """
+    Load a region strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "connected_components")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        PopulateRegionsStrategy: An instance of the selected strategy
+    """
+    if name == "connected_components":
+        return ConnectedComponentRegions(**kwargs)
+    raise ValueError(f"Unknown region strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/populate_regions/base.py
+
+"""
+Base interface for region strategies.
+Each strategy takes a Planet with terrain layers and returns it with a RegionMap assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class PopulateRegionsStrategy(ABC):
+    """
+    Abstract base class for region strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `regions` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply region labeling logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with a region map populated.
+        """
+        pass
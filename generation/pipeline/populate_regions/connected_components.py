@@ -0,0 +1,128 @@
+# generation/pipeline/populate_regions/connected_components.py
+
+"""
+Region strategy based on connected components of categorical face layers.
+
+- "landmass": land/ocean components, named as continents, islands, oceans and seas
+- "biome": contiguous patches of the same biome (when biomes exist)
+
+Components come from the array-based union-find in generation.models.mesh; per-component
+face counts, areas and centroids are single np.bincount passes.
+"""
+
+from typing import Dict, Any
+import numpy as np
+
+from generation.models.mesh import MeshData, label_components
+from generation.models.planet import Planet
+from generation.models.regions import RegionLayer, RegionMap
+from shared.logging.logger import get_logger
+from .base import PopulateRegionsStrategy
+
+log = get_logger(__name__)
+
+
+def build_region_layer(mesh: MeshData, classes: np.ndarray) -> RegionLayer:
+    """
+    Label the connected components of a per-face categorical layer and measure them.
+
+    Args:
+        mesh (MeshData): Mesh providing the edge table, face areas and centroids
+        classes (np.ndarray): Category per face; neighbors join only when their categories match
+
+    Returns:
+        RegionLayer: Component ids and per-component statistics
+    """
+    num_faces = len(mesh.faces)
+    face_to_region = label_components(num_faces, mesh.edge_pairs(), classes)
+    num_regions = int(face_to_region.max()) + 1 if num_faces else 0
+
+    areas = mesh.face_areas()
+    face_counts = np.bincount(face_to_region, minlength=num_regions)
+    region_areas = np.bincount(face_to_region, weights=areas, minlength=num_regions)
+
+    # Area-weighted mean position, pushed back out to the sphere's radius
+    centers = mesh.centers()
+    weighted = np.stack(
+        [np.bincount(face_to_region, weights=areas * centers[:, k], minlength=num_regions) for k in range(3)],
+        axis=1,
+    )
+    radius = float(np.linalg.norm(centers, axis=1).mean()) if num_faces else 0.0
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    centroids = np.where(norms > 0, weighted / np.where(norms > 0, norms, 1.0) * radius, 0.0)
+
+    # Every face in a component shares a class, so any member's class will do
+    first_face = np.full(num_regions, num_faces, dtype=np.int64)
+    np.minimum.at(first_face, face_to_region, np.arange(num_faces))
+
+    return RegionLayer(
+        face_to_region=face_to_region,
+        region_class=np.asarray(classes)[first_face],
+        face_counts=face_counts,
+        areas=region_areas,
+        centroids=centroids,
+    )
+
+
+class ConnectedComponentRegions(PopulateRegionsStrategy):
+    def __init__(self, continent_min_area: float = 3e6, ocean_min_area: float = 1e7, min_named_faces: int = 10):
+        """
+        Args:
+            continent_min_area (float): Landmasses at least this large (km²) are continents, smaller ones islands.
+            ocean_min_area (float): Water bodies at least this large (km²) are oceans, smaller ones seas.
+            min_named_faces (int): Landmass components with fewer faces stay unnamed (layer data only).
+        """
+        self.continent_min_area = continent_min_area
+        self.ocean_min_area = ocean_min_area
+        self.min_named_faces = min_named_faces
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        if mesh is None or planet.elevation is None:
+            raise ValueError("Region labeling requires a mesh and an elevation map")
+
+        log.info("[Regions] Labeling connected regions...")
+        land = np.asarray(planet.elevation.elevation) > planet.elevation.sea_level
+        layers = {"landmass": build_region_layer(mesh, land.astype(np.int8))}
+        if planet.biomes is not None:
+            layers["biome"] = build_region_layer(mesh, np.asarray(planet.biomes.biome_ids))
+
+        planet.regions = RegionMap(named_regions=self._name_landmasses(layers["landmass"]), layers=layers)
+
+        log.info(
+            "[Regions] %s; %d named regions.",
+            ", ".join(f"{name}: {layer.num_regions} components" for name, layer in layers.items()),
+            len(planet.regions.named_regions),
+        )
+        return planet
+
+    def _name_landmasses(self, layer: RegionLayer) -> Dict[str, Any]:
+        """
+        Name the larger land and water components, biggest first within each type.
+
+        Args:
+            layer (RegionLayer): The landmass layer (class 1 = land, 0 = water)
+
+        Returns:
+            Dict[str, Any]: Region name -> metadata
+        """
+        named = {}
+        counters = {}
+        for region in np.argsort(-layer.areas, kind="stable"):
+            if layer.face_counts[region] < self.min_named_faces:
+                continue
+            area = float(layer.areas[region])
+            if layer.region_class[region]:
+                kind = "continent" if area >= self.continent_min_area else "island"
+            else:
+                kind = "ocean" if area >= self.ocean_min_area else "sea"
+            counters[kind] = counters.get(kind, 0) + 1
+            named[f"{kind.title()} {counters[kind]}"] = {
+                "type": kind,
+                "layer": "landmass",
+                "region_id": int(region),
+                "area": area,
+                "face_count": int(layer.face_counts[region]),
+                "centroid": layer.centroids[region].tolist(),
+            }
+        return named
@@ -0,0 +1,57 @@
+# generation/pipeline/provenance.py
+"""
+Stage provenance for planet layers.
+
+Every pipeline stage records which Planet layers it produced, under its stage key and a
+hash of its resolved parameters. Planet.save stores the record next to each layer, so a
+file can tell which stage run wrote it, and an incremental save can write just the layers
+of the stage that was re-run.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Tuple
+
+from generation.models.planet import Planet
+
+# Stage key -> Planet layers it writes
+STAGE_LAYERS: Dict[str, Tuple[str, ...]] = {
+    "mesh": ("mesh",),
+    "craton_seeding": ("cratons",),
+    "plate_motion": ("plates", "plate_map"),
+    "elevation": ("elevation",),
+    "drainage": ("drainage",),
+    "erosion": ("elevation", "drainage"),
+    "climate": ("climate",),
+    "biomes": ("biomes",),
+    "regions": ("regions",),
+    "political_map": ("political_map", "nations"),
+}
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """
+    Hash a resolved parameter dict, independent of key order.
+
+    Args:
+        params (Dict[str, Any]): Parameters as returned by resolve_stage_params
+
+    Returns:
+        str: Hex digest
+    """
+    encoded = json.dumps(params, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def record_provenance(planet: Planet, stage_key: str, params: Dict[str, Any]):
+    """
+    Mark the layers written by a stage with the stage key and its parameter hash.
+
+    Args:
+        planet (Planet): The planet the stage just updated
+        stage_key (str): Stage key (see STAGE_LAYERS)
+        params (Dict[str, Any]): The stage's resolved parameters, including its strategy
+    """
+    digest = params_hash(params)
+    for layer in STAGE_LAYERS[stage_key]:
+        planet.provenance[layer] = {"stage": stage_key, "params_hash": digest}
@@ -0,0 +1,40 @@
+# generation/pipeline/run_biomes.py
+"""
+Pipeline stage: Biome classification.
+Applies the configured biome strategy to classify every face into a biome.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import BIOMES_PARAMS
+from generation.pipeline.generate_biomes import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_biomes(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Classify per-face biomes using the configured biome strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with a biome map
+    """
+    logger.info("[Pipeline] Running biome stage...")
+
+    params = resolve_stage_params("biomes", BIOMES_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using biome strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "biomes", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Biome classification complete.")
+    return planet
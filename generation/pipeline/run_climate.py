@@ -0,0 +1,40 @@
+# generation/pipeline/run_climate.py
+"""
+Pipeline stage: Climate simulation.
+Applies the configured climate strategy to derive per-face temperature and precipitation.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import CLIMATE_PARAMS
+from generation.pipeline.simulate_climate import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_climate(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Simulate per-face climate using the configured climate strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with climate data
+    """
+    logger.info("[Pipeline] Running climate stage...")
+
+    params = resolve_stage_params("climate", CLIMATE_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using climate strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "climate", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Climate simulation complete.")
+    return planet
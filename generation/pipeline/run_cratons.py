@@ -9,6 +9,7 @@ from shared.logging.logger import get_logger
 from generation.cli.parameter_merge import resolve_stage_params
 from generation.cli.constants import CRATON_PARAMS
 from generation.pipeline.seed_cratons import get_strategy
+from generation.pipeline.provenance import record_provenance
 
 logger = get_logger(__name__)
 
@@ -33,6 +34,7 @@ def run_cratons(planet: Planet, config, cli_args: dict) -> Planet:
 
     strategy = get_strategy(strategy_name, **params)
     planet = strategy.run(planet)
+    record_provenance(planet, "craton_seeding", {"strategy": strategy_name, **params})
 
     logger.info("[Pipeline] Craton seeding complete. Seeded %d cratons.", len(planet.cratons))
     return planet
@@ -0,0 +1,40 @@
+# generation/pipeline/run_drainage.py
+"""
+Pipeline stage: Drainage routing.
+Applies the configured drainage strategy to fill depressions and route flow between faces.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import DRAINAGE_PARAMS
+from generation.pipeline.simulate_drainage import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_drainage(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Route per-face drainage using the configured drainage strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with a drainage map
+    """
+    logger.info("[Pipeline] Running drainage stage...")
+
+    params = resolve_stage_params("drainage", DRAINAGE_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using drainage strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "drainage", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Drainage routing complete.")
+    return planet
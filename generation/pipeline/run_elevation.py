@@ -0,0 +1,40 @@
+# generation/pipeline/run_elevation.py
+"""
+Pipeline stage: Elevation generation.
+Applies the configured elevation strategy to turn tectonic data into per-face elevation.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import ELEVATION_PARAMS
+from generation.pipeline.generate_elevation import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_elevation(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Generate per-face elevation using the configured elevation strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with an elevation map
+    """
+    logger.info("[Pipeline] Running elevation stage...")
+
+    params = resolve_stage_params("elevation", ELEVATION_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using elevation strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "elevation", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Elevation generation complete.")
+    return planet
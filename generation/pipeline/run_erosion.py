@@ -0,0 +1,40 @@
+# generation/pipeline/run_erosion.py
+"""
+Pipeline stage: Erosion simulation.
+Applies the configured erosion strategy to wear down terrain with rivers and hillslope creep.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import EROSION_PARAMS
+from generation.pipeline.simulate_erosion import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_erosion(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Erode the terrain using the configured erosion strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with eroded elevation and rerouted drainage
+    """
+    logger.info("[Pipeline] Running erosion stage...")
+
+    params = resolve_stage_params("erosion", EROSION_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using erosion strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "erosion", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Erosion simulation complete.")
+    return planet
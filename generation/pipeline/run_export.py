@@ -1,33 +1,131 @@
 # generation/pipeline/run_export.py
 """
 Pipeline stage: Planet export.
-Saves the final planet to disk using the configured output path.
+Saves the final planet to disk using the configured output path and export strategy.
+
+With the export `background` setting ("thread" or "process") the file is written by a
+worker while the caller carries on, e.g. generating the next planet of a batch. The planet
+is snapshotted first, and run_export returns a Future that resolves when the file is
+complete (or raises the export's exception). wait_for_exports() blocks until every
+background export has finished and re-raises the first failure.
+
+h5py holds the GIL while compressing, so "thread" only overlaps with work that releases it
+(numpy, I/O); "process" overlaps with anything, at the cost of pickling the planet across.
 """
 
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from shared.logging.logger import get_logger
+from shared.config.planet_gen_config import PlanetGenConfig
 from generation.models.planet import Planet
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import EXPORT_PARAMS
+from generation.pipeline.export_planet import get_strategy
+from generation.pipeline.export_planet.base import BaseExportPlanetStrategy
 
 logger = get_logger(__name__)
 
+BACKGROUND_MODES = ("none", "thread", "process")
+
+# Exports written or queued at once; further submissions wait, so a fast batch cannot pile
+# up unbounded planet snapshots in memory
+MAX_PENDING_EXPORTS = 2
 
-def run_export(planet: Planet, output_path: str | None) -> None:
+# One single-worker executor per background mode, so exports land in submission order
+_executors: dict[str, Executor] = {}
+_pending: list[Future] = []
+
+
+def run_export(planet: Planet, output_path: str | None, config: PlanetGenConfig | None = None,
+               cli_args: dict | None = None, layers: list[str] | None = None) -> Future | None:
     """
     Export the planet object to disk.
 
     Args:
         planet (Planet): Planet model to serialize
         output_path (str | None): Path to save .planetbin file. If None, skip export.
+        config (PlanetGenConfig | None): Configuration object (its `export` block sets the file layout)
+        cli_args (dict | None): CLI argument overrides
+        layers (list[str] | None): Only write these layers into the existing file (incremental save)
+
+    Returns:
+        Future | None: In background mode, a future resolving to output_path once the file is
+        written; None when the export ran synchronously or was skipped
     """
     if not output_path:
         logger.info("[Pipeline] No output path provided. Skipping export.")
-        return
+        return None
 
     logger.info("[Pipeline] Exporting planet to: %s", output_path)
 
-    try:
-        planet.save(Path(output_path))
-        logger.info("[Pipeline] Planet export complete.")
-    except Exception as e:
-        logger.error("[Pipeline] Failed to export planet: %s", e)
-        raise
+    params = resolve_stage_params("export", EXPORT_PARAMS, cli_args or {}, config or PlanetGenConfig())
+    strategy_name = params.pop("strategy")
+    background = params.pop("background")
+    logger.debug("Using export strategy: %s", strategy_name)
+    if background not in BACKGROUND_MODES:
+        raise ValueError(f"Unknown export background mode: {background} (expected one of {', '.join(BACKGROUND_MODES)})")
+
+    if layers is not None:
+        params["only_layers"] = list(layers)
+    # Built up front so bad settings fail here rather than inside the worker
+    strategy = get_strategy(strategy_name, output_path=str(Path(output_path)), **params)
+
+    if background == "none":
+        try:
+            _export(strategy, planet)
+            logger.info("[Pipeline] Planet export complete.")
+        except Exception as e:
+            logger.error("[Pipeline] Failed to export planet: %s", e)
+            raise
+        return None
+
+    _throttle()
+    future = _executor(background).submit(_export, strategy, planet.snapshot())
+    future.add_done_callback(lambda done: _log_outcome(output_path, done))
+    _pending.append(future)
+    logger.info("[Pipeline] Planet export to %s continues in the background (%s).", output_path, background)
+    return future
+
+
+def wait_for_exports() -> None:
+    """
+    Block until every background export has finished.
+
+    Raises:
+        Exception: The first failed export's exception, after all of them have completed
+    """
+    futures = list(_pending)
+    _pending.clear()
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def _export(strategy: BaseExportPlanetStrategy, planet: Planet) -> str:
+    strategy.run(planet)
+    return strategy.output_path
+
+
+def _executor(mode: str) -> Executor:
+    if mode not in _executors:
+        if mode == "thread":
+            _executors[mode] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="planet-export")
+        else:
+            _executors[mode] = ProcessPoolExecutor(max_workers=1)
+    return _executors[mode]
+
+
+def _throttle() -> None:
+    """Wait for the oldest exports until fewer than MAX_PENDING_EXPORTS are outstanding."""
+    outstanding = [future for future in _pending if not future.done()]
+    while len(outstanding) >= MAX_PENDING_EXPORTS:
+        outstanding.pop(0).exception()
+
+
+def _log_outcome(output_path: str, future: Future) -> None:
+    error = future.exception()
+    if error is None:
+        logger.info("[Pipeline] Background export to %s complete.", output_path)
+    else:
+        logger.error("[Pipeline] Background export to %s failed: %s", output_path, error)
@@ -9,6 +9,7 @@ from shared.logging.logger import get_logger
 from generation.cli.parameter_merge import resolve_stage_params
 from generation.cli.constants import MESH_PARAMS
 from generation.pipeline.generate_mesh import get_strategy
+from generation.pipeline.provenance import record_provenance
 
 logger = get_logger(__name__)
 
@@ -33,6 +34,9 @@ def run_mesh(planet: Planet, config, cli_args: dict) -> Planet:
 
     strategy = get_strategy(strategy_name)
     planet = strategy.run(planet)
+    # The mesh depends on the planet's size and resolution, not only on the mesh parameters
+    record_provenance(planet, "mesh", {"strategy": strategy_name, **params, "radius": planet.radius,
+                                       "subdivision_level": planet.subdivision_level})
 
     logger.info("[Pipeline] Mesh generation complete.")
     return planet
@@ -0,0 +1,40 @@
+# generation/pipeline/run_plate_motion.py
+"""
+Pipeline stage: Plate motion.
+Grows tectonic plates from cratons, assigns Euler-pole motion, and classifies plate boundaries.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import PLATE_MOTION_PARAMS
+from generation.pipeline.simulate_plate_motion import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_plate_motion(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Simulate plate growth and motion using the configured plate motion strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with plates and plate map
+    """
+    logger.info("[Pipeline] Running plate motion stage...")
+
+    params = resolve_stage_params("plate_motion", PLATE_MOTION_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using plate motion strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "plate_motion", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Plate motion complete. Created %d plates.", len(planet.plates))
+    return planet
@@ -0,0 +1,40 @@
+# generation/pipeline/run_political_map.py
+"""
+Pipeline stage: Political map generation.
+Applies the configured political map strategy to found nations and divide land between them.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import POLITICAL_MAP_PARAMS
+from generation.pipeline.generate_political_map import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_political_map(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Assign nations and territories using the configured political map strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with nations and a political map
+    """
+    logger.info("[Pipeline] Running political map stage...")
+
+    params = resolve_stage_params("political_map", POLITICAL_MAP_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using political map strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "political_map", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Political map generation complete.")
+    return planet
@@ -0,0 +1,40 @@
+# generation/pipeline/run_regions.py
+"""
+Pipeline stage: Region labeling.
+Applies the configured region strategy to label continents, oceans and biome patches.
+"""
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.cli.constants import REGIONS_PARAMS
+from generation.pipeline.populate_regions import get_strategy
+from generation.pipeline.provenance import record_provenance
+
+logger = get_logger(__name__)
+
+
+def run_regions(planet: Planet, config, cli_args: dict) -> Planet:
+    """
+    Label connected regions using the configured region strategy.
+
+    Args:
+        planet (Planet): The planet model to update
+        config (PlanetGenConfig): Configuration object
+        cli_args (dict): CLI argument overrides
+
+    Returns:
+        Planet: Updated planet with a region map
+    """
+    logger.info("[Pipeline] Running region stage...")
+
+    params = resolve_stage_params("regions", REGIONS_PARAMS, cli_args, config)
+    strategy_name = params.pop("strategy")
+    logger.debug("Using region strategy: %s", strategy_name)
+
+    strategy = get_strategy(strategy_name, **params)
+    planet = strategy.run(planet)
+    record_provenance(planet, "regions", {"strategy": strategy_name, **params})
+
+    logger.info("[Pipeline] Region labeling complete.")
+    return planet
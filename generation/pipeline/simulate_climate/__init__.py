@@ -0,0 +1,24 @@
+# generation/pipeline/simulate_climate/__init__.py
+
+"""
+Strategy loader for climate pipeline.
+"""
+
+from .base import SimulateClimateStrategy
+from .wind_advection import WindAdvectionClimate
+
+
+def get_strategy(name: str, **kwargs) -> SimulateClimateStrategy:
+    """
+    Load a climate strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "wind_advection")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        SimulateClimateStrategy: An instance of the selected strategy
+    """
+    if name == "wind_advection":
+        return WindAdvectionClimate(**kwargs)
+    raise ValueError(f"Unknown climate strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/simulate_climate/base.py
+
+"""
+Base interface for climate strategies.
+Each strategy takes a Planet with elevation and returns it with ClimateData assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class SimulateClimateStrategy(ABC):
+    """
+    Abstract base class for climate strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `climate` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply climate simulation logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with climate data populated.
+        """
+        pass
@@ -0,0 +1,117 @@
+# generation/pipeline/simulate_climate/operators.py
+
+"""
+Mesh-only inputs to the climate solver.
+
+Latitudes, prevailing winds and the sparse upwind transport operator depend on the mesh
+geometry alone, never on the seed or terrain. They are built once with whole-array kernels
+and kept in a small cache keyed by the mesh fingerprint, so re-running climate for another
+seed on the same mesh skips straight to the solve.
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+import numpy as np
+import scipy.sparse as sp
+
+from generation.models.mesh import MeshData
+from shared.logging.logger import get_logger
+
+log = get_logger(__name__)
+
+# Transport operators kept across planets, keyed by (mesh fingerprint, mixing)
+_OPERATOR_CACHE: "OrderedDict[Tuple[str, float], sp.csr_matrix]" = OrderedDict()
+OPERATOR_CACHE_SIZE = 4
+
+
+def face_latitudes(mesh: MeshData) -> np.ndarray:
+    """
+    Return the latitude of each face centroid in radians (z axis = rotation axis).
+
+    Args:
+        mesh (MeshData): The planet mesh
+
+    Returns:
+        np.ndarray: Latitude per face, in [-pi/2, pi/2]
+    """
+    def build():
+        centers = mesh.centers()
+        radius = np.linalg.norm(centers, axis=1)
+        return np.arcsin(np.clip(centers[:, 2] / np.where(radius > 0, radius, 1.0), -1.0, 1.0))
+    return mesh.cached("latitudes", build)
+
+
+def prevailing_wind(centers: np.ndarray) -> np.ndarray:
+    """
+    Return the prevailing surface wind at each point from a three-cell circulation model.
+
+    Trade winds (0-30°) blow west and toward the equator, westerlies (30-60°) east and
+    poleward, polar easterlies (60-90°) west and toward the equator. Speed peaks mid-cell and
+    falls to zero at the cell edges (doldrums, horse latitudes, polar front).
+
+    Args:
+        centers (np.ndarray): Points on the sphere, shape (M, 3)
+
+    Returns:
+        np.ndarray: Tangent wind vectors with magnitude in [0, 1], shape (M, 3)
+    """
+    radial = centers / np.linalg.norm(centers, axis=1, keepdims=True)
+    east = np.cross([0.0, 0.0, 1.0], radial)
+    east_norm = np.linalg.norm(east, axis=1, keepdims=True)
+    # Points on the axis have no east; any tangent works there because the wind vanishes
+    east = np.where(east_norm > 1e-12, east / np.where(east_norm > 1e-12, east_norm, 1.0), [1.0, 0.0, 0.0])
+    north = np.cross(radial, east)
+
+    latitude = np.arcsin(np.clip(radial[:, 2], -1.0, 1.0))
+    # sin(6|lat|) is +1 mid-trades, -1 mid-westerlies, +1 mid-polar-easterlies
+    cell = np.sin(6.0 * np.abs(latitude))[:, None]
+    hemisphere = np.sign(latitude)[:, None]
+    return cell * (-east - 0.3 * hemisphere * north)
+
+
+def upwind_operator(mesh: MeshData, mixing: float = 0.2) -> sp.csr_matrix:
+    """
+    Return the row-stochastic transport operator T, where (T @ q)[i] is the quantity q carried
+    into face i by the prevailing wind in one step.
+
+    Each face draws from the neighbors upwind of it, weighted by how well the neighbor-to-face
+    direction aligns with the local wind, blended with a plain neighbor mean (`mixing`) that
+    stands in for eddy diffusion. Faces with no upwind neighbor use the neighbor mean alone.
+
+    Args:
+        mesh (MeshData): The planet mesh
+        mixing (float): Share of the neighbor mean in every row, in [0, 1]
+
+    Returns:
+        sp.csr_matrix: Sparse (M, M) operator
+    """
+    key = (mesh.fingerprint(), float(mixing))
+    if key in _OPERATOR_CACHE:
+        _OPERATOR_CACHE.move_to_end(key)
+        return _OPERATOR_CACHE[key]
+
+    indptr, indices = mesh.adjacency_csr()
+    centers = mesh.centers()
+    num_faces = len(indptr) - 1
+    rows = np.repeat(np.arange(num_faces), np.diff(indptr))
+
+    # Direction each neighbor -> face step points, against the wind at the receiving face
+    step = centers[rows] - centers[indices]
+    step /= np.maximum(np.linalg.norm(step, axis=1, keepdims=True), 1e-12)
+    wind = prevailing_wind(centers)
+    alignment = np.maximum(np.einsum("ij,ij->i", step, wind[rows]), 0.0)
+
+    row_total = np.bincount(rows, weights=alignment, minlength=num_faces)
+    has_upwind = row_total > 0
+    upwind_weight = np.where(has_upwind[rows], alignment / np.where(row_total > 0, row_total, 1.0)[rows], 0.0)
+
+    share = np.where(has_upwind, 1.0 - mixing, 0.0)
+    mean_weight = np.repeat(1.0 / np.maximum(np.diff(indptr), 1), np.diff(indptr))
+    weights = share[rows] * upwind_weight + (1.0 - share[rows]) * mean_weight
+    operator = sp.csr_matrix((weights, indices, indptr), shape=(num_faces, num_faces))
+
+    _OPERATOR_CACHE[key] = operator
+    while len(_OPERATOR_CACHE) > OPERATOR_CACHE_SIZE:
+        _OPERATOR_CACHE.popitem(last=False)
+    log.debug("Built upwind transport operator for mesh %s (%d faces)", key[0], num_faces)
+    return operator
@@ -0,0 +1,127 @@
+# generation/pipeline/simulate_climate/wind_advection.py
+
+"""
+Climate strategy: latitude/elevation temperature and wind-advected precipitation.
+
+- Temperature falls from equator to pole with cos(latitude) and with altitude by a lapse rate
+- Oceans evaporate moisture (more where warm); prevailing winds carry it inland with the
+  cached upwind operator, and a share rains out at every step, more so where air is forced uphill
+- Circulation bands modulate rainout: wet ITCZ and mid-latitude storm tracks, dry subtropics
+- A shared fBm field adds regional temperature anomalies and patchier rainfall
+
+The moisture solve is a fixed number of sparse matrix-vector products, enough for moisture to
+cross `transport_distance` km, so cost scales with faces x (distance / face spacing).
+"""
+
+import numpy as np
+
+from generation.models.climate import ClimateData
+from generation.models.planet import Planet
+from generation.noise import SALT_CLIMATE, NoiseParams, face_noise
+from shared.logging.logger import get_logger
+from .base import SimulateClimateStrategy
+from .operators import face_latitudes, upwind_operator
+
+log = get_logger(__name__)
+
+
+def rainout_band(latitude: np.ndarray) -> np.ndarray:
+    """
+    Return the latitude-dependent rainout multiplier of the three-cell circulation.
+
+    Args:
+        latitude (np.ndarray): Latitude in radians
+
+    Returns:
+        np.ndarray: Multiplier around 1: >1 near the equator and 55-60°, <1 near 25-30°
+    """
+    degrees = np.degrees(np.abs(latitude))
+    itcz = 1.2 * np.exp(-(degrees / 10.0) ** 2)
+    storm_track = 0.6 * np.exp(-((degrees - 55.0) / 12.0) ** 2)
+    subtropical_high = 0.7 * np.exp(-((degrees - 27.0) / 8.0) ** 2)
+    return np.maximum(1.0 + itcz + storm_track - subtropical_high, 0.05)
+
+
+class WindAdvectionClimate(SimulateClimateStrategy):
+    def __init__(self, equator_temperature: float = 27.0, pole_temperature: float = -25.0,
+                 lapse_rate: float = 6.5, ocean_evaporation: float = 1200.0, rainout_length: float = 1500.0,
+                 orographic_strength: float = 0.2, land_recycling: float = 0.4,
+                 transport_distance: float = 4000.0, mixing: float = 0.2, temperature_noise: float = 2.0,
+                 precipitation_noise: float = 0.3):
+        """
+        Args:
+            equator_temperature (float): Mean sea-level temperature at the equator (°C).
+            pole_temperature (float): Mean sea-level temperature at the poles (°C).
+            lapse_rate (float): Cooling with altitude (°C per km).
+            ocean_evaporation (float): Evaporation from 25 °C open ocean (mm/yr).
+            rainout_length (float): Distance over which moving air loses ~63% of its moisture (km).
+            orographic_strength (float): Extra rainout per m/km of uphill gradient along the wind.
+            land_recycling (float): Fraction of rain over land that re-evaporates into the air.
+            transport_distance (float): Furthest distance moisture is followed from its source (km).
+            mixing (float): Share of plain neighbor averaging in the transport operator.
+            temperature_noise (float): Amplitude of regional temperature anomalies (°C).
+            precipitation_noise (float): Relative amplitude of rainout variation, in [0, 1).
+        """
+        self.equator_temperature = equator_temperature
+        self.pole_temperature = pole_temperature
+        self.lapse_rate = lapse_rate
+        self.ocean_evaporation = ocean_evaporation
+        self.rainout_length = rainout_length
+        self.orographic_strength = orographic_strength
+        self.land_recycling = land_recycling
+        self.transport_distance = transport_distance
+        self.mixing = mixing
+        self.temperature_noise = temperature_noise
+        self.precipitation_noise = precipitation_noise
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        if mesh is None or planet.elevation is None:
+            raise ValueError("Climate requires a mesh and an elevation map")
+
+        log.info("[Climate] Solving temperature and precipitation...")
+        elevation = np.asarray(planet.elevation.elevation, dtype=np.float64)
+        sea_level = planet.elevation.sea_level
+        ocean = elevation <= sea_level
+        altitude = np.maximum(elevation - sea_level, 0.0)
+        latitude = face_latitudes(mesh)
+
+        # === Temperature ===
+        temperature = self.pole_temperature + (self.equator_temperature - self.pole_temperature) * np.cos(latitude)
+        temperature = temperature - self.lapse_rate * altitude / 1000.0
+        noise = face_noise(mesh, planet.seed, NoiseParams(frequency=3.0, octaves=4, salt=SALT_CLIMATE))
+        temperature = temperature + self.temperature_noise * noise
+
+        # === Moisture sources: ocean, ~7% more evaporation per °C, sea ice cuts it to a fifth ===
+        evaporation = self.ocean_evaporation * np.exp(0.07 * (temperature - 25.0))
+        evaporation = np.where(temperature > -2.0, evaporation, 0.2 * evaporation)
+        source = np.where(ocean, evaporation, 0.0)
+
+        # === Rainout fraction per step ===
+        transport = upwind_operator(mesh, self.mixing)
+        edges = mesh.edge_pairs()
+        centers = mesh.centers()
+        spacing = float(np.linalg.norm(centers[edges[:, 0]] - centers[edges[:, 1]], axis=1).mean())
+        uplift = np.maximum(altitude - transport @ altitude, 0.0) / spacing  # meters rise per km
+        rate = spacing / self.rainout_length * rainout_band(latitude) * (1.0 + self.orographic_strength * uplift)
+        rate = rate * (1.0 + self.precipitation_noise * noise)
+        rainout = 1.0 - np.exp(-rate)
+        # Rain over land partly re-evaporates and stays in the moving air
+        retained = 1.0 - rainout * np.where(ocean, 1.0, 1.0 - self.land_recycling)
+
+        # === Moisture transport: moisture = source + T @ (moisture * retained) ===
+        steps = max(1, int(np.ceil(self.transport_distance / spacing)))
+        moisture = source / np.maximum(rainout, 1e-6)
+        for _ in range(steps):
+            moisture = source + transport @ (moisture * retained)
+        precipitation = rainout * moisture
+
+        planet.climate = ClimateData(temperature=temperature, precipitation=precipitation)
+
+        land = ~ocean
+        log.info(
+            "[Climate] %d transport steps; temperature %.1f to %.1f °C, land precipitation median %.0f mm/yr.",
+            steps, temperature.min(), temperature.max(),
+            float(np.median(precipitation[land])) if land.any() else 0.0,
+        )
+        return planet
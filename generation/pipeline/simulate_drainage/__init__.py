@@ -0,0 +1,24 @@
+# generation/pipeline/simulate_drainage/__init__.py
+
+"""
+Strategy loader for drainage pipeline.
+"""
+
+from .base import SimulateDrainageStrategy
+from .priority_flood import PriorityFloodDrainage
+
+
+def get_strategy(name: str, **kwargs) -> SimulateDrainageStrategy:
+    """
+    Load a drainage strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "priority_flood")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        SimulateDrainageStrategy: An instance of the selected strategy
+    """
+    if name == "priority_flood":
+        return PriorityFloodDrainage(**kwargs)
+    raise ValueError(f"Unknown drainage strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/simulate_drainage/base.py
+
+"""
+Base interface for drainage strategies.
+Each strategy takes a Planet with elevation and returns it with a DrainageMap assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class SimulateDrainageStrategy(ABC):
+    """
+    Abstract base class for drainage strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `drainage` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply drainage routing logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with drainage data populated.
+        """
+        pass
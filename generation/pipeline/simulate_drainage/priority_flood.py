@@ -0,0 +1,54 @@
+# generation/pipeline/simulate_drainage/priority_flood.py
+
+"""
+Drainage strategy built on priority-flood depression filling.
+
+- Ocean faces are outlets; land faces are flooded inward from the shoreline in one heap pass
+- Every land face then routes to its steepest downhill neighbor on the filled surface
+- Upstream area is accumulated in topological batches of the receiver forest, in O(n)
+
+The heap loop is the only per-face Python work; receiver selection is a vectorized
+pass over the CSR adjacency. Nothing recurses, so depth of the drainage tree is unbounded.
+"""
+
+import numpy as np
+
+from generation.models.planet import Planet
+from shared.logging.logger import get_logger
+from .base import SimulateDrainageStrategy
+from .routing import route_drainage
+
+log = get_logger(__name__)
+
+
+class PriorityFloodDrainage(SimulateDrainageStrategy):
+    def __init__(self, epsilon: float = 1e-3):
+        """
+        Args:
+            epsilon (float): Minimum drop (meters) imposed across filled depressions so that
+                every filled face keeps a strictly downhill route to an outlet.
+        """
+        self.epsilon = epsilon
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        if mesh is None or planet.elevation is None:
+            raise ValueError("Drainage requires a mesh and an elevation map")
+
+        log.info("[Drainage] Filling depressions and routing flow...")
+        elevation = np.asarray(planet.elevation.elevation, dtype=np.float64)
+        if len(elevation) != len(mesh.faces):
+            raise ValueError("Drainage requires per-face elevation")
+
+        # Flow is contributing area in km², so it reads as drainage basin size
+        drainage = route_drainage(mesh, elevation, planet.elevation.sea_level, epsilon=self.epsilon)
+        planet.drainage = drainage
+
+        filled, flow = drainage.filled_elevation, drainage.flow
+        outlets = np.flatnonzero(drainage.receivers == np.arange(len(elevation)))
+        raised = filled > elevation
+        log.info(
+            "[Drainage] %d outlets, %d faces raised by depression filling (max %.1f m), largest basin %.0f km².",
+            len(outlets), int(raised.sum()), float((filled - elevation).max()), float(flow.max()),
+        )
+        return planet
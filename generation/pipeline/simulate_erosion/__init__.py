@@ -0,0 +1,24 @@
+# generation/pipeline/simulate_erosion/__init__.py
+
+"""
+Strategy loader for erosion pipeline.
+"""
+
+from .base import SimulateErosionStrategy
+from .stream_power import StreamPowerErosion
+
+
+def get_strategy(name: str, **kwargs) -> SimulateErosionStrategy:
+    """
+    Load an erosion strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "stream_power")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        SimulateErosionStrategy: An instance of the selected strategy
+    """
+    if name == "stream_power":
+        return StreamPowerErosion(**kwargs)
+    raise ValueError(f"Unknown erosion strategy: {name}")
@@ -0,0 +1,31 @@
+# generation/pipeline/simulate_erosion/base.py
+
+"""
+Base interface for erosion strategies.
+Each strategy takes a Planet with elevation and drainage and returns it with the elevation eroded.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class SimulateErosionStrategy(ABC):
+    """
+    Abstract base class for erosion strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `elevation` (and `drainage`) updated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply erosion logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with eroded elevation.
+        """
+        pass
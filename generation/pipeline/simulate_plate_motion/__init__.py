@@ -0,0 +1,24 @@
+# generation/pipeline/simulate_plate_motion/__init__.py
+
+"""
+Strategy loader for plate motion pipeline.
+"""
+
+from .base import SimulatePlateMotionStrategy
+from .euler_pole import EulerPolePlateMotion
+
+
+def get_strategy(name: str, **kwargs) -> SimulatePlateMotionStrategy:
+    """
+    Load a plate motion strategy by name.
+
+    Args:
+        name (str): The strategy name (e.g. "euler_pole")
+        **kwargs: Parameters for the strategy constructor
+
+    Returns:
+        SimulatePlateMotionStrategy: An instance of the selected strategy
+    """
+    if name == "euler_pole":
+        return EulerPolePlateMotion(**kwargs)
+    raise ValueError(f"Unknown plate motion strategy: {name}")
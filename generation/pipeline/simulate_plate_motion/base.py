@@ -0,0 +1,31 @@
+# generation/pipeline/simulate_plate_motion/base.py
+
+"""
+Base interface for plate motion strategies.
+Each strategy takes a Planet with seeded cratons and returns it with plates and a plate map assigned.
+"""
+
+from abc import ABC, abstractmethod
+from generation.models.planet import Planet
+
+
+class SimulatePlateMotionStrategy(ABC):
+    """
+    Abstract base class for plate motion strategies.
+
+    Subclasses must implement the `run()` method, which takes a Planet
+    and returns a modified Planet with `plates` and `plate_map` populated.
+    """
+
+    @abstractmethod
+    def run(self, planet: Planet) -> Planet:
+        """
+        Apply plate growth and motion logic to the provided Planet instance.
+
+        Args:
+            planet (Planet): The planet to modify.
+
+        Returns:
+            Planet: The modified planet with plate data populated.
+        """
+        pass
@@ -0,0 +1,129 @@
+# generation/pipeline/simulate_plate_motion/euler_pole.py
+
+"""
+Plate motion strategy based on rigid Euler-pole rotation.
+
+Grows one plate per craton until the whole surface is covered (the earliest claimed
+faces of each plate become its craton region), gives each plate an Euler pole and
+angular velocity, then classifies every plate boundary edge as convergent, divergent
+or transform from the plates' relative surface velocity.
+"""
+
+import math
+import numpy as np
+
+from generation.models.planet import Planet
+from generation.models.tectonics import (
+    Plate, PlateMap, BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT, BOUNDARY_TRANSFORM,
+)
+from generation.noise import SALT_PLATE_GROWTH, NoiseParams, face_noise
+from shared.logging.logger import get_logger
+from .base import SimulatePlateMotionStrategy
+from .growth import grow_plates
+from .kinematics import random_euler_poles, boundary_edges, classify_boundaries
+
+log = get_logger(__name__)
+
+
+class EulerPolePlateMotion(SimulatePlateMotionStrategy):
+    def __init__(self, min_angular_velocity: float = 0.1, max_angular_velocity: float = 1.0,
+                 transform_threshold: float = 0.5, min_growth_rate: float = 0.3, craton_fraction: float = 0.2,
+                 growth_noise: float = 0.5):
+        """
+        Args:
+            min_angular_velocity (float): Slowest plate rotation in degrees per million years.
+            max_angular_velocity (float): Fastest plate rotation in degrees per million years.
+            transform_threshold (float): Fraction of relative speed below which the boundary-normal
+                component is considered transform motion.
+            min_growth_rate (float): Lower bound of the per-plate claim probability; lower values
+                produce more uneven plate sizes.
+            craton_fraction (float): Fraction of the growth iterations whose claims form each
+                plate's craton region.
+            growth_noise (float): How strongly a coherent noise field slows growth into some faces,
+                in [0, 1); roughens plate outlines. 0 disables it.
+        """
+        self.min_angular_velocity = min_angular_velocity
+        self.max_angular_velocity = max_angular_velocity
+        self.transform_threshold = transform_threshold
+        self.min_growth_rate = min_growth_rate
+        self.craton_fraction = craton_fraction
+        self.growth_noise = growth_noise
+
+    def run(self, planet: Planet) -> Planet:
+        mesh = planet.mesh
+        if mesh is None:
+            raise ValueError("Plate motion requires a generated mesh")
+        if not planet.cratons:
+            raise ValueError("Plate motion requires seeded cratons")
+
+        rng = np.random.default_rng(planet.seed)
+        indptr, indices = mesh.adjacency_csr()
+        centers = mesh.centers()
+
+        # === Grow one plate per craton ===
+        log.info("[Plate Motion] Growing %d plates from craton seeds...", len(planet.cratons))
+        seeds = np.array([c.center_index for c in planet.cratons], dtype=np.int64)
+        growth_rates = rng.uniform(self.min_growth_rate, 1.0, size=len(seeds))
+        face_weights = None
+        if self.growth_noise > 0:
+            noise = face_noise(mesh, planet.seed, NoiseParams(frequency=3.0, octaves=4, salt=SALT_PLATE_GROWTH))
+            face_weights = 1.0 - self.growth_noise * 0.5 * (np.clip(noise, -1.0, 1.0) + 1.0)
+        face_to_plate, claim_order = grow_plates(indptr, indices, seeds, growth_rates, rng, face_weights)
+
+        unclaimed = int(np.count_nonzero(face_to_plate < 0))
+        if unclaimed:
+            log.warning("%d faces were unreachable from any craton and remain unassigned.", unclaimed)
+
+        # === Craton regions: the faces claimed during the earliest growth iterations ===
+        craton_rounds = int(np.ceil(self.craton_fraction * claim_order.max()))
+        core = np.flatnonzero((claim_order >= 0) & (claim_order <= craton_rounds))
+        core = core[np.argsort(face_to_plate[core], kind="stable")]
+        splits = np.searchsorted(face_to_plate[core], np.arange(1, len(seeds)))
+        for craton, face_ids in zip(planet.cratons, np.split(core, splits)):
+            craton.face_ids = face_ids
+        log.debug("Craton regions cover growth iterations 0-%d (%d faces).", craton_rounds, len(core))
+
+        # === Assign Euler poles ===
+        poles, rates = random_euler_poles(
+            rng, len(seeds),
+            math.radians(self.min_angular_velocity),
+            math.radians(self.max_angular_velocity),
+        )
+        rotation_vectors = poles * rates[:, None]
+
+        # Motion direction at each plate's seed face, kept for overlays and quick inspection
+        seed_velocity = np.cross(rotation_vectors, centers[seeds])
+        seed_speed = np.linalg.norm(seed_velocity, axis=1, keepdims=True)
+        motion_vectors = np.divide(seed_velocity, seed_speed, out=np.zeros_like(seed_velocity), where=seed_speed > 0)
+
+        planet.plates = [
+            Plate(
+                id=i,
+                craton_ids=[craton.id],
+                motion_vector=motion_vectors[i],
+                euler_pole=poles[i],
+                angular_velocity=float(rates[i]),
+            )
+            for i, craton in enumerate(planet.cratons)
+        ]
+
+        # === Classify boundaries ===
+        edges = boundary_edges(face_to_plate, mesh.edge_pairs())
+        edges = edges[(face_to_plate[edges] >= 0).all(axis=1)]
+        types, convergence = classify_boundaries(
+            edges, face_to_plate, rotation_vectors, centers, self.transform_threshold
+        )
+        planet.plate_map = PlateMap(
+            face_to_plate=face_to_plate,
+            boundary_edges=edges,
+            boundary_types=types,
+            boundary_convergence=convergence,
+            claim_order=claim_order,
+        )
+
+        counts = np.bincount(types, minlength=3)
+        log.info(
+            "[Plate Motion] %d boundary edges: %d convergent, %d divergent, %d transform.",
+            len(edges), counts[BOUNDARY_CONVERGENT], counts[BOUNDARY_DIVERGENT], counts[BOUNDARY_TRANSFORM],
+        )
+        return planet
@@ -0,0 +1,117 @@
+# generation/pipeline/simulate_plate_motion/kinematics.py
+
+"""
+Vectorized rigid-plate kinematics on a sphere.
+
+Every plate rotates about its own Euler pole, so the surface velocity of plate k at
+position r is omega_k x r. Boundary edges are classified from the relative velocity
+of the two plates at the edge midpoint:
+
+- convergent: plates approach each other across the boundary
+- divergent: plates separate across the boundary
+- transform: relative motion is mostly parallel to the boundary
+
+All functions operate on whole edge arrays at once; there are no per-edge Python loops.
+"""
+
+from typing import Tuple
+import numpy as np
+
+from generation.models.tectonics import BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT, BOUNDARY_TRANSFORM
+
+
+def random_euler_poles(rng: np.random.Generator, count: int, min_rate: float, max_rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw uniformly distributed Euler poles and angular velocities.
+
+    Args:
+        rng (np.random.Generator): Seeded random generator
+        count (int): Number of plates
+        min_rate (float): Minimum angular velocity (radians per million years)
+        max_rate (float): Maximum angular velocity (radians per million years)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Unit poles (count, 3) and angular velocities (count,)
+    """
+    # Normalized Gaussian samples are uniform on the unit sphere
+    poles = rng.normal(size=(count, 3))
+    poles /= np.linalg.norm(poles, axis=1, keepdims=True)
+    rates = rng.uniform(min_rate, max_rate, size=count)
+    return poles, rates
+
+
+def boundary_edges(face_to_plate: np.ndarray, edge_pairs: np.ndarray) -> np.ndarray:
+    """
+    Select the face-face edges that separate two different plates.
+
+    Args:
+        face_to_plate (np.ndarray): Plate ID per face, shape (M,)
+        edge_pairs (np.ndarray): Undirected face edges, shape (E, 2)
+
+    Returns:
+        np.ndarray: Boundary edges, shape (B, 2)
+    """
+    plates = face_to_plate[edge_pairs]
+    return edge_pairs[plates[:, 0] != plates[:, 1]]
+
+
+def relative_boundary_velocity(edges: np.ndarray, face_to_plate: np.ndarray, rotation_vectors: np.ndarray,
+                               centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the velocity of plate B relative to plate A at every boundary edge.
+
+    Args:
+        edges (np.ndarray): Boundary edges (face_a, face_b), shape (B, 2)
+        face_to_plate (np.ndarray): Plate ID per face, shape (M,)
+        rotation_vectors (np.ndarray): Angular velocity vector per plate, shape (P, 3)
+        centers (np.ndarray): Face centroids, shape (M, 3)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Edge midpoints (B, 3) and relative velocities (B, 3)
+    """
+    midpoints = 0.5 * (centers[edges[:, 0]] + centers[edges[:, 1]])
+    # (omega_b - omega_a) x r in one batched cross product
+    relative_omega = rotation_vectors[face_to_plate[edges[:, 1]]] - rotation_vectors[face_to_plate[edges[:, 0]]]
+    return midpoints, np.cross(relative_omega, midpoints)
+
+
+def classify_boundaries(edges: np.ndarray, face_to_plate: np.ndarray, rotation_vectors: np.ndarray,
+                        centers: np.ndarray, transform_threshold: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify boundary edges as convergent, divergent or transform.
+
+    Args:
+        edges (np.ndarray): Boundary edges (face_a, face_b), shape (B, 2)
+        face_to_plate (np.ndarray): Plate ID per face, shape (M,)
+        rotation_vectors (np.ndarray): Angular velocity vector per plate, shape (P, 3)
+        centers (np.ndarray): Face centroids, shape (M, 3)
+        transform_threshold (float): Edges whose normal velocity is below this fraction of
+            the total relative speed are classified as transform
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: BOUNDARY_* codes (B,) as int8 and convergence rates (B,),
+        positive where the plates approach each other
+    """
+    midpoints, v_rel = relative_boundary_velocity(edges, face_to_plate, rotation_vectors, centers)
+
+    # Boundary normal: direction from face A to face B, projected onto the tangent plane
+    radial = _safe_normalize(midpoints)
+    crossing = centers[edges[:, 1]] - centers[edges[:, 0]]
+    crossing -= np.einsum("ij,ij->i", crossing, radial)[:, None] * radial
+    normal = _safe_normalize(crossing)
+
+    # Positive normal velocity means B moves away from A (divergence)
+    normal_speed = np.einsum("ij,ij->i", v_rel, normal)
+    total_speed = np.linalg.norm(v_rel, axis=1)
+
+    types = np.full(len(edges), BOUNDARY_TRANSFORM, dtype=np.int8)
+    dominant = np.abs(normal_speed) > transform_threshold * total_speed
+    types[dominant & (normal_speed < 0)] = BOUNDARY_CONVERGENT
+    types[dominant & (normal_speed > 0)] = BOUNDARY_DIVERGENT
+    return types, -normal_speed
+
+
+def _safe_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Normalize rows to unit length, leaving zero-length rows as zeros."""
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
@@ -0,0 +1,257 @@
+# generation/pipeline/stage_cache.py
+"""
+Content-addressed cache of pipeline stage results.
+
+Each stage run gets a key hashing everything its output depends on: the stage key, its
+resolved parameters (resolve_stage_params, strategy included), the contents of files those
+parameters point to (FILE_PARAMS), the key of the stage before it, the planet's seed, radius
+and subdivision level, and the generation code version. Since keys chain through their
+upstream key, a stage's key changes exactly when it or anything before it would compute
+something different.
+
+After a stage runs, its layers (STAGE_LAYERS) are written to `<directory>/<key>.planetbin`,
+a planet file holding just those layers. generate() computes every key up front, restores
+the longest run of leading stages found in the cache and only runs the rest, so changing
+the craton settings reuses the cached mesh and editing the biome table file resumes at biomes.
+
+The directory is bounded by `max_bytes`: after each store the least recently used entries
+(by mtime, which a cache hit refreshes) are deleted until it fits again.
+"""
+
+from functools import lru_cache
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import h5py
+
+from generation.cli.constants import (
+    BIOMES_PARAMS, CACHE_PARAMS, CLIMATE_PARAMS, CRATON_PARAMS, DRAINAGE_PARAMS, ELEVATION_PARAMS,
+    EROSION_PARAMS, MESH_PARAMS, PLATE_MOTION_PARAMS, POLITICAL_MAP_PARAMS, REGIONS_PARAMS,
+)
+from generation.cli.parameter_merge import resolve_stage_params
+from generation.models.planet import Planet
+from generation.models.planet_file import PlanetFile
+from generation.models.planet_layers import write_layers
+from generation.models.storage import StorageLayout
+from generation.pipeline.provenance import STAGE_LAYERS, params_hash
+from shared.config.planet_gen_config import PlanetGenConfig
+from shared.logging.logger import get_logger
+
+log = get_logger(__name__)
+
+ENTRY_SUFFIX = ".planetbin"
+
+# Stage key -> parameter schema, as resolved by the stage runners
+STAGE_PARAMS: Dict[str, dict] = {
+    "mesh": MESH_PARAMS,
+    "craton_seeding": CRATON_PARAMS,
+    "plate_motion": PLATE_MOTION_PARAMS,
+    "elevation": ELEVATION_PARAMS,
+    "drainage": DRAINAGE_PARAMS,
+    "erosion": EROSION_PARAMS,
+    "climate": CLIMATE_PARAMS,
+    "biomes": BIOMES_PARAMS,
+    "regions": REGIONS_PARAMS,
+    "political_map": POLITICAL_MAP_PARAMS,
+}
+
+# Stage key -> parameters naming input files; the files' contents go into the stage key
+FILE_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "biomes": ("table_path",),
+}
+
+# Entries are written once and read soon after: favor speed over size, keep full meshes
+# so a hit never regenerates one, and skip the preview
+ENTRY_LAYOUT = StorageLayout.from_params(compression="lzf")
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Hash of the generation package's source files.
+
+    Any edit to the generation code yields new cache keys, so stale results are never reused;
+    unchanged code run from another checkout location still hits.
+
+    Returns:
+        str: Hex digest
+    """
+    root = Path(__file__).resolve().parents[1]
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(root.rglob("*.py")):
+        digest.update(source.relative_to(root).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Hash a parameter file's contents.
+
+    Args:
+        path (str): File named by a stage parameter
+
+    Returns:
+        Optional[str]: Hex digest, or None if the file cannot be read (the stage itself
+        reports that when it runs)
+    """
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def stage_keys(stages: Sequence[str], planet: Planet, config: PlanetGenConfig, stage_args: dict) -> List[str]:
+    """
+    Compute the chained cache key of every stage.
+
+    Args:
+        stages (Sequence[str]): Stage keys in pipeline order
+        planet (Planet): The new planet (seed, radius and subdivision level are used)
+        config (PlanetGenConfig): Main config
+        stage_args (dict): Per-stage CLI overrides, as returned by parse_args
+
+    Returns:
+        List[str]: One hex key per stage
+    """
+    keys, upstream = [], None
+    for stage in stages:
+        params = resolve_stage_params(stage, STAGE_PARAMS[stage], stage_args.get(stage, {}), config)
+        upstream = params_hash({
+            "stage": stage,
+            "params": params,
+            "files": {name: file_digest(params[name]) for name in FILE_PARAMS.get(stage, ()) if params.get(name)},
+            "upstream": upstream,
+            "seed": planet.seed,
+            "radius": planet.radius,
+            "subdivision_level": planet.subdivision_level,
+            "code_version": code_version(),
+        })
+        keys.append(upstream)
+    return keys
+
+
+class StageCache:
+    def __init__(self, directory: Union[str, Path], max_bytes: int):
+        """
+        Args:
+            directory (Union[str, Path]): Cache directory, created if missing
+            max_bytes (int): Size the entries are trimmed to after each store
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).is_file()
+
+    def cached_prefix(self, keys: Sequence[str]) -> int:
+        """Number of leading stages whose entries are all cached."""
+        count = 0
+        while count < len(keys) and keys[count] in self:
+            count += 1
+        return count
+
+    def restore(self, planet: Planet, stages: Sequence[str], keys: Sequence[str]) -> Planet:
+        """
+        Fill a planet with the cached output of a run of leading stages.
+
+        Each layer comes from the last of the stages that writes it (erosion's elevation
+        replaces the elevation stage's), together with its provenance.
+
+        Args:
+            planet (Planet): The new planet
+            stages (Sequence[str]): Stage keys, in pipeline order
+            keys (Sequence[str]): Their cache keys, all present in the cache
+
+        Returns:
+            Planet: The planet with the stages' layers set
+
+        Raises:
+            OSError: If an entry cannot be read; the entry is deleted first
+        """
+        sources = {layer: key for stage, key in zip(stages, keys) for layer in STAGE_LAYERS[stage]}
+        for key in dict.fromkeys(sources.values()):
+            path = self.path(key)
+            try:
+                with PlanetFile(path) as entry:
+                    for layer in (name for name, source in sources.items() if source == key):
+                        setattr(planet, layer, getattr(entry, layer))
+                        if layer in entry.provenance:
+                            planet.provenance[layer] = dict(entry.provenance[layer])
+            except Exception as e:
+                path.unlink(missing_ok=True)
+                raise OSError(f"Unreadable stage cache entry {path}: {e}") from e
+            os.utime(path)   # mark as recently used
+        return planet
+
+    def store(self, key: str, planet: Planet, stage: str):
+        """
+        Save a stage's layers under its key, then evict entries beyond the size limit.
+
+        Args:
+            key (str): The stage's cache key
+            planet (Planet): Planet right after the stage ran
+            stage (str): Stage key (see STAGE_LAYERS)
+        """
+        path = self.path(key)
+        partial = path.with_suffix(".partial")
+        with h5py.File(partial, "w") as f:
+            f.attrs["radius"] = planet.radius
+            f.attrs["subdivision_level"] = planet.subdivision_level
+            f.attrs["seed"] = planet.seed
+            write_layers(f, planet, STAGE_LAYERS[stage], ENTRY_LAYOUT)
+        # Readers never see a half-written entry
+        os.replace(partial, path)
+        self.evict(keep=path)
+
+    def entries(self) -> List[Path]:
+        """Cache entries, least recently used first."""
+        return sorted(self.directory.glob(f"*{ENTRY_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+
+    def size(self) -> int:
+        """Total bytes of all entries."""
+        return sum(path.stat().st_size for path in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            keep (Optional[Path]): Entry never deleted, e.g. the one just stored
+
+        Returns:
+            int: Number of entries deleted
+        """
+        entries = self.entries()
+        total = sum(path.stat().st_size for path in entries)
+        removed = 0
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            removed += 1
+        if removed:
+            log.debug("Evicted %d stage cache entries from %s", removed, self.directory)
+        return removed
+
+
+def open_stage_cache(config: PlanetGenConfig, cli_args: dict) -> Optional[StageCache]:
+    """
+    Open the stage cache configured by the "cache" block and CLI overrides.
+
+    Returns:
+        Optional[StageCache]: The cache, or None when no directory is set
+    """
+    params = resolve_stage_params("cache", CACHE_PARAMS, cli_args, config)
+    if not params["directory"]:
+        return None
+    return StageCache(params["directory"], params["max_size_mb"] * 1024 * 1024)
@@ -0,0 +1,102 @@
+# tvg2/scripts/benchmark_storage.py
+# ---------------------------------------------------
+# Benchmark .planetbin storage layouts.
+#
+# Generates a planet (mesh, cratons, plate motion) once, then saves and
+# reloads it with each chunking/compression setting and prints file size,
+# write/read throughput and the time of a small face-range read.
+#
+# Usage:
+#   python -m scripts.benchmark_storage --subdivision 6
+#   python -m scripts.benchmark_storage --subdivision 7 --chunk_rows 16384
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import h5py
+
+from generation.models.planet import Planet
+from generation.models.storage import DatasetLayout, StorageLayout
+from generation.pipeline.run_cratons import run_cratons
+from generation.pipeline.run_mesh import run_mesh
+from generation.pipeline.run_plate_motion import run_plate_motion
+from shared.config.planet_gen_config import PlanetGenConfig
+
+
+def candidate_layouts(chunk_rows: int) -> dict[str, StorageLayout]:
+    """Named layouts to compare; the first is the pre-chunking baseline."""
+    def same(**settings) -> StorageLayout:
+        layout = DatasetLayout(chunk_rows=chunk_rows, **settings)
+        return StorageLayout(topology=layout, geometry=layout, layers=layout)
+
+    return {
+        "contiguous": StorageLayout.uncompressed(),
+        "chunked": same(compression="none", shuffle=False),
+        "lzf": same(compression="lzf", shuffle=False),
+        "lzf+shuffle": same(compression="lzf"),
+        "gzip1+shuffle": same(compression="gzip", compression_level=1),
+        "gzip4": same(compression="gzip", compression_level=4, shuffle=False),
+        "gzip4+shuffle": same(compression="gzip", compression_level=4),
+        "gzip9+shuffle": same(compression="gzip", compression_level=9),
+        "gzip4+shuffle, lzf geom": StorageLayout.from_params(chunk_rows=chunk_rows, geometry={"compression": "lzf"}),
+    }
+
+
+def build_planet(subdivision: int, seed: int) -> Planet:
+    config = PlanetGenConfig(subdivision_level=subdivision, seed=seed)
+    planet = Planet(radius=config.radius, subdivision_level=subdivision, seed=seed)
+    planet = run_mesh(planet, config, {"strategy": config.mesh_strategy})
+    planet = run_cratons(planet, config, {})
+    return run_plate_motion(planet, config, {})
+
+
+def time_partial_read(path: Path, rows: int) -> float:
+    """Seconds to read the first `rows` faces and their plate IDs."""
+    start = time.perf_counter()
+    with h5py.File(path, "r") as f:
+        f["mesh/faces"][:rows]
+        f["plate_map/face_to_plate"][:rows]
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark .planetbin chunking and compression settings.")
+    parser.add_argument("--subdivision", type=int, default=6, help="Mesh subdivision level")
+    parser.add_argument("--seed", type=int, default=42, help="Generation seed")
+    parser.add_argument("--chunk_rows", type=int, default=65536, help="Rows per chunk")
+    parser.add_argument("--partial_rows", type=int, default=4096, help="Faces read in the partial-read test")
+    args = parser.parse_args()
+
+    print(f"Generating planet at subdivision {args.subdivision}...")
+    planet = build_planet(args.subdivision, args.seed)
+    print(f"{len(planet.mesh.faces)} faces\n")
+
+    header = f"{'layout':<24}{'size MB':>10}{'ratio':>8}{'write MB/s':>12}{'read MB/s':>11}{'partial ms':>12}"
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i, (name, layout) in enumerate(candidate_layouts(args.chunk_rows).items()):
+            path = Path(tmpdir) / f"layout{i}.planetbin"
+
+            start = time.perf_counter()
+            planet.save(path, layout)
+            write_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            Planet.load(path)
+            read_s = time.perf_counter() - start
+
+            partial_s = time_partial_read(path, args.partial_rows)
+            size_mb = path.stat().st_size / 1e6
+            baseline = baseline or size_mb
+            # Throughput is measured against the uncompressed size so rows compare like for like
+            print(f"{name:<24}{size_mb:>10.2f}{baseline / size_mb:>8.2f}{baseline / write_s:>12.1f}"
+                  f"{baseline / read_s:>11.1f}{partial_s * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
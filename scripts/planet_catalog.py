@@ -0,0 +1,85 @@
+# tvg2/scripts/planet_catalog.py
+# ---------------------------------------------------
+# Index and search collections of generated planet files.
+#
+# "scan" updates an SQLite catalog with the planet files under a directory,
+# re-reading only files whose mtime or size changed. "query" lists the
+# catalogued planets matching column filters.
+#
+# Usage:
+#   python -m scripts.planet_catalog scan sweep/ --db sweep/catalog.sqlite
+#   python -m scripts.planet_catalog query --db sweep/catalog.sqlite subdivision_level=7 "num_cratons>=10"
+#   python -m scripts.planet_catalog query --db sweep/catalog.sqlite has_climate=1 --sort seed --paths
+
+import argparse
+import json
+import time
+
+from generation.models.catalog import COLUMNS, DEFAULT_PATTERNS, PlanetCatalog
+
+DEFAULT_DB = "planet_catalog.sqlite"
+TABLE_COLUMNS = ("subdivision_level", "seed", "num_cratons", "num_plates", "num_nations", "path")
+
+
+def scan(args):
+    with PlanetCatalog(args.db) as catalog:
+        start = time.perf_counter()
+        result = catalog.scan(args.root, args.pattern or DEFAULT_PATTERNS, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        print(f"Scanned {args.root} in {elapsed:.2f}s: {result.added} added, {result.updated} updated, "
+              f"{result.unchanged} unchanged, {result.removed} removed, {len(result.failed)} failed "
+              f"({len(catalog)} planets catalogued)")
+        for path in result.failed:
+            print(f"  failed: {path}")
+
+
+def query(args):
+    with PlanetCatalog(args.db) as catalog:
+        start = time.perf_counter()
+        rows = catalog.query(args.filters, order_by=args.sort, descending=args.desc, limit=args.limit)
+        elapsed = time.perf_counter() - start
+
+    if args.paths:
+        for row in rows:
+            print(row["path"])
+        return
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print("".join(f"{name:<20}" for name in TABLE_COLUMNS[:-1]) + TABLE_COLUMNS[-1])
+    for row in rows:
+        print("".join(f"{str(row[name]):<20}" for name in TABLE_COLUMNS[:-1]) + row[TABLE_COLUMNS[-1]])
+    print(f"{len(rows)} planets ({elapsed * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index and search generated planet files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = commands.add_parser("scan", help="Add new or changed planet files under a directory")
+    scan_parser.add_argument("root", type=str, help="Directory to scan recursively")
+    scan_parser.add_argument("--db", type=str, default=DEFAULT_DB, help="Catalog database file")
+    scan_parser.add_argument("--pattern", type=str, action="append",
+                             help=f"Planet file name glob, repeatable (default: {' '.join(DEFAULT_PATTERNS)})")
+    scan_parser.add_argument("--workers", type=int, help="Processes reading changed files (default: all CPUs)")
+    scan_parser.set_defaults(handler=scan)
+
+    query_parser = commands.add_parser("query", help="List catalogued planets matching filters",
+                                       epilog=f"Columns: {', '.join(COLUMNS)}")
+    query_parser.add_argument("filters", nargs="*", help='Conditions like subdivision_level=7 or "num_cratons>=10"')
+    query_parser.add_argument("--db", type=str, default=DEFAULT_DB, help="Catalog database file")
+    query_parser.add_argument("--sort", type=str, help="Column to sort by (default: path)")
+    query_parser.add_argument("--desc", action="store_true", help="Sort in descending order")
+    query_parser.add_argument("--limit", type=int, help="Maximum number of results")
+    output = query_parser.add_mutually_exclusive_group()
+    output.add_argument("--paths", action="store_true", help="Print only file paths")
+    output.add_argument("--json", action="store_true", help="Print full rows as JSON")
+    query_parser.set_defaults(handler=query)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
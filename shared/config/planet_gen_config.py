@@ -1,6 +1,6 @@
 # shared/config/planet_gen_config.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -8,18 +8,45 @@ class PlanetGenConfig:
     """
     Configuration schema for generating a procedural planet.
     This config can be loaded from CLI, JSON, or UI input.
+
+    Per-stage blocks (e.g. `craton_seeding`) hold raw parameter dicts that are
+    resolved against the stage schemas in generation/cli/constants.py.
     """
     radius: float = 6371.0
     subdivision_level: int = 6
     seed: int = 42
     mesh_strategy: str = "icosphere"
 
+    # Per-stage parameter blocks
+    craton_seeding: dict = field(default_factory=dict)
+    plate_motion: dict = field(default_factory=dict)
+    elevation: dict = field(default_factory=dict)
+    drainage: dict = field(default_factory=dict)
+    erosion: dict = field(default_factory=dict)
+    climate: dict = field(default_factory=dict)
+    biomes: dict = field(default_factory=dict)
+    regions: dict = field(default_factory=dict)
+    political_map: dict = field(default_factory=dict)
+    export: dict = field(default_factory=dict)
+    cache: dict = field(default_factory=dict)
+
     def to_dict(self) -> dict:
         return {
             "radius": self.radius,
             "subdivision_level": self.subdivision_level,
             "seed": self.seed,
             "mesh_strategy": self.mesh_strategy,
+            "craton_seeding": dict(self.craton_seeding),
+            "plate_motion": dict(self.plate_motion),
+            "elevation": dict(self.elevation),
+            "drainage": dict(self.drainage),
+            "erosion": dict(self.erosion),
+            "climate": dict(self.climate),
+            "biomes": dict(self.biomes),
+            "regions": dict(self.regions),
+            "political_map": dict(self.political_map),
+            "export": dict(self.export),
+            "cache": dict(self.cache),
         }
 
     @staticmethod
@@ -29,4 +56,15 @@ class PlanetGenConfig:
             subdivision_level=data.get("subdivision_level", 6),
             seed=data.get("seed", 42),
             mesh_strategy=data.get("mesh_strategy", "icosphere"),
+            craton_seeding=dict(data.get("craton_seeding", {})),
+            plate_motion=dict(data.get("plate_motion", {})),
+            elevation=dict(data.get("elevation", {})),
+            drainage=dict(data.get("drainage", {})),
+            erosion=dict(data.get("erosion", {})),
+            climate=dict(data.get("climate", {})),
+            biomes=dict(data.get("biomes", {})),
+            regions=dict(data.get("regions", {})),
+            political_map=dict(data.get("political_map", {})),
+            export=dict(data.get("export", {})),
+            cache=dict(data.get("cache", {})),
         )
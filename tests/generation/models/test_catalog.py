@@ -0,0 +1,84 @@
+# tests/generation/models/test_catalog.py
+
+import os
+import sqlite3
+
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate
+from generation.models import catalog as catalog_module
+from generation.models.catalog import COLUMNS, PlanetCatalog, parse_filter
+from generation.models.planet import Planet
+from generation.pipeline.export_planet import get_strategy
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config, _, _, stage_args = parse_args(["--subdivision", "2"])
+    return generate(config, stage_args, seed=3)
+
+
+def test_parse_filter():
+    assert parse_filter("num_cratons>=10") == ("num_cratons", ">=", 10)
+    assert parse_filter(" sea_level < -1.5 ") == ("sea_level", "<", -1.5)
+    assert parse_filter("format=flat") == ("format", "=", "flat")
+    with pytest.raises(ValueError):
+        parse_filter("cratons>=10")
+    with pytest.raises(ValueError):
+        parse_filter("num_cratons")
+
+
+def test_scan_is_incremental_and_queries_filter(planet, tmp_path, monkeypatch):
+    sweep = tmp_path / "sweep"
+    (sweep / "nested").mkdir(parents=True)
+    planet.save(str(sweep / "a.planetbin"))
+    get_strategy("flat", output_path=str(sweep / "nested" / "b.planetbin")).run(planet)
+    small = Planet(radius=1.0, subdivision_level=1, seed=99)
+    small.save(str(sweep / "small.planetbin"))
+    (sweep / "broken.planetbin").write_bytes(b"not a planet")
+
+    with PlanetCatalog(tmp_path / "catalog.sqlite") as catalog:
+        result = catalog.scan(sweep)
+        assert (result.added, result.updated, result.unchanged, result.removed) == (3, 0, 0, 0)
+        assert result.failed == [str((sweep / "broken.planetbin").resolve())]
+
+        rows = catalog.query(["subdivision_level=2", f"num_cratons>={len(planet.cratons)}"], order_by="format")
+        assert [row["format"] for row in rows] == ["flat", "hdf5"]
+        assert rows[0]["has_climate"] == 1 and rows[0]["num_nations"] == len(planet.nations)
+        assert catalog.query(["has_mesh=0"])[0]["seed"] == 99
+        assert len(catalog.query(limit=1)) == 1
+
+        # Unchanged files are not reopened; changed and deleted ones are noticed
+        os.utime(sweep / "a.planetbin", (1, 1))
+        (sweep / "small.planetbin").unlink()
+        result = catalog.scan(sweep)
+        assert (result.added, result.updated, result.unchanged, result.removed) == (0, 1, 1, 1)
+        assert len(catalog) == 2
+        with pytest.raises(ValueError):
+            catalog.query(order_by="path; DROP TABLE planets")
+
+    # Large batches are read by worker processes with the same result
+    monkeypatch.setattr(catalog_module, "PARALLEL_SCAN_MIN_FILES", 1)
+    with PlanetCatalog(tmp_path / "parallel.sqlite") as catalog:
+        result = catalog.scan(sweep, workers=2)
+        assert result.added == 2 and len(result.failed) == 1
+        assert catalog.query(["format=flat"])[0]["num_faces"] == len(planet.mesh.faces)
+
+    # A catalog with another column layout is rebuilt on open
+    with sqlite3.connect(tmp_path / "old.sqlite") as connection:
+        connection.execute("CREATE TABLE planets (path TEXT PRIMARY KEY)")
+    with PlanetCatalog(tmp_path / "old.sqlite") as catalog:
+        assert len(catalog) == 0
+        columns = [row[1] for row in catalog.connection.execute("PRAGMA table_info(planets)")]
+        assert columns == list(COLUMNS)
+
+
+def test_default_scan_finds_flat_files(planet, tmp_path):
+    get_strategy("flat", output_path=str(tmp_path / "world.planetmm")).run(planet)
+    Planet(radius=1.0, subdivision_level=1, seed=99).save(str(tmp_path / "small.planetbin"))
+
+    with PlanetCatalog(tmp_path / "catalog.sqlite") as catalog:
+        assert catalog.scan(tmp_path, "*.planetbin").added == 1
+        assert catalog.scan(tmp_path).added == 1
+        assert [row["format"] for row in catalog.query(order_by="format")] == ["flat", "hdf5"]
@@ -0,0 +1,99 @@
+# tests/generation/models/test_layer_store.py
+
+from dataclasses import dataclass
+from typing import Optional
+
+import h5py
+import numpy as np
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate
+from generation.models.layer_store import ArraySchema, FieldSpec, field_info, nbytes
+from generation.models.planet import Planet
+from generation.models.storage import StorageLayout
+from generation.pipeline.export_planet import get_strategy
+
+
+@dataclass
+class SoilMap:
+    depth: np.ndarray
+    fertility: Optional[np.ndarray] = None
+    bedrock: float = 0.0
+
+
+SOIL_SCHEMA = ArraySchema(SoilMap, fields=(
+    FieldSpec("depth", "float32", units="m"),
+    FieldSpec("fertility", "uint8", optional=True),
+), attrs=("bedrock",))
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config, _, _, stage_args = parse_args(["--subdivision", "3"])
+    return generate(config, stage_args, seed=42)
+
+
+def test_schema_round_trip_casts_and_records_metadata(tmp_path):
+    soil = SoilMap(depth=np.linspace(0, 3, 20), fertility=None, bedrock=-12.5)
+    with h5py.File(tmp_path / "soil.h5", "w") as f:
+        SOIL_SCHEMA.write(f.create_group("soil"), soil, StorageLayout())
+        assert "fertility" not in f["soil"]
+        assert field_info(f["soil"]) == {"depth": {"dtype": "<f4", "domain": "face", "units": "m", "shape": [20]}}
+        loaded = SOIL_SCHEMA.read(f["soil"])
+
+    assert loaded.depth.dtype == np.float32 and loaded.fertility is None and loaded.bedrock == -12.5
+    np.testing.assert_allclose(loaded.depth, soil.depth, rtol=1e-6)
+
+    with h5py.File(tmp_path / "bad.h5", "w") as f, pytest.raises(ValueError):
+        SOIL_SCHEMA.write(f.create_group("soil"), SoilMap(depth=None), StorageLayout())
+    with pytest.raises(ValueError):
+        FieldSpec("x", domain="edge")
+
+
+@pytest.mark.parametrize("strategy", ["hdf5", "flat"])
+def test_every_stage_layer_round_trips(planet, tmp_path, strategy):
+    path = tmp_path / f"planet.{strategy}"
+    get_strategy(strategy, output_path=str(path)).run(planet)
+    loaded = Planet.load(path)
+
+    np.testing.assert_array_equal(loaded.elevation.elevation, planet.elevation.elevation)
+    assert loaded.elevation.sea_level == planet.elevation.sea_level
+    np.testing.assert_array_equal(loaded.drainage.receivers, planet.drainage.receivers)
+    np.testing.assert_array_equal(loaded.climate.precipitation, planet.climate.precipitation)
+    np.testing.assert_array_equal(loaded.biomes.biome_ids, planet.biomes.biome_ids)
+    assert loaded.biomes.names == planet.biomes.names
+    np.testing.assert_array_equal(loaded.political_map.face_to_nation, planet.political_map.face_to_nation)
+    assert loaded.regions.named_regions == planet.regions.named_regions
+    for name, layer in planet.regions.layers.items():
+        np.testing.assert_array_equal(loaded.regions.layers[name].region_class, layer.region_class)
+        np.testing.assert_array_equal(loaded.regions.layers[name].centroids, layer.centroids)
+    assert loaded.provenance["climate"]["stage"] == "climate"
+    assert loaded.provenance["elevation"]["stage"] == "erosion"
+
+
+def test_planet_file_lists_fields_and_loads_lazily(planet, tmp_path):
+    path = tmp_path / "planet.planetbin"
+    planet.save(path)
+
+    with Planet.open(path) as opened:
+        face_fields = opened.fields("face")
+        assert face_fields["climate/temperature"]["units"] == "°C"
+        assert "regions/layers/landmass/face_to_region" in face_fields
+        assert "plate_map/boundary_edges" not in face_fields
+        assert "Climate: ✔" in opened.summary()
+
+        assert opened.memory_usage() == {}
+        temperature = opened.climate.temperature
+        assert opened.memory_usage() == {"climate": 2 * temperature.nbytes}
+        np.testing.assert_array_equal(opened.read("biomes/biome_ids", faces=slice(0, 10)), planet.biomes.biome_ids[:10])
+
+
+def test_memory_usage_counts_arrays_once(planet):
+    usage = planet.memory_usage()
+    assert usage["climate"] == planet.climate.temperature.nbytes + planet.climate.precipitation.nbytes
+    assert usage["mesh"] >= planet.mesh.vertices.nbytes + planet.mesh.faces.nbytes
+    assert "nations" in usage and "elevation" in usage
+
+    shared = np.zeros(100)
+    assert nbytes([shared, {"again": shared}]) == shared.nbytes
@@ -0,0 +1,25 @@
+# tests/generation/models/test_mesh.py
+
+import numpy as np
+
+from generation.models.icosphere import icosphere_mesh
+from generation.models.mesh import adjacency_to_csr
+
+
+def test_adjacency_to_csr_orders_rows_by_face():
+    indptr, indices = adjacency_to_csr({3: [1, 2], 0: [5], 2: [], 1: (0, 3, 4)}, 6)
+    np.testing.assert_array_equal(indptr, [0, 1, 4, 4, 6, 6, 6])
+    np.testing.assert_array_equal(indices, [5, 0, 3, 4, 1, 2])
+    assert indices.dtype == np.int32
+
+    indptr, indices = adjacency_to_csr({}, 3)
+    np.testing.assert_array_equal(indptr, [0, 0, 0, 0])
+    assert len(indices) == 0
+
+
+def test_adjacency_to_csr_round_trips_icosphere_adjacency():
+    mesh = icosphere_mesh(3, 1.0)
+    adjacency = {face: mesh.adjacency[face] for face in reversed(range(len(mesh.faces)))}
+    indptr, indices = adjacency_to_csr(adjacency, len(mesh.faces))
+    np.testing.assert_array_equal(indptr, mesh.adjacency.indptr)
+    np.testing.assert_array_equal(indices, mesh.adjacency.indices)
@@ -1,10 +1,13 @@
 # tests/generation/models/test_planet_io.py
 
+import h5py
 import numpy as np
 import pytest
 
 from generation.models.planet import Planet
-from generation.models.mesh import MeshData
+from generation.models.mesh import CSRAdjacency, MeshData
+from generation.models.politics import Nation
+from generation.models.tectonics import Craton, Plate, PlateMap
 
 
 def create_test_planet() -> Planet:
@@ -40,3 +43,157 @@ def test_planet_save_and_load(tmp_path):
     np.testing.assert_array_equal(loaded.mesh.vertices, original.mesh.vertices)
     np.testing.assert_array_equal(loaded.mesh.faces, original.mesh.faces)
     assert loaded.mesh.adjacency == original.mesh.adjacency
+
+
+def test_plate_map_growth_round_trip(tmp_path):
+    original = create_test_planet()
+    original.plate_map = PlateMap(
+        face_to_plate=np.array([0, 1], dtype=np.int32),
+        claim_order=np.array([0, 3], dtype=np.int32),
+    )
+    file_path = tmp_path / "planet_plates.planetbin"
+
+    original.save(file_path)
+    loaded = Planet.load(file_path)
+
+    np.testing.assert_array_equal(loaded.plate_map.face_to_plate, [0, 1])
+    np.testing.assert_array_equal(loaded.plate_map.claim_order, [0, 3])
+    np.testing.assert_array_equal(loaded.plate_map.growth_frame(1), [0, -1])
+
+
+def test_open_reads_lazily_and_slices_faces(tmp_path):
+    original = create_test_planet()
+    original.plate_map = PlateMap(face_to_plate=np.array([4, 7], dtype=np.int32))
+    file_path = tmp_path / "planet_lazy.planetbin"
+    original.save(file_path)
+
+    with Planet.open(file_path) as planet:
+        assert planet.seed == 123
+        assert planet.num_faces == 2
+        assert "2 faces" in planet.summary()
+        assert planet._loaded == {}  # nothing read yet
+
+        np.testing.assert_array_equal(planet.read("plate_map/face_to_plate", faces=slice(1, 2)), [7])
+        np.testing.assert_array_equal(planet.read("mesh/faces", faces=np.array([1, 0, 1]))[:, 0], [3, 0, 3])
+        assert planet.mesh.adjacency == original.mesh.adjacency
+        assert planet.cratons == [] and planet.elevation is None
+        plate_map = planet.plate_map
+
+    assert planet.closed
+    np.testing.assert_array_equal(plate_map.face_to_plate, [4, 7])
+    with pytest.raises(ValueError):
+        planet.read("mesh/faces")
+    with pytest.raises(AttributeError):
+        planet.not_a_planet_field
+
+
+def test_adjacency_is_stored_as_csr(tmp_path):
+    original = create_test_planet()
+    file_path = tmp_path / "planet_csr.planetbin"
+    original.save(file_path)
+
+    with h5py.File(file_path, "r") as f:
+        np.testing.assert_array_equal(f["mesh/adjacency_indptr"][:], [0, 1, 2])
+        np.testing.assert_array_equal(f["mesh/adjacency_indices"][:], [1, 0])
+
+    loaded = Planet.load(file_path)
+    assert isinstance(loaded.mesh.adjacency, CSRAdjacency)
+    indptr, indices = loaded.mesh.adjacency_csr()
+    assert indices is loaded.mesh.adjacency.indices
+
+
+def test_load_reads_legacy_ragged_adjacency(tmp_path):
+    file_path = tmp_path / "planet_legacy.planetbin"
+    adjacency = {0: [1, 2], 1: [0], 2: [0]}
+    with h5py.File(file_path, "w") as f:
+        f.attrs["radius"], f.attrs["subdivision_level"], f.attrs["seed"] = 1000.0, 1, 5
+        mesh = f.create_group("mesh")
+        mesh.create_dataset("vertices", data=np.zeros((3, 3)))
+        mesh.create_dataset("faces", data=np.zeros((3, 3), dtype=np.int32))
+        mesh.create_dataset("adjacency_lengths", data=[2, 1, 1])
+        mesh.create_dataset("adjacency_flat", data=[1, 2, 0, 0])
+
+    loaded = Planet.load(file_path)
+    assert loaded.mesh.adjacency == adjacency
+    assert loaded.mesh.adjacency[0] == [1, 2]
+    np.testing.assert_array_equal(loaded.mesh.adjacency_csr()[0], [0, 2, 3, 4])
+
+
+def test_entity_collections_round_trip_as_columns(tmp_path):
+    original = create_test_planet()
+    original.cratons = [
+        Craton(center_index=0, id=0, face_ids=[0, 1], name="Laurentia"),
+        Craton(center_index=1, id=1),
+    ]
+    original.plates = [
+        Plate(id=0, craton_ids=[0, 1], motion_vector=np.array([1.0, 0.0, 0.0]),
+              euler_pole=np.array([0.0, 0.0, 1.0]), angular_velocity=0.01),
+        Plate(id=1, craton_ids=[], motion_vector=np.zeros(3)),
+    ]
+    original.nations = [Nation(name="Nation 1", capital=1, territory=np.array([0, 1]), metadata={"area": 2.5})]
+    file_path = tmp_path / "planet_entities.planetbin"
+    original.save(file_path)
+
+    with h5py.File(file_path, "r") as f:
+        assert set(f["cratons"]) == {"id", "center_index", "name", "face_ids", "face_ids_indptr"}
+        np.testing.assert_array_equal(f["cratons/face_ids_indptr"][:], [0, 2, 2])
+
+    loaded = Planet.load(file_path)
+    first, second = loaded.cratons
+    assert (first.id, first.center_index, first.name) == (0, 0, "Laurentia")
+    np.testing.assert_array_equal(first.face_ids, [0, 1])
+    assert second.name is None and second.face_ids is None
+
+    assert loaded.plates[0].craton_ids == [0, 1]
+    np.testing.assert_array_equal(loaded.plates[0].euler_pole, [0.0, 0.0, 1.0])
+    assert loaded.plates[0].angular_velocity == pytest.approx(0.01)
+    assert loaded.plates[1].euler_pole is None and loaded.plates[1].craton_ids == []
+
+    nation = loaded.nations[0]
+    assert (nation.name, nation.capital, nation.metadata) == ("Nation 1", 1, {"area": 2.5})
+    np.testing.assert_array_equal(nation.territory, [0, 1])
+
+    with Planet.open(file_path) as planet:
+        summary = planet.summary()
+    assert "Cratons: 2" in summary and "Plates: 2" in summary and "Nations: 1" in summary
+
+
+def test_load_reads_legacy_craton_groups(tmp_path):
+    file_path = tmp_path / "planet_legacy_cratons.planetbin"
+    with h5py.File(file_path, "w") as f:
+        f.attrs["radius"], f.attrs["subdivision_level"], f.attrs["seed"] = 1000.0, 1, 5
+        cgrp = f.create_group("cratons").create_group("3")
+        cgrp.attrs["center_index"], cgrp.attrs["id"], cgrp.attrs["name"] = 7, 3, "Old"
+        cgrp.create_dataset("face_ids", data=np.array([7, 8], dtype=np.int32))
+
+    craton, = Planet.load(file_path).cratons
+    assert (craton.id, craton.center_index, craton.name) == (3, 7, "Old")
+    np.testing.assert_array_equal(craton.face_ids, [7, 8])
+
+
+def test_incremental_save_replaces_only_named_layers(tmp_path):
+    original = create_test_planet()
+    original.plate_map = PlateMap(face_to_plate=np.array([0, 0], dtype=np.int32))
+    file_path = tmp_path / "planet_incremental.planetbin"
+    original.save(file_path)
+    with h5py.File(file_path, "r") as f:
+        mesh_offset = f["mesh/faces"].id.get_offset()
+
+    original.plate_map = PlateMap(face_to_plate=np.array([2, 3], dtype=np.int32))
+    original.provenance["plate_map"] = {"stage": "plate_motion", "params_hash": "abc123"}
+    original.save(file_path, layers=["plate_map"])
+
+    with h5py.File(file_path, "r") as f:
+        assert f["mesh/faces"].id.get_offset() == mesh_offset
+        assert f["plate_map"].attrs["stage"] == "plate_motion"
+
+    with Planet.open(file_path) as planet:
+        assert planet.provenance == {"plate_map": {"stage": "plate_motion", "params_hash": "abc123"}}
+        np.testing.assert_array_equal(planet.plate_map.face_to_plate, [2, 3])
+        assert planet.mesh.adjacency == original.mesh.adjacency
+
+    stranger = Planet(radius=1, subdivision_level=1, seed=999, mesh=original.mesh)
+    with pytest.raises(ValueError):
+        stranger.save(file_path, layers=["mesh"])
+    with pytest.raises(FileNotFoundError):
+        original.save(tmp_path / "missing.planetbin", layers=["plate_map"])
@@ -0,0 +1,68 @@
+# tests/generation/models/test_preview.py
+
+import numpy as np
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate
+from generation.models.planet import Planet
+from generation.models.preview import aggregate_faces
+from generation.pipeline.export_planet import get_strategy
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config, _, _, stage_args = parse_args(["--subdivision", "3"])
+    return generate(config, stage_args, seed=5)
+
+
+def test_aggregate_faces_takes_means_and_majorities():
+    np.testing.assert_allclose(aggregate_faces(np.array([1.0, 3.0, np.nan, 4.0, 0.0, 2.0, 2.0, 4.0]), 4), [8 / 3, 2.0])
+    ids = np.array([7, 2, 7, 2, 5, 5, 1, 9, -1, -1, -1, 4], dtype=np.int32)
+    result = aggregate_faces(ids, 4)
+    assert result.dtype == np.int32
+    np.testing.assert_array_equal(result, [2, 5, -1])
+
+
+@pytest.mark.parametrize("strategy", ["hdf5", "flat"])
+def test_exported_file_embeds_preview(planet, tmp_path, strategy):
+    path = tmp_path / f"planet.{strategy}"
+    get_strategy(strategy, output_path=str(path), preview_level=1, thumbnail_width=64).run(planet)
+
+    with Planet.open(path) as opened:
+        assert "Preview: level 1" in opened.summary()
+        assert opened.thumbnail.shape == (32, 64, 3) and opened.thumbnail.dtype == np.uint8
+        assert not any(name.startswith("preview/") for name in opened.fields())
+
+        preview = opened.preview()
+        assert preview.subdivision_level == 1 and preview.radius == planet.radius
+        assert len(preview.read("mesh/faces")) == 80
+        elevation = preview.read("elevation/elevation")
+        np.testing.assert_allclose(elevation, planet.elevation.elevation.reshape(80, 16).mean(axis=1))
+        assert set(preview.biomes.biome_ids) <= set(planet.biomes.biome_ids)
+        assert preview.biomes.names == planet.biomes.names
+        assert preview.plate_map.claim_order is None and preview.nations == []
+        assert opened.memory_usage() == {}
+        preview.close()
+        assert not opened.closed
+
+
+def test_open_preview_and_incremental_refresh(planet, tmp_path):
+    path = tmp_path / "planet.planetbin"
+    get_strategy("hdf5", output_path=str(path), preview_level=2, thumbnail_width=0).run(planet)
+
+    warmer = Planet(**{**vars(planet)})
+    warmer.climate = type(planet.climate)(planet.climate.temperature + 10.0, planet.climate.precipitation)
+    warmer.save(str(path), layers=["climate"])
+
+    with Planet.open_preview(path) as preview:
+        assert preview.subdivision_level == 2
+        np.testing.assert_allclose(preview.climate.temperature,
+                                   warmer.climate.temperature.reshape(320, 4).mean(axis=1))
+    with Planet.open(path) as opened:
+        assert opened.thumbnail is None
+
+    plain = tmp_path / "plain.planetbin"
+    planet.save(str(plain))
+    with pytest.raises(ValueError):
+        Planet.open_preview(plain)
@@ -0,0 +1,122 @@
+# tests/generation/models/test_quantization.py
+
+import numpy as np
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate
+from generation.models.planet import Planet
+from generation.models.quantization import (
+    CATEGORICAL_UINT8, ELEVATION_INT16, LINEAR_INT16, LINEAR_UINT16, Quantization, decode, encode,
+)
+from generation.pipeline.export_planet import get_strategy
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config, _, _, stage_args = parse_args(["--subdivision", "3"])
+    return generate(config, stage_args, seed=7)
+
+
+def test_linear_round_trip_error_is_half_a_step():
+    values = np.random.default_rng(0).uniform(-11000.0, 8800.0, 5000)
+    values[3] = np.nan
+    codes, encoding = encode(values, LINEAR_INT16)
+
+    assert codes.dtype == np.int16 and codes[3] == np.iinfo(np.int16).max
+    decoded = decode(codes, encoding)
+    assert decoded.dtype == np.float64 and np.isnan(decoded[3])
+    finite = ~np.isnan(values)
+    assert np.abs(decoded[finite] - values[finite]).max() <= encoding["scale"] / 2 + 1e-9
+    assert decoded[finite].min() == pytest.approx(values[finite].min())
+
+    constant, encoding = encode(np.full(4, 12.5), LINEAR_UINT16)
+    np.testing.assert_allclose(decode(constant, encoding), 12.5)
+
+
+def test_fixed_step_grid_keeps_order_and_sea_level_side():
+    sea_level = 12.3
+    elevation = np.array([sea_level - 0.4, sea_level, sea_level + 0.01, sea_level + 0.6, 500.0, -4000.0, np.nan])
+    filled = np.where(np.isnan(elevation), np.nan, np.maximum(elevation, sea_level + 0.2))
+    decoded = {}
+    for name, values in (("elevation", elevation), ("filled", filled)):
+        codes, encoding = encode(values, ELEVATION_INT16, anchor=sea_level)
+        assert codes.dtype == np.int16 and encoding["scale"] == 1.0
+        decoded[name] = decode(codes, encoding)
+
+    finite = ~np.isnan(elevation)
+    np.testing.assert_array_equal(decoded["elevation"][finite] > sea_level, elevation[finite] > sea_level)
+    assert decoded["elevation"][1] == sea_level
+    assert np.all(decoded["filled"][finite] >= decoded["elevation"][finite])
+    with pytest.raises(ValueError):
+        Quantization("categorical", "uint8", step=1.0)
+
+
+def test_categorical_is_lossless_or_declined():
+    ids = np.array([-1, 0, 5, 200, -1], dtype=np.int32)
+    codes, encoding = encode(ids, CATEGORICAL_UINT8)
+    assert codes.dtype == np.uint8
+    decoded = decode(codes, encoding)
+    assert decoded.dtype == np.int32
+    np.testing.assert_array_equal(decoded, ids)
+
+    assert encode(np.array([-1, 300]), CATEGORICAL_UINT8) is None
+    with pytest.raises(ValueError):
+        Quantization("linear", "float32")
+    with pytest.raises(ValueError):
+        Quantization("log", "int16")
+
+
+@pytest.mark.parametrize("strategy", ["hdf5", "flat"])
+def test_quantized_planet_decodes_on_load(planet, tmp_path, strategy):
+    path = tmp_path / f"planet.{strategy}"
+    get_strategy(strategy, output_path=str(path), quantize=True).run(planet)
+
+    with Planet.open(path) as opened:
+        raw = opened.read_raw("elevation/elevation")
+        encoding = opened.field("elevation/elevation")["encoding"]
+        assert raw.dtype == np.int16 and opened.fields()["elevation/elevation"]["dtype"] == "<i2"
+        assert opened.read_raw("biomes/biome_ids").dtype == np.uint8
+        np.testing.assert_array_equal(opened.read("elevation/elevation", faces=slice(5, 9)),
+                                      decode(raw[5:9], encoding))
+        loaded = opened.load()
+
+    elevation = planet.elevation.elevation
+    assert loaded.elevation.elevation.dtype == np.float64
+    error = np.abs(loaded.elevation.elevation - elevation)
+    # Only faces less than half a step above sea level are moved up to a full step
+    nudged = (elevation > planet.elevation.sea_level) & (elevation - planet.elevation.sea_level < encoding["scale"] / 2)
+    assert error[~nudged].max() <= encoding["scale"] / 2 + 1e-9
+    assert error.max() <= encoding["scale"] + 1e-9
+    precipitation = planet.climate.precipitation
+    assert np.abs(loaded.climate.precipitation - precipitation).max() <= np.ptp(precipitation) / 65534
+    np.testing.assert_array_equal(loaded.biomes.biome_ids, planet.biomes.biome_ids)
+    np.testing.assert_array_equal(loaded.plate_map.face_to_plate, planet.plate_map.face_to_plate)
+    np.testing.assert_array_equal(loaded.political_map.face_to_nation, planet.political_map.face_to_nation)
+
+
+def test_quantized_layers_are_four_times_smaller(planet, tmp_path):
+    plain, quantized = tmp_path / "plain.flat", tmp_path / "quantized.flat"
+    get_strategy("flat", output_path=str(plain)).run(planet)
+    get_strategy("flat", output_path=str(quantized), quantize=True).run(planet)
+
+    with Planet.open(plain) as a, Planet.open(quantized) as b:
+        for name in ("elevation/elevation", "climate/temperature", "climate/precipitation"):
+            assert a.read_raw(name).nbytes == 4 * b.read_raw(name).nbytes
+        assert a.read_raw("plate_map/face_to_plate").nbytes == 4 * b.read_raw("plate_map/face_to_plate").nbytes
+    assert quantized.stat().st_size < plain.stat().st_size
+
+
+def test_quantized_elevations_keep_fill_order_and_coastline(planet, tmp_path):
+    assert planet.drainage is not None and planet.drainage.filled_elevation is not None
+    path = tmp_path / "planet.planetbin"
+    get_strategy("hdf5", output_path=str(path), quantize=True).run(planet)
+    loaded = Planet.load(str(path))
+
+    sea_level = planet.elevation.sea_level
+    assert loaded.elevation.sea_level == sea_level
+    np.testing.assert_array_equal(loaded.elevation.elevation > sea_level, planet.elevation.elevation > sea_level)
+    assert np.all(loaded.drainage.filled_elevation >= loaded.elevation.elevation)
+    # Faces outside depressions stay exactly level with their fill
+    level = planet.drainage.filled_elevation == planet.elevation.elevation
+    np.testing.assert_array_equal(loaded.drainage.filled_elevation[level], loaded.elevation.elevation[level])
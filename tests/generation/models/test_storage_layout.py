@@ -0,0 +1,76 @@
+# tests/generation/models/test_storage_layout.py
+
+import h5py
+import numpy as np
+import pytest
+
+from generation.models.mesh import MeshData
+from generation.models.planet import Planet
+from generation.models.storage import DatasetLayout, StorageLayout
+from generation.models.tectonics import PlateMap
+from generation.pipeline.run_export import run_export
+from shared.config.planet_gen_config import PlanetGenConfig
+
+
+def make_planet(num_faces: int = 500) -> Planet:
+    rng = np.random.default_rng(0)
+    faces = rng.integers(0, 300, size=(num_faces, 3)).astype(np.int32)
+    mesh = MeshData(
+        vertices=rng.normal(size=(300, 3)).astype(np.float32),
+        faces=faces,
+        adjacency={i: [(i + 1) % num_faces, (i - 1) % num_faces] for i in range(num_faces)},
+    )
+    planet = Planet(radius=1000, subdivision_level=1, seed=1, mesh=mesh)
+    planet.plate_map = PlateMap(face_to_plate=np.repeat(np.arange(5), num_faces // 5).astype(np.int32))
+    return planet
+
+
+def test_from_params_applies_class_overrides():
+    layout = StorageLayout.from_params(compression="gzip", chunk_rows=128, geometry={"compression": "lzf"})
+    assert layout.topology == DatasetLayout(compression="gzip", chunk_rows=128)
+    assert layout.geometry.compression == "lzf"
+    assert layout.geometry.chunk_rows == 128
+
+    with pytest.raises(ValueError):
+        StorageLayout.from_params(mesh={"compression": "lzf"})
+    with pytest.raises(ValueError):
+        StorageLayout.from_params(layers={"level": 3})
+    with pytest.raises(ValueError):
+        DatasetLayout(compression="zstd")
+
+
+def test_save_applies_layout_per_dataset_class(tmp_path):
+    planet = make_planet()
+    layout = StorageLayout.from_params(compression="gzip", compression_level=6, chunk_rows=128,
+                                       geometry={"compression": "lzf", "shuffle": False},
+                                       layers={"compression": "none", "chunk_rows": 0})
+    path = tmp_path / "layout.planetbin"
+    planet.save(path, layout)
+
+    with h5py.File(path, "r") as f:
+        faces = f["mesh/faces"]
+        assert faces.chunks == (128, 3)
+        assert faces.compression == "gzip" and faces.compression_opts == 6 and faces.shuffle
+        vertices = f["mesh/vertices"]
+        assert vertices.compression == "lzf" and not vertices.shuffle
+        assert f["plate_map/face_to_plate"].chunks is None
+
+    loaded = Planet.load(path)
+    np.testing.assert_array_equal(loaded.mesh.faces, planet.mesh.faces)
+    np.testing.assert_array_equal(loaded.mesh.vertices, planet.mesh.vertices)
+    np.testing.assert_array_equal(loaded.plate_map.face_to_plate, planet.plate_map.face_to_plate)
+    assert loaded.mesh.adjacency == planet.mesh.adjacency
+
+
+def test_run_export_reads_layout_from_config(tmp_path):
+    config = PlanetGenConfig(export={"compression": "lzf", "chunk_rows": 64})
+    path = tmp_path / "configured.planetbin"
+    run_export(make_planet(), str(path), config, {})
+
+    with h5py.File(path, "r") as f:
+        assert f["mesh/faces"].compression == "lzf"
+        assert f["mesh/faces"].chunks == (64, 3)
+
+    run_export(make_planet(), str(path), config, {"compression": "none"})
+    with h5py.File(path, "r") as f:
+        assert f["mesh/faces"].compression is None
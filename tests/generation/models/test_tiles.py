@@ -0,0 +1,97 @@
+# tests/generation/models/test_tiles.py
+
+from dataclasses import replace
+
+import h5py
+import numpy as np
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate
+from generation.models.icosphere import icosahedron, normalize
+from generation.models.planet import Planet
+from generation.models.storage import StorageLayout
+from generation.models.tiles import tile_face_ranges
+from generation.pipeline.export_planet import get_strategy
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config, _, _, stage_args = parse_args(["--subdivision", "3"])
+    return generate(config, stage_args, seed=11)
+
+
+def test_tiles_are_the_faces_descending_from_coarser_faces(planet):
+    ranges = tile_face_ranges(planet.subdivision_level, 0)
+    assert ranges.shape == (20, 2) and ranges[-1, 1] == len(planet.mesh.faces)
+
+    vertices, faces = icosahedron()
+    base_centers = normalize(normalize(vertices)[faces].mean(axis=1))
+    nearest_base = np.argmax(normalize(planet.mesh.face_centers) @ base_centers.T, axis=1)
+    for tile, (start, end) in enumerate(ranges):
+        assert np.all(nearest_base[start:end] == tile)
+
+    assert tile_face_ranges(3, 3).shape == (1280, 2)
+    with pytest.raises(ValueError):
+        tile_face_ranges(3, 4)
+
+
+def test_tiled_hdf5_reads_regions_from_their_own_chunks(planet, tmp_path):
+    path = tmp_path / "tiled.planetbin"
+    get_strategy("hdf5", output_path=str(path), tile_level=1).run(planet)
+
+    with h5py.File(path, "r") as f:
+        assert f["climate/temperature"].chunks == (16,)
+        assert f["mesh/faces"].chunks == (16, 3)
+
+    with Planet.open(path) as opened:
+        assert len(opened.tile_index) == 80
+        nation_faces = planet.nations[0].territory
+        tiles = opened.tiles_for(nation_faces)
+        region = opened.read_region(tiles)
+        assert np.isin(nation_faces, region["face_ids"]).all()
+        np.testing.assert_array_equal(region["climate/temperature"],
+                                      planet.climate.temperature[region["face_ids"]])
+
+        region = opened.read_region([79, 3], names=["mesh/faces"])
+        np.testing.assert_array_equal(region["face_ids"], np.r_[1264:1280, 48:64])
+        np.testing.assert_array_equal(region["mesh/faces"], planet.mesh.faces[region["face_ids"]])
+        assert opened.read_region([], names=["mesh/faces"])["mesh/faces"].shape == (0, 3)
+        with pytest.raises(ValueError):
+            opened.read_region([80])
+
+    # Replaced layers keep the file's tile chunking
+    planet.save(str(path), StorageLayout(), layers=["climate"])
+    with h5py.File(path, "r") as f:
+        assert f["climate/temperature"].chunks == (16,)
+
+
+def test_flat_index_and_untiled_files(planet, tmp_path):
+    flat = tmp_path / "tiled.flat"
+    get_strategy("flat", output_path=str(flat), tile_level=0).run(planet)
+    with Planet.open(flat) as opened:
+        region = opened.read_region([2], names=["biomes/biome_ids"])
+        np.testing.assert_array_equal(region["biomes/biome_ids"], planet.biomes.biome_ids[128:192])
+
+    plain = tmp_path / "plain.planetbin"
+    planet.save(str(plain))
+    with Planet.open(plain) as opened:
+        assert opened.tile_index is None
+        with pytest.raises(ValueError):
+            opened.read_region([0])
+
+
+def test_meshes_from_other_generators_are_not_tiled(planet, tmp_path):
+    # Same face count as an icosphere, but faces are not numbered by subdivision
+    order = np.random.default_rng(0).permutation(len(planet.mesh.faces))
+    mesh = planet.mesh
+    shuffled = replace(planet, mesh=type(mesh)(vertices=mesh.vertices, faces=mesh.faces[order], adjacency={}))
+    with pytest.raises(ValueError, match="icosphere"):
+        shuffled.mesh.base_tiles()
+    with pytest.raises(ValueError, match="icosphere"):
+        shuffled.save(str(tmp_path / "tiled.planetbin"), StorageLayout(tile_level=1))
+
+    path = tmp_path / "preview.planetbin"
+    shuffled.save(str(path), StorageLayout(preview_level=1))
+    with h5py.File(path, "r") as f:
+        assert "preview" not in f
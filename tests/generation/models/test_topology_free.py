@@ -0,0 +1,101 @@
+# tests/generation/models/test_topology_free.py
+
+import h5py
+import numpy as np
+import pytest
+
+from generation.models.icosphere import (
+    GENERATOR_VERSION, icosphere_mesh, icosphere_topology, legacy_face_adjacency, regenerate_mesh,
+)
+from generation.models.planet import Planet
+from generation.models.storage import StorageLayout
+from generation.models.tectonics import PlateMap
+from generation.pipeline.run_export import run_export
+from shared.config.planet_gen_config import PlanetGenConfig
+
+
+def make_planet(subdivision_level: int = 3) -> Planet:
+    planet = Planet(radius=6371.0, subdivision_level=subdivision_level, seed=3)
+    planet.mesh = icosphere_mesh(subdivision_level, planet.radius)
+    planet.plate_map = PlateMap(face_to_plate=planet.mesh.base_tiles().astype(np.int32))
+    return planet
+
+
+def test_topology_is_a_closed_triangulation_shared_per_level():
+    vertices, faces, adjacency = icosphere_topology(3)
+    assert faces.shape == (1280, 3) and vertices.shape == (642, 3)
+    np.testing.assert_allclose(np.linalg.norm(vertices, axis=1), 1.0)
+    assert icosphere_topology(3)[1] is faces
+    assert not faces.flags.writeable
+
+    # Every face has three distinct neighbors, and adjacency is symmetric
+    assert all(len(set(adjacency[face])) == 3 for face in adjacency)
+    assert all(face in adjacency[neighbor] for face in adjacency for neighbor in adjacency[face])
+    # Children of base face i occupy faces 4i..4i+3 after one subdivision
+    level_1 = icosphere_topology(1)[1]
+    assert set(level_1[:4].ravel()) >= set(icosphere_topology(0)[1][0])
+
+
+def test_topology_free_file_rebuilds_mesh(tmp_path):
+    planet = make_planet()
+    full, lean = tmp_path / "full.planetbin", tmp_path / "lean.planetbin"
+    planet.save(full)
+    planet.save(lean, StorageLayout(store_topology=False, store_vertices=False))
+
+    with h5py.File(lean, "r") as f:
+        assert set(f["mesh"]) == set()
+        assert f["mesh"].attrs["generator"] == "icosphere"
+        assert f["mesh"].attrs["generator_version"] == GENERATOR_VERSION
+    assert lean.stat().st_size < full.stat().st_size / 4
+
+    loaded = Planet.load(lean)
+    np.testing.assert_array_equal(loaded.mesh.faces, planet.mesh.faces)
+    np.testing.assert_array_equal(loaded.mesh.vertices, planet.mesh.vertices)
+    np.testing.assert_array_equal(loaded.mesh.adjacency_csr()[1], planet.mesh.adjacency_csr()[1])
+    np.testing.assert_array_equal(loaded.plate_map.face_to_plate, planet.plate_map.face_to_plate)
+    assert loaded.mesh.fingerprint() == planet.mesh.fingerprint()
+
+    with Planet.open(lean) as opened:
+        assert opened.num_faces == 1280
+        assert "rebuilt from icosphere generator" in opened.summary()
+        assert "mesh/face_ids" in opened
+        np.testing.assert_array_equal(opened.read("mesh/faces", faces=slice(8, 16)), planet.mesh.faces[8:16])
+
+
+def test_store_topology_keeps_vertices_and_flat_export(tmp_path):
+    planet = make_planet(2)
+    path = tmp_path / "lean.planetmm"
+    run_export(planet, str(path), PlanetGenConfig(export={"strategy": "flat", "store_topology": False}), {})
+
+    with Planet.open(path) as opened:
+        assert "mesh/vertices" in opened.file and "mesh/faces" not in opened.file
+        mesh = opened.mesh
+    np.testing.assert_array_equal(mesh.faces, planet.mesh.faces)
+    np.testing.assert_array_equal(mesh.vertices, planet.mesh.vertices)
+
+
+def test_meshes_without_generator_are_always_stored(tmp_path):
+    planet = make_planet(1)
+    planet.mesh.generator = None
+    path = tmp_path / "custom.planetbin"
+    planet.save(path, StorageLayout(store_topology=False, store_vertices=False))
+    with h5py.File(path, "r") as f:
+        assert {"vertices", "faces", "adjacency_indptr"} <= set(f["mesh"])
+
+
+def test_unknown_generator_version_is_refused():
+    attrs = dict(icosphere_mesh(1, 1.0).generator, generator_version=GENERATOR_VERSION + 1)
+    with pytest.raises(ValueError):
+        regenerate_mesh(attrs)
+
+
+def test_version_1_files_keep_their_neighbor_order():
+    attrs = dict(icosphere_mesh(2, 1.0).generator, generator_version=1)
+    mesh = regenerate_mesh(attrs)
+    current = icosphere_mesh(2, 1.0)
+    np.testing.assert_array_equal(mesh.faces, current.faces)
+    np.testing.assert_array_equal(mesh.adjacency_csr()[1], legacy_face_adjacency(current.faces).indices)
+    assert all(sorted(mesh.adjacency[face]) == current.adjacency[face] for face in current.adjacency)
+    assert mesh.generator["generator_version"] == 1
+    with pytest.raises(ValueError):
+        regenerate_mesh(dict(attrs, generator_version=0))
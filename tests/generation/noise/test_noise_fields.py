@@ -0,0 +1,52 @@
+# tests/generation/noise/test_noise_fields.py
+
+import numpy as np
+import pytest
+
+from generation.models.planet import Planet
+from generation.noise import NoiseParams, face_noise, fbm3, permutation_table, simplex3
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+
+
+@pytest.fixture(scope="module")
+def mesh():
+    return IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=3, seed=1)).mesh
+
+
+def test_simplex_is_bounded_and_continuous():
+    rng = np.random.default_rng(0)
+    perm = permutation_table(rng)
+    points = rng.uniform(-10.0, 10.0, size=(20000, 3))
+    values = simplex3(points, perm)
+    assert np.all(np.abs(values) <= 1.0)
+    assert values.std() > 0.1
+
+    # Tiny steps give tiny changes
+    nudged = simplex3(points + 1e-4, perm)
+    assert np.max(np.abs(nudged - values)) < 1e-2
+
+    # Lattice points are exact zeros of simplex noise
+    assert np.allclose(simplex3(np.array([[0.0, 0.0, 0.0], [3.0, -2.0, 5.0]]), perm), 0.0)
+
+
+def test_fbm_normalizes_octaves():
+    perm = permutation_table(np.random.default_rng(1))
+    points = np.random.default_rng(2).uniform(-5.0, 5.0, size=(5000, 3))
+    assert np.all(np.abs(fbm3(points, perm, octaves=6)) <= 1.0)
+    assert np.allclose(fbm3(points, perm, octaves=1), simplex3(points, perm))
+
+
+def test_face_noise_is_seeded_and_salted(mesh):
+    base = face_noise(mesh, 7)
+    assert base.shape == (len(mesh.faces),)
+    assert np.array_equal(base, face_noise(mesh, 7, NoiseParams()))
+    assert not np.allclose(base, face_noise(mesh, 8))
+    assert not np.allclose(base, face_noise(mesh, 7, NoiseParams(salt=1)))
+
+
+def test_face_noise_is_memoized_per_mesh(mesh):
+    first = face_noise(mesh, 3, NoiseParams(frequency=4.0))
+    assert face_noise(mesh, 3, NoiseParams(frequency=4.0)) is first
+    assert face_noise(mesh, 3, NoiseParams(frequency=5.0)) is not first
+    with pytest.raises(ValueError):
+        first[0] = 1.0
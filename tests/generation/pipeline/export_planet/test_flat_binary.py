@@ -0,0 +1,62 @@
+# tests/generation/pipeline/export_planet/test_flat_binary.py
+
+import numpy as np
+import pytest
+
+from generation.models.flat_file import ALIGNMENT, FlatPlanetFile, is_flat_file, open_flat
+from generation.models.planet import Planet
+from generation.pipeline.export_planet import get_strategy
+from generation.pipeline.run_cratons import run_cratons
+from generation.pipeline.run_export import run_export
+from generation.pipeline.run_mesh import run_mesh
+from generation.pipeline.run_plate_motion import run_plate_motion
+from shared.config.planet_gen_config import PlanetGenConfig
+
+
+@pytest.fixture(scope="module")
+def planet() -> Planet:
+    config = PlanetGenConfig(radius=6371.0, subdivision_level=3, seed=11)
+    planet = Planet(radius=config.radius, subdivision_level=config.subdivision_level, seed=config.seed)
+    planet = run_mesh(planet, config, {"strategy": "icosphere"})
+    planet = run_cratons(planet, config, {"count": 5})
+    return run_plate_motion(planet, config, {})
+
+
+def test_flat_file_matches_hdf5_contents(planet, tmp_path):
+    hdf5_path, flat_path = tmp_path / "planet.planetbin", tmp_path / "planet.planetmm"
+    planet.save(hdf5_path)
+    get_strategy("flat", output_path=str(flat_path), compression="gzip").run(planet)
+
+    assert is_flat_file(flat_path) and not is_flat_file(hdf5_path)
+    reference, flat = Planet.load(hdf5_path), Planet.load(flat_path)
+
+    np.testing.assert_array_equal(flat.mesh.vertices, reference.mesh.vertices)
+    np.testing.assert_array_equal(flat.mesh.faces, reference.mesh.faces)
+    np.testing.assert_array_equal(flat.mesh.adjacency_csr()[1], reference.mesh.adjacency_csr()[1])
+    np.testing.assert_array_equal(flat.plate_map.face_to_plate, reference.plate_map.face_to_plate)
+    np.testing.assert_array_equal(flat.plate_map.boundary_convergence, reference.plate_map.boundary_convergence)
+    assert [c.center_index for c in flat.cratons] == [c.center_index for c in reference.cratons]
+    assert [p.craton_ids for p in flat.plates] == [p.craton_ids for p in reference.plates]
+    assert flat.provenance == reference.provenance
+
+
+def test_flat_arrays_are_zero_copy_views(planet, tmp_path):
+    path = tmp_path / "planet.planetmm"
+    run_export(planet, str(path), PlanetGenConfig(export={"strategy": "flat"}), {})
+
+    with Planet.open(path) as opened:
+        assert isinstance(opened, FlatPlanetFile)
+        assert "Plates: 5" in opened.summary()
+        faces = opened.read("mesh/faces")
+        assert isinstance(faces.base.base, np.memmap)
+        assert not faces.flags.writeable
+        assert faces.ctypes.data % ALIGNMENT == 0
+        np.testing.assert_array_equal(opened.read("mesh/faces", faces=slice(10, 20)), planet.mesh.faces[10:20])
+
+    with open_flat(path) as opened:
+        np.testing.assert_array_equal(opened.plate_map.face_to_plate, planet.plate_map.face_to_plate)
+
+
+def test_flat_export_rejects_incremental_saves(tmp_path):
+    with pytest.raises(ValueError):
+        get_strategy("flat", output_path=str(tmp_path / "x.planetmm"), only_layers=["plate_map"])
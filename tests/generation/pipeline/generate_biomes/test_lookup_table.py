@@ -0,0 +1,77 @@
+# tests/generation/pipeline/generate_biomes/test_lookup_table.py
+
+import json
+
+import numpy as np
+import pytest
+
+from generation.models.climate import ClimateData
+from generation.models.elevation import ElevationMap
+from generation.models.planet import Planet
+from generation.pipeline.generate_biomes import get_strategy
+from generation.pipeline.generate_biomes.lookup_table import DEFAULT_WHITTAKER_TABLE, BiomeLookupTable
+
+
+def names_for(table: BiomeLookupTable, ids: np.ndarray) -> list:
+    return [table.biomes[i] for i in ids]
+
+
+def test_default_table_classifies_whittaker_corners():
+    table = BiomeLookupTable.from_dict(DEFAULT_WHITTAKER_TABLE)
+    elevation = np.array([-3000.0, -100.0, 200.0, 200.0, 200.0, 200.0, 4000.0])
+    temperature = np.array([10.0, 10.0, 25.0, 25.0, -20.0, 10.0, 10.0])
+    precipitation = np.array([1000.0, 1000.0, 3000.0, 100.0, 800.0, 1500.0, 1500.0])
+    assert names_for(table, table.classify(elevation, temperature, precipitation)) == [
+        "deep_ocean", "ocean", "tropical_rainforest", "desert", "ice", "temperate_forest", "alpine",
+    ]
+
+
+def test_sea_level_faces_are_water():
+    table = BiomeLookupTable.from_dict(DEFAULT_WHITTAKER_TABLE)
+    ids = table.classify(np.array([0.0, 1e-3]), np.array([10.0, 10.0]), np.array([1000.0, 1000.0]))
+    assert names_for(table, ids) == ["ocean", "temperate_forest"]
+
+
+def test_single_name_band_fills_slice():
+    table = BiomeLookupTable.from_dict({
+        "biomes": ["sea", "land"],
+        "elevation_bins": [0.0],
+        "temperature_bins": [0.0],
+        "precipitation_bins": [500.0],
+        "bands": ["sea", [["land", "land"], ["land", "land"]]],
+    })
+    ids = table.classify(np.array([-1.0, 1.0]), np.array([5.0, 5.0]), np.array([100.0, 100.0]))
+    assert names_for(table, ids) == ["sea", "land"]
+
+
+def test_invalid_tables_are_rejected():
+    bad_name = dict(DEFAULT_WHITTAKER_TABLE, bands=["nowhere"] * 4)
+    with pytest.raises(ValueError, match="Unknown biome names"):
+        BiomeLookupTable.from_dict(bad_name)
+    with pytest.raises(ValueError, match="one band per elevation bin"):
+        BiomeLookupTable.from_dict(dict(DEFAULT_WHITTAKER_TABLE, bands=["ocean"]))
+
+
+def test_json_table_file_loads(tmp_path):
+    path = tmp_path / "biomes.json"
+    path.write_text(json.dumps(DEFAULT_WHITTAKER_TABLE))
+    table = BiomeLookupTable.from_json(str(path))
+    default = BiomeLookupTable.from_dict(DEFAULT_WHITTAKER_TABLE)
+    assert table.biomes == default.biomes
+    assert np.array_equal(table.table, default.table)
+
+
+def test_strategy_assigns_biome_per_face():
+    planet = Planet(radius=1.0, subdivision_level=0, seed=1)
+    planet.elevation = ElevationMap(elevation=np.array([-500.0, 500.0, 500.0]))
+    planet.climate = ClimateData(temperature=np.array([15.0, 25.0, -30.0]),
+                                 precipitation=np.array([900.0, 2500.0, 50.0]))
+    planet = get_strategy("whittaker").run(planet)
+    assert [planet.biomes.names[i] for i in planet.biomes.biome_ids] == ["ocean", "tropical_rainforest", "ice"]
+
+
+def test_strategy_requires_climate():
+    planet = Planet(radius=1.0, subdivision_level=0, seed=1)
+    planet.elevation = ElevationMap(elevation=np.zeros(3))
+    with pytest.raises(ValueError, match="climate"):
+        get_strategy("whittaker").run(planet)
@@ -0,0 +1,51 @@
+# tests/generation/pipeline/generate_elevation/test_tectonic_elevation.py
+
+import numpy as np
+import pytest
+
+from generation.models.planet import Planet
+from generation.models.tectonics import BOUNDARY_CONVERGENT
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.seed_cratons.spaced_random import SpacedRandomCratonSeeder
+from generation.pipeline.simulate_plate_motion import get_strategy as get_plate_strategy
+from generation.pipeline.generate_elevation import get_strategy
+
+
+def make_tectonic_planet(subdivision: int = 3, seed: int = 7) -> Planet:
+    planet = Planet(radius=6371.0, subdivision_level=subdivision, seed=seed)
+    planet = IcosphereMeshStrategy().run(planet)
+    planet = SpacedRandomCratonSeeder(count=6, min_distance=2).run(planet)
+    return get_plate_strategy("euler_pole").run(planet)
+
+
+def test_elevation_has_one_value_per_face():
+    planet = get_strategy("tectonic").run(make_tectonic_planet())
+    elevation = planet.elevation.elevation
+    assert elevation.shape == (len(planet.mesh.faces),)
+    assert np.all(np.isfinite(elevation))
+
+
+def test_cratons_stand_above_ocean_floor():
+    planet = get_strategy("tectonic", mountain_height=0.0, ridge_height=0.0, rift_depth=0.0).run(make_tectonic_planet())
+    elevation = planet.elevation.elevation
+    craton_faces = np.concatenate([c.face_ids for c in planet.cratons])
+    others = np.setdiff1d(np.arange(len(elevation)), craton_faces)
+    assert elevation[craton_faces].mean() > elevation[others].mean()
+
+
+def test_convergent_boundaries_are_uplifted():
+    planet = make_tectonic_planet()
+    flat = get_strategy("tectonic", mountain_height=0.0, smoothing_passes=0).run(planet).elevation.elevation.copy()
+    raised = get_strategy("tectonic", smoothing_passes=0).run(planet).elevation.elevation
+
+    plate_map = planet.plate_map
+    convergent_faces = np.unique(plate_map.boundary_edges[plate_map.boundary_types == BOUNDARY_CONVERGENT])
+    assert convergent_faces.size > 0
+    assert np.all(raised[convergent_faces] >= flat[convergent_faces])
+    assert raised[convergent_faces].max() > flat[convergent_faces].max()
+
+
+def test_elevation_requires_plate_map():
+    planet = IcosphereMeshStrategy().run(Planet(radius=1.0, subdivision_level=1, seed=1))
+    with pytest.raises(ValueError, match="classified plate map"):
+        get_strategy("tectonic").run(planet)
@@ -1,5 +1,7 @@
 # tests/generation/pipeline/generate_mesh/test_icosphere.py
 
+from collections.abc import Mapping
+
 import numpy as np
 import pytest
 
@@ -47,7 +49,7 @@ def test_icosphere_mesh_generation():
         assert abs(plane_dist) < 1e-6, f"Face center {i} not in triangle plane (dist={plane_dist})"
 
     # Check adjacency map
-    assert isinstance(mesh.adjacency, dict)
+    assert isinstance(mesh.adjacency, Mapping)
     assert len(mesh.adjacency) == mesh.faces.shape[0], "Each face should have an adjacency list"
     for neighbors in mesh.adjacency.values():
         assert isinstance(neighbors, list), "Each adjacency entry should be a list"
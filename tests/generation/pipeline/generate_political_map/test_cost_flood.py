@@ -0,0 +1,66 @@
+# tests/generation/pipeline/generate_political_map/test_cost_flood.py
+
+import numpy as np
+import pytest
+
+from generation.models.elevation import ElevationMap
+from generation.models.planet import Planet
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.generate_political_map import get_strategy
+from generation.pipeline.generate_political_map.cost_flood import split_territories
+
+
+def make_land_planet(land_fn, subdivision: int = 3, seed: int = 8) -> Planet:
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=subdivision, seed=seed))
+    unit = planet.mesh.centers() / planet.radius
+    planet.elevation = ElevationMap(elevation=np.where(land_fn(unit), 200.0, -3000.0))
+    return planet
+
+
+def test_split_territories_groups_faces_by_nation():
+    face_to_nation = np.array([1, -1, 0, 1, 0, 2])
+    territories = split_territories(face_to_nation, 3)
+    assert [t.tolist() for t in territories] == [[2, 4], [0, 3], [5]]
+
+
+def test_every_land_face_belongs_to_its_cheapest_capital():
+    planet = make_land_planet(lambda u: u[:, 2] > -0.3)
+    planet = get_strategy("cost_flood", nation_count=5, min_capital_spacing=2000.0).run(planet)
+
+    land = planet.elevation.elevation > 0
+    face_to_nation = planet.political_map.face_to_nation
+    assert np.all(face_to_nation[land] >= 0)
+    assert np.all(face_to_nation[~land] == -1)
+
+    # Territories partition the claimed land and contain their own capital
+    claimed = np.sort(np.concatenate([n.territory for n in planet.nations]))
+    assert np.array_equal(claimed, np.flatnonzero(land))
+    for i, nation in enumerate(planet.nations):
+        assert face_to_nation[nation.capital] == i
+        assert planet.political_map.travel_cost[nation.capital] == 0.0
+
+
+def test_capitals_respect_spacing():
+    planet = make_land_planet(lambda u: np.ones(len(u), dtype=bool))
+    planet = get_strategy("cost_flood", nation_count=6, min_capital_spacing=3000.0).run(planet)
+    unit = planet.mesh.centers()[[n.capital for n in planet.nations]] / planet.radius
+    angles = np.arccos(np.clip(unit @ unit.T, -1.0, 1.0))[np.triu_indices(len(unit), 1)]
+    assert np.all(angles * planet.radius >= 3000.0)
+
+
+def test_same_seed_gives_same_map():
+    first = get_strategy("cost_flood", nation_count=4).run(make_land_planet(lambda u: u[:, 0] > 0))
+    second = get_strategy("cost_flood", nation_count=4).run(make_land_planet(lambda u: u[:, 0] > 0))
+    assert np.array_equal(first.political_map.face_to_nation, second.political_map.face_to_nation)
+
+
+def test_requires_land():
+    planet = make_land_planet(lambda u: np.zeros(len(u), dtype=bool))
+    with pytest.raises(ValueError, match="requires land"):
+        get_strategy("cost_flood").run(planet)
+
+
+def test_requires_at_least_one_nation():
+    planet = make_land_planet(lambda u: u[:, 0] > 0)
+    with pytest.raises(ValueError, match="at least one nation"):
+        get_strategy("cost_flood", nation_count=0).run(planet)
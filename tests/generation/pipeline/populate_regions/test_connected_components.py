@@ -0,0 +1,74 @@
+# tests/generation/pipeline/populate_regions/test_connected_components.py
+
+import numpy as np
+import pytest
+
+from generation.models.elevation import ElevationMap
+from generation.models.mesh import label_components
+from generation.models.planet import Planet
+from generation.models.biomes import BiomeMap
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.populate_regions import get_strategy
+from generation.pipeline.populate_regions.connected_components import build_region_layer
+
+
+def test_label_components_on_path_with_classes():
+    edges = np.array([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]])
+    classes = np.array([0, 0, 1, 1, 0, 0])
+    assert label_components(6, edges).tolist() == [0] * 6
+    assert label_components(6, edges, classes).tolist() == [0, 0, 1, 1, 2, 2]
+
+
+def test_label_components_matches_reference_on_random_graph():
+    rng = np.random.default_rng(4)
+    edges = rng.integers(0, 500, size=(400, 2))
+    component = label_components(500, edges)
+
+    # Reference: repeated min-label relaxation
+    reference = np.arange(500)
+    for _ in range(500):
+        lo = np.minimum(reference[edges[:, 0]], reference[edges[:, 1]])
+        np.minimum.at(reference, edges[:, 0], lo)
+        np.minimum.at(reference, edges[:, 1], lo)
+    pairs = set(zip(component.tolist(), reference.tolist()))
+    assert len(pairs) == len(np.unique(reference)) == component.max() + 1
+
+
+def make_two_island_planet() -> Planet:
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=3, seed=2))
+    z = planet.mesh.centers()[:, 2] / planet.radius
+    # Polar caps of land around both poles, separated by an equatorial ocean
+    planet.elevation = ElevationMap(elevation=np.where(np.abs(z) > 0.7, 500.0, -3000.0))
+    return planet
+
+
+def test_region_layer_statistics():
+    planet = make_two_island_planet()
+    land = (planet.elevation.elevation > 0).astype(np.int8)
+    layer = build_region_layer(planet.mesh, land)
+
+    assert layer.num_regions == 3
+    assert layer.face_counts.sum() == len(land)
+    assert np.isclose(layer.areas.sum(), planet.mesh.face_areas().sum())
+    assert sorted(layer.region_class.tolist()) == [0, 1, 1]
+
+    # Cap centroids sit over the poles
+    caps = np.flatnonzero(layer.region_class == 1)
+    assert sorted(np.sign(layer.centroids[caps, 2]).tolist()) == [-1.0, 1.0]
+
+
+def test_strategy_names_landmasses_and_labels_biomes():
+    planet = make_two_island_planet()
+    planet.biomes = BiomeMap(biome_ids=(planet.mesh.centers()[:, 0] > 0).astype(np.int16))
+    planet = get_strategy("connected_components", continent_min_area=1e6).run(planet)
+
+    types = sorted(region["type"] for region in planet.regions.named_regions.values())
+    assert types == ["continent", "continent", "ocean"]
+    assert set(planet.regions.layers) == {"landmass", "biome"}
+    assert planet.regions.layers["biome"].num_regions == 2
+
+
+def test_strategy_requires_elevation():
+    planet = IcosphereMeshStrategy().run(Planet(radius=1.0, subdivision_level=1, seed=1))
+    with pytest.raises(ValueError, match="elevation map"):
+        get_strategy("connected_components").run(planet)
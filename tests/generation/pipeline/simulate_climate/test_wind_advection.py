@@ -0,0 +1,59 @@
+# tests/generation/pipeline/simulate_climate/test_wind_advection.py
+
+import numpy as np
+import pytest
+
+from generation.models.elevation import ElevationMap
+from generation.models.planet import Planet
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.simulate_climate import get_strategy
+from generation.pipeline.simulate_climate.operators import face_latitudes, prevailing_wind, upwind_operator
+
+
+def make_planet(elevation_fn, subdivision: int = 3, seed: int = 1) -> Planet:
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=subdivision, seed=seed))
+    planet.elevation = ElevationMap(elevation=elevation_fn(planet.mesh.centers() / planet.radius))
+    return planet
+
+
+def test_temperature_falls_with_latitude_and_altitude():
+    flat = get_strategy("wind_advection").run(make_planet(lambda c: np.full(len(c), -100.0)))
+    latitude = np.abs(face_latitudes(flat.mesh))
+    equator, pole = latitude < 0.2, latitude > 1.3
+    assert flat.climate.temperature[equator].mean() > flat.climate.temperature[pole].mean()
+
+    high = get_strategy("wind_advection").run(make_planet(lambda c: np.full(len(c), 3000.0)))
+    assert np.all(high.climate.temperature < flat.climate.temperature)
+
+
+def test_precipitation_decreases_inland():
+    # Westerly-belt continent over the x > 0 hemisphere; rain is heaviest near its coasts
+    planet = get_strategy("wind_advection").run(make_planet(lambda c: np.where(c[:, 0] > 0.0, 300.0, -3000.0)))
+    precipitation = planet.climate.precipitation
+    assert np.all(precipitation >= 0.0)
+    x = planet.mesh.centers()[:, 0] / planet.radius
+    assert precipitation[(x > 0.0) & (x < 0.2)].mean() > precipitation[x > 0.9].mean()
+
+
+def test_winds_follow_three_cell_pattern():
+    # Points on the +x meridian: east is +y
+    latitudes = np.radians([15.0, 45.0, 75.0])
+    points = np.stack([np.cos(latitudes), np.zeros(3), np.sin(latitudes)], axis=1)
+    zonal = prevailing_wind(points)[:, 1]
+    assert zonal[0] < 0 < zonal[1] and zonal[2] < 0
+
+
+def test_upwind_operator_is_row_stochastic_and_cached():
+    planet = make_planet(lambda c: np.zeros(len(c)))
+    operator = upwind_operator(planet.mesh, 0.2)
+    np.testing.assert_allclose(np.asarray(operator.sum(axis=1)).ravel(), 1.0)
+
+    # An identical mesh built for another planet reuses the operator
+    other = make_planet(lambda c: np.zeros(len(c)), seed=99)
+    assert upwind_operator(other.mesh, 0.2) is operator
+
+
+def test_climate_requires_elevation():
+    planet = IcosphereMeshStrategy().run(Planet(radius=1.0, subdivision_level=1, seed=1))
+    with pytest.raises(ValueError, match="elevation map"):
+        get_strategy("wind_advection").run(planet)
@@ -0,0 +1,43 @@
+# tests/generation/pipeline/simulate_drainage/test_flow_accumulation.py
+
+import numpy as np
+
+from generation.models.elevation import ElevationMap
+from generation.models.planet import Planet
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.simulate_drainage import get_strategy
+from generation.pipeline.simulate_drainage.routing import accumulate_flow, topological_batches
+
+
+def test_batches_put_donors_before_receivers():
+    # Two tributaries (0->2, 1->2) join and flow 2->3->4, with 4 an outlet
+    receivers = np.array([2, 2, 3, 4, 4])
+    batches = topological_batches(receivers)
+    position = np.empty(len(receivers), dtype=int)
+    for i, batch in enumerate(batches):
+        position[batch] = i
+    assert sorted(np.concatenate(batches).tolist()) == list(range(5))
+    assert np.all(position[[0, 1, 2, 3]] < position[receivers[[0, 1, 2, 3]]])
+
+
+def test_accumulate_counts_upstream_faces():
+    receivers = np.array([2, 2, 3, 4, 4])
+    assert accumulate_flow(receivers).tolist() == [1, 1, 3, 4, 5]
+
+
+def test_accumulate_uses_weights():
+    receivers = np.array([1, 2, 2])
+    assert accumulate_flow(receivers, weights=np.array([1.0, 10.0, 100.0])).tolist() == [1.0, 11.0, 111.0]
+
+
+def test_planet_flow_conserves_area():
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=3, seed=5))
+    rng = np.random.default_rng(5)
+    planet.elevation = ElevationMap(elevation=rng.normal(0.0, 1000.0, len(planet.mesh.faces)))
+    planet = get_strategy("priority_flood").run(planet)
+
+    drainage = planet.drainage
+    areas = planet.mesh.face_areas()
+    sinks = drainage.receivers == np.arange(len(areas))
+    assert np.all(drainage.flow >= areas - 1e-9)
+    assert np.isclose(drainage.flow[sinks].sum(), areas.sum())
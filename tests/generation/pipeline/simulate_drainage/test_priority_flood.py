@@ -0,0 +1,73 @@
+# tests/generation/pipeline/simulate_drainage/test_priority_flood.py
+
+import numpy as np
+import pytest
+
+from generation.models.elevation import ElevationMap
+from generation.models.mesh import MeshData, adjacency_to_csr
+from generation.models.planet import Planet
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.simulate_drainage import get_strategy
+from generation.pipeline.simulate_drainage.routing import priority_flood_fill, steepest_descent_receivers
+
+
+def path_graph(n: int):
+    adjacency = {i: [j for j in (i - 1, i + 1) if 0 <= j < n] for i in range(n)}
+    return adjacency_to_csr(adjacency, n)
+
+
+def make_noisy_planet(subdivision: int = 3, seed: int = 3) -> Planet:
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=subdivision, seed=seed))
+    rng = np.random.default_rng(seed)
+    planet.elevation = ElevationMap(elevation=rng.normal(0.0, 1000.0, len(planet.mesh.faces)))
+    return planet
+
+
+def test_pit_is_filled_to_its_spill_point():
+    # Outlet at 0, a pit at face 2 behind a 5 m sill at face 1
+    indptr, indices = path_graph(4)
+    elevation = np.array([0.0, 5.0, 1.0, 8.0])
+    filled = priority_flood_fill(indptr, indices, elevation, np.array([0]), epsilon=0.1)
+    assert filled[0] == 0.0
+    assert filled[1] == 5.0
+    assert filled[2] == pytest.approx(5.1)
+    assert filled[3] == 8.0
+
+
+def test_receivers_follow_steepest_descent():
+    indptr, indices = path_graph(3)
+    centers = np.array([[0.0, 0, 0], [1.0, 0, 0], [2.0, 0, 0]])
+    receivers = steepest_descent_receivers(indptr, indices, np.array([0.0, 1.0, 3.0]), centers, np.array([0]))
+    assert receivers.tolist() == [0, 0, 1]
+
+
+def test_filled_surface_never_lowers_elevation():
+    planet = get_strategy("priority_flood").run(make_noisy_planet())
+    assert np.all(planet.drainage.filled_elevation >= planet.elevation.elevation)
+
+
+def test_every_face_drains_to_an_outlet():
+    planet = get_strategy("priority_flood").run(make_noisy_planet())
+    receivers = planet.drainage.receivers
+    filled = planet.drainage.filled_elevation
+
+    land = receivers != np.arange(len(receivers))
+    assert np.all(filled[receivers[land]] < filled[land])
+
+    # Following receivers strictly descends, so repeated jumps must settle on outlets
+    position = np.arange(len(receivers))
+    for _ in range(len(receivers)):
+        position = receivers[position]
+    assert np.all(planet.elevation.elevation[position] <= planet.elevation.sea_level)
+
+
+def test_drainage_requires_elevation():
+    planet = Planet(radius=1.0, subdivision_level=0, seed=1)
+    planet.mesh = MeshData(vertices=np.zeros((3, 3)), faces=np.array([[0, 1, 2]]), adjacency={0: []})
+    with pytest.raises(ValueError, match="elevation map"):
+        get_strategy("priority_flood").run(planet)
+
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError, match="Unknown drainage strategy"):
+        get_strategy("nope")
@@ -0,0 +1,64 @@
+# tests/generation/pipeline/simulate_erosion/test_stream_power.py
+
+import copy
+
+import numpy as np
+import pytest
+
+from generation.models.elevation import ElevationMap
+from generation.models.planet import Planet
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.simulate_erosion import get_strategy
+from generation.pipeline.simulate_erosion.tiling import build_tiles
+
+
+def make_island_planet(subdivision: int = 3, seed: int = 11) -> Planet:
+    planet = IcosphereMeshStrategy().run(Planet(radius=6371.0, subdivision_level=subdivision, seed=seed))
+    centers = planet.mesh.centers() / planet.radius
+    rng = np.random.default_rng(seed)
+    # One dome-shaped continent around +z with rough relief, ocean elsewhere
+    elevation = 6000.0 * centers[:, 2] - 2000.0 + rng.normal(0.0, 300.0, len(centers))
+    planet.elevation = ElevationMap(elevation=elevation)
+    return planet
+
+
+def test_erosion_lowers_land_and_keeps_ocean_fixed():
+    planet = make_island_planet()
+    before = planet.elevation.elevation.copy()
+    planet = get_strategy("stream_power", iterations=40).run(planet)
+    after = planet.elevation.elevation
+
+    ocean = before <= 0.0
+    assert np.array_equal(after[ocean], before[ocean])
+    assert after.max() < before.max()
+    assert after[~ocean].mean() < before[~ocean].mean()
+    assert np.all(after[~ocean] >= 0.0)
+
+
+def test_erosion_reroutes_drainage_on_eroded_surface():
+    planet = get_strategy("stream_power", iterations=10).run(make_island_planet())
+    assert np.all(planet.drainage.filled_elevation >= planet.elevation.elevation)
+    assert planet.drainage.flow is not None
+
+
+def test_tiles_partition_the_mesh():
+    mesh = make_island_planet(subdivision=2).mesh
+    tiles = build_tiles(*mesh.adjacency_csr(), mesh.base_tiles(), halo_width=2)
+    assert len(tiles) == 20
+    owned = np.sort(np.concatenate([tile.owned for tile in tiles]))
+    assert np.array_equal(owned, np.arange(len(mesh.faces)))
+    assert all(len(tile.faces) > len(tile.owned) for tile in tiles)
+
+
+def test_tiled_run_matches_serial_run():
+    planet = make_island_planet()
+    params = dict(iterations=12, reroute_interval=6)
+    serial = get_strategy("stream_power", **params).run(copy.deepcopy(planet))
+    tiled = get_strategy("stream_power", workers=2, halo_width=4, **params).run(copy.deepcopy(planet))
+    np.testing.assert_allclose(tiled.elevation.elevation, serial.elevation.elevation, rtol=0, atol=1e-9)
+
+
+def test_erosion_requires_elevation():
+    planet = IcosphereMeshStrategy().run(Planet(radius=1.0, subdivision_level=1, seed=1))
+    with pytest.raises(ValueError, match="elevation map"):
+        get_strategy("stream_power").run(planet)
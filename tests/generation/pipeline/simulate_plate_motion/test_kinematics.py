@@ -0,0 +1,100 @@
+# tests/generation/pipeline/simulate_plate_motion/test_kinematics.py
+
+import numpy as np
+import pytest
+
+from generation.models.planet import Planet
+from generation.models.tectonics import BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT, BOUNDARY_TRANSFORM, Plate
+from generation.pipeline.generate_mesh.icosphere import IcosphereMeshStrategy
+from generation.pipeline.seed_cratons.spaced_random import SpacedRandomCratonSeeder
+from generation.pipeline.simulate_plate_motion import get_strategy
+from generation.pipeline.simulate_plate_motion.kinematics import classify_boundaries
+
+
+def make_plate_planet(subdivision: int = 3, seed: int = 42) -> Planet:
+    planet = Planet(radius=6371.0, subdivision_level=subdivision, seed=seed)
+    planet = IcosphereMeshStrategy().run(planet)
+    return SpacedRandomCratonSeeder(count=6, min_distance=2).run(planet)
+
+
+def two_face_setup():
+    # Face 0 sits at +x, face 1 slightly toward +y; the boundary normal points along +y
+    centers = np.array([[1.0, -0.01, 0.0], [1.0, 0.01, 0.0]])
+    edges = np.array([[0, 1]])
+    face_to_plate = np.array([0, 1])
+    return centers, edges, face_to_plate
+
+
+def test_plate_velocity_is_omega_cross_r():
+    plate = Plate(id=0, craton_ids=[0], motion_vector=np.zeros(3),
+                  euler_pole=np.array([0.0, 0.0, 1.0]), angular_velocity=2.0)
+    np.testing.assert_allclose(plate.velocity_at(np.array([1.0, 0.0, 0.0])), [0.0, 2.0, 0.0])
+
+
+@pytest.mark.parametrize("omega_b, expected", [
+    ([0.0, 0.0, -1.0], BOUNDARY_CONVERGENT),  # plate B moves toward -y, into plate A
+    ([0.0, 0.0, 1.0], BOUNDARY_DIVERGENT),    # plate B moves toward +y, away from plate A
+    ([0.0, 1.0, 0.0], BOUNDARY_TRANSFORM),    # plate B moves along -z, parallel to the boundary
+])
+def test_classify_single_edge(omega_b, expected):
+    centers, edges, face_to_plate = two_face_setup()
+    rotation_vectors = np.array([[0.0, 0.0, 0.0], omega_b])
+    types, convergence = classify_boundaries(edges, face_to_plate, rotation_vectors, centers)
+    assert types[0] == expected
+    if expected == BOUNDARY_CONVERGENT:
+        assert convergence[0] > 0
+    if expected == BOUNDARY_DIVERGENT:
+        assert convergence[0] < 0
+
+
+def test_plate_motion_covers_all_faces():
+    planet = get_strategy("euler_pole").run(make_plate_planet())
+
+    face_to_plate = planet.plate_map.face_to_plate
+    assert face_to_plate.shape == (len(planet.mesh.faces),)
+    assert np.all(face_to_plate >= 0)
+    assert len(planet.plates) == len(planet.cratons)
+
+    # Each craton center belongs to the plate grown from it
+    for plate, craton in zip(planet.plates, planet.cratons):
+        assert face_to_plate[craton.center_index] == plate.id
+        assert np.isclose(np.linalg.norm(plate.euler_pole), 1.0)
+
+
+def test_boundary_edges_separate_plates():
+    planet = get_strategy("euler_pole").run(make_plate_planet())
+    plate_map = planet.plate_map
+
+    plates = plate_map.face_to_plate[plate_map.boundary_edges]
+    assert np.all(plates[:, 0] != plates[:, 1])
+    assert plate_map.boundary_types.shape == (len(plate_map.boundary_edges),)
+    assert set(np.unique(plate_map.boundary_types)) <= {BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT, BOUNDARY_TRANSFORM}
+
+
+def test_plate_motion_is_deterministic():
+    a = get_strategy("euler_pole").run(make_plate_planet())
+    b = make_plate_planet()
+    b.cratons = a.cratons
+    b = get_strategy("euler_pole").run(b)
+    np.testing.assert_array_equal(a.plate_map.face_to_plate, b.plate_map.face_to_plate)
+
+
+def test_plate_motion_requires_cratons():
+    planet = IcosphereMeshStrategy().run(Planet(radius=1.0, subdivision_level=1, seed=1))
+    with pytest.raises(ValueError, match="requires seeded cratons"):
+        get_strategy("euler_pole").run(planet)
+
+
+def test_growth_claim_order_reconstructs_frames():
+    planet = get_strategy("euler_pole").run(make_plate_planet())
+    plate_map = planet.plate_map
+
+    # Frame 0 is only the seeds; the last frame is the final assignment
+    seeds_only = plate_map.growth_frame(0)
+    assert set(np.flatnonzero(seeds_only >= 0)) == {c.center_index for c in planet.cratons}
+    np.testing.assert_array_equal(plate_map.growth_frame(plate_map.growth_iterations), plate_map.face_to_plate)
+
+    # Each craton region is a subset of its plate, grown from the craton's center
+    for plate, craton in zip(planet.plates, planet.cratons):
+        assert craton.center_index in craton.face_ids
+        assert np.all(plate_map.face_to_plate[craton.face_ids] == plate.id)
@@ -0,0 +1,26 @@
+# tests/generation/pipeline/test_provenance.py
+
+from generation.models.planet import Planet
+from generation.pipeline.provenance import params_hash, record_provenance
+from generation.pipeline.run_cratons import run_cratons
+from generation.pipeline.run_mesh import run_mesh
+from shared.config.planet_gen_config import PlanetGenConfig
+
+
+def test_params_hash_ignores_key_order():
+    assert params_hash({"a": 1, "b": [1, 2]}) == params_hash({"b": [1, 2], "a": 1})
+    assert params_hash({"a": 1}) != params_hash({"a": 2})
+
+
+def test_runners_record_layer_provenance():
+    config = PlanetGenConfig(radius=5000, subdivision_level=2, seed=3)
+    planet = Planet(radius=config.radius, subdivision_level=config.subdivision_level, seed=config.seed)
+    planet = run_mesh(planet, config, {"strategy": "icosphere"})
+    planet = run_cratons(planet, config, {"count": 4})
+
+    assert planet.provenance["mesh"]["stage"] == "mesh"
+    assert planet.provenance["cratons"]["stage"] == "craton_seeding"
+
+    before = planet.provenance["cratons"]["params_hash"]
+    record_provenance(planet, "craton_seeding", {"strategy": "spaced_random", "count": 5})
+    assert planet.provenance["cratons"]["params_hash"] != before
@@ -4,10 +4,15 @@ Unit test for the planet export pipeline stage.
 """
 
 import tempfile
+from concurrent.futures import Future
 from pathlib import Path
 
+import numpy as np
+import pytest
+
+from generation.models.tectonics import PlateMap
 from generation.pipeline.run_mesh import run_mesh
-from generation.pipeline.run_export import run_export
+from generation.pipeline.run_export import run_export, wait_for_exports
 from shared.config.planet_gen_config import PlanetGenConfig
 from generation.models.planet import Planet
 
@@ -29,3 +34,56 @@ def test_run_export_writes_file():
         assert isinstance(loaded, Planet)
         assert loaded.mesh is not None
         assert hasattr(loaded.mesh, "faces")
+
+
+def make_planet() -> Planet:
+    config = PlanetGenConfig(radius=5000, subdivision_level=2, seed=123)
+    planet = run_mesh(Planet(radius=config.radius, subdivision_level=2, seed=123), config, cli_args={})
+    planet.plate_map = PlateMap(face_to_plate=planet.mesh.base_tiles().astype(np.int32))
+    return planet
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_background_export_returns_future(tmp_path, mode):
+    planet = make_planet()
+    expected = planet.plate_map.face_to_plate
+    output_path = tmp_path / f"{mode}.planetbin"
+
+    future = run_export(planet, str(output_path), PlanetGenConfig(export={"background": mode}))
+    # The export works on a snapshot, so the caller may move on and change the planet
+    planet.plate_map = None
+    assert isinstance(future, Future)
+    assert future.result(timeout=60) == str(output_path)
+    wait_for_exports()
+
+    loaded = Planet.load(output_path)
+    np.testing.assert_array_equal(loaded.plate_map.face_to_plate, expected)
+    np.testing.assert_array_equal(loaded.mesh.faces, planet.mesh.faces)
+
+
+def test_background_export_propagates_errors(tmp_path):
+    output_path = tmp_path / "missing" / "planet.planetbin"
+    future = run_export(make_planet(), str(output_path), None, {"background": "thread"})
+    assert isinstance(future.exception(timeout=60), OSError)
+    with pytest.raises(OSError):
+        wait_for_exports()
+    # Failures are reported once
+    wait_for_exports()
+
+
+def test_unknown_background_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        run_export(make_planet(), str(tmp_path / "x.planetbin"), None, {"background": "cluster"})
+
+
+def test_snapshot_is_independent_of_later_changes():
+    planet = make_planet()
+    planet.provenance["mesh"] = {"stage": "mesh"}
+    snapshot = planet.snapshot()
+    planet.plates.append("plate")
+    planet.provenance["mesh"]["stage"] = "changed"
+    planet.mesh.face_ids = None
+
+    assert snapshot.plates == [] and snapshot.provenance["mesh"]["stage"] == "mesh"
+    assert snapshot.mesh.face_ids is not None
+    assert snapshot.mesh.faces is planet.mesh.faces
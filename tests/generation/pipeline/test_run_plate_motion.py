@@ -0,0 +1,25 @@
+"""
+Unit tests for the plate motion pipeline stage.
+"""
+
+from generation.pipeline.run_cratons import run_cratons
+from generation.pipeline.run_mesh import run_mesh
+from generation.pipeline.run_plate_motion import run_plate_motion
+from shared.config.planet_gen_config import PlanetGenConfig
+from generation.models.planet import Planet
+
+
+def test_run_plate_motion_assigns_plates():
+    config = PlanetGenConfig(radius=6371, subdivision_level=2, seed=42)
+    planet = Planet(radius=config.radius, subdivision_level=config.subdivision_level, seed=config.seed)
+
+    planet = run_mesh(planet, config, cli_args={})
+    planet = run_cratons(planet, config, {"count": 5, "strategy": "spaced_random"})
+    planet = run_plate_motion(planet, config, {"max_angular_velocity": 2.0})
+
+    assert len(planet.plates) == 5
+    assert planet.plate_map is not None
+    assert len(planet.plate_map.face_to_plate) == len(planet.mesh.faces)
+    for plate in planet.plates:
+        assert plate.euler_pole is not None
+        assert plate.angular_velocity > 0
@@ -0,0 +1,118 @@
+# tests/generation/pipeline/test_stage_cache.py
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from generation import generate_planet
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import PIPELINE, generate
+from generation.models.planet import Planet
+from generation.pipeline.generate_biomes.lookup_table import DEFAULT_WHITTAKER_TABLE
+from generation.pipeline.stage_cache import StageCache, stage_keys
+
+STAGES = [key for key, _, _ in PIPELINE]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record which stage runners actually run."""
+    ran = []
+
+    def counted(key, runner):
+        def run(planet, config, cli_args):
+            ran.append(key)
+            return runner(planet, config, cli_args)
+        return run
+
+    monkeypatch.setattr(generate_planet, "PIPELINE",
+                        [(key, counted(key, runner), label) for key, runner, label in PIPELINE])
+    return ran
+
+
+def test_keys_chain_through_upstream_stages():
+    config, _, _, stage_args = parse_args(["--subdivision", "2"])
+    planet = Planet(radius=config.radius, subdivision_level=2, seed=1)
+    keys = stage_keys(STAGES, planet, config, stage_args)
+    assert len(set(keys)) == len(STAGES)
+    assert stage_keys(STAGES, planet, config, stage_args) == keys
+
+    config, _, _, stage_args = parse_args(["--subdivision", "2", "--craton_count", "5"])
+    changed = stage_keys(STAGES, planet, config, stage_args)
+    assert changed[0] == keys[0]
+    assert all(a != b for a, b in zip(changed[1:], keys[1:]))
+
+    other_seed = Planet(radius=config.radius, subdivision_level=2, seed=2)
+    assert stage_keys(STAGES, other_seed, config, stage_args)[0] != changed[0]
+
+
+def test_rerun_loads_cached_stages(tmp_path, calls):
+    config, _, _, stage_args = parse_args(["--subdivision", "2", "--cache_dir", str(tmp_path / "cache")])
+    first = generate(config, stage_args, seed=3)
+    assert calls == STAGES
+    assert len(list((tmp_path / "cache").glob("*.planetbin"))) == len(STAGES)
+
+    calls.clear()
+    second = generate(config, stage_args, seed=3)
+    assert calls == []
+    np.testing.assert_array_equal(second.elevation.elevation, first.elevation.elevation)
+    np.testing.assert_array_equal(second.political_map.face_to_nation, first.political_map.face_to_nation)
+    assert second.provenance == first.provenance
+    assert len(second.nations) == len(first.nations)
+
+    # Only the craton settings changed: the mesh is loaded, everything after it re-runs
+    config, _, _, stage_args = parse_args(["--subdivision", "2", "--cache_dir", str(tmp_path / "cache"),
+                                           "--craton_count", str(len(first.cratons) + 2)])
+    third = generate(config, stage_args, seed=3)
+    assert calls == STAGES[1:]
+    np.testing.assert_array_equal(third.mesh.faces, first.mesh.faces)
+    assert len(third.cratons) == len(first.cratons) + 2
+
+
+def test_editing_the_biome_table_file_resumes_at_biomes(tmp_path, calls):
+    table = tmp_path / "biomes.json"
+    table.write_text(json.dumps(DEFAULT_WHITTAKER_TABLE))
+    config, _, _, stage_args = parse_args(["--subdivision", "1", "--cache_dir", str(tmp_path / "cache"),
+                                           "--biome_table", str(table)])
+    generate(config, stage_args, seed=3)
+
+    edited = {**DEFAULT_WHITTAKER_TABLE, "bands": ["ocean"] * len(DEFAULT_WHITTAKER_TABLE["bands"])}
+    table.write_text(json.dumps(edited))
+    calls.clear()
+    planet = generate(config, stage_args, seed=3)
+    assert calls == STAGES[STAGES.index("biomes"):]
+    assert set(planet.biomes.biome_ids) == {planet.biomes.names.index("ocean")}
+
+
+def test_unreadable_entry_falls_back_to_a_full_run(tmp_path, calls):
+    config, _, _, stage_args = parse_args(["--subdivision", "1", "--cache_dir", str(tmp_path)])
+    generate(config, stage_args, seed=3)
+    mesh_entry = stage_keys(STAGES, Planet(radius=config.radius, subdivision_level=1, seed=3), config, stage_args)[0]
+    (tmp_path / f"{mesh_entry}.planetbin").write_bytes(b"truncated")
+
+    calls.clear()
+    planet = generate(config, stage_args, seed=3)
+    assert calls == STAGES and planet.biomes is not None
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    config, _, _, stage_args = parse_args(["--subdivision", "1"])
+    planet = generate(config, stage_args, seed=3)
+    cache = StageCache(tmp_path, max_bytes=10 ** 9)
+    for key in ("a", "b", "c"):
+        cache.store(key, planet, "elevation")
+    for age, key in enumerate(("b", "a", "c")):
+        os.utime(cache.path(key), (1000 + age, 1000 + age))
+    entry_size = cache.path("a").stat().st_size
+
+    cache.max_bytes = 2 * entry_size
+    assert cache.evict() == 1
+    assert "b" not in cache and "a" in cache and "c" in cache
+
+    # A restore counts as a use, so the other entry is evicted next
+    cache.restore(Planet(radius=planet.radius, subdivision_level=1, seed=3), ["elevation"], ["a"])
+    cache.store("d", planet, "elevation")
+    assert "c" not in cache and "a" in cache and "d" in cache
+    assert cache.size() <= cache.max_bytes
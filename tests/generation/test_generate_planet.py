@@ -0,0 +1,47 @@
+# tests/generation/test_generate_planet.py
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+from generation.cli.argument_parser import parse_args
+from generation.generate_planet import generate, main
+from generation.models.planet import Planet
+from generation.pipeline.export_planet import get_strategy
+from generation.pipeline.generate_biomes.lookup_table import DEFAULT_WHITTAKER_TABLE
+
+
+def run_main(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["generate_planet", *argv])
+    main()
+
+
+def test_rerun_on_flat_file_needs_an_output_path(tmp_path, monkeypatch):
+    config, _, _, stage_args = parse_args(["--subdivision", "2"])
+    planet = generate(config, stage_args, seed=3)
+    flat = tmp_path / "planet.planetmm"
+    get_strategy("flat", output_path=str(flat)).run(planet)
+    original = flat.read_bytes()
+
+    with pytest.raises(ValueError, match="--output"):
+        run_main(monkeypatch, "--input", str(flat), "--rerun", "erosion")
+    with pytest.raises(ValueError, match="--output"):
+        run_main(monkeypatch, "--input", str(flat), "--rerun", "erosion", "--output", str(flat))
+    assert flat.read_bytes() == original
+
+    rerun = tmp_path / "rerun.planetmm"
+    run_main(monkeypatch, "--input", str(flat), "--rerun", "erosion", "--export_strategy", "flat",
+             "--output", str(rerun))
+    with Planet.open(rerun) as opened:
+        np.testing.assert_array_equal(opened.mesh.faces, planet.mesh.faces)
+        assert opened.provenance["elevation"]["stage"] == "erosion"
+
+
+def test_default_config_runs_from_any_directory(tmp_path, monkeypatch):
+    config_path = Path(__file__).resolve().parents[2] / "config" / "earthlike_default.json"
+    monkeypatch.chdir(tmp_path)
+    config, _, _, stage_args = parse_args(["--config", str(config_path), "--subdivision", "1"])
+    planet = generate(config, stage_args, seed=3)
+    assert planet.biomes.names == DEFAULT_WHITTAKER_TABLE["biomes"]
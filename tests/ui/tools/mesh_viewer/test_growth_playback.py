@@ -0,0 +1,50 @@
+# tests/ui/tools/mesh_viewer/test_growth_playback.py
+
+import numpy as np
+import pytest
+
+from generation.models.planet import Planet
+from generation.models.tectonics import PlateMap
+from ui.tools.mesh_viewer.growth_playback import GrowthPlayback
+
+
+def make_playback() -> GrowthPlayback:
+    claim_order = np.array([0, 1, 1, 2, 3, 0, 2, -1], dtype=np.int32)
+    claim_owner = np.array([0, 0, 1, 1, 0, 1, 0, -1], dtype=np.int32)
+    return GrowthPlayback(claim_order, claim_owner)
+
+
+def test_frame_thresholds_claim_order():
+    playback = make_playback()
+    np.testing.assert_array_equal(playback.frame(0), [0, -1, -1, -1, -1, 1, -1, -1])
+    np.testing.assert_array_equal(playback.frame(2), [0, 0, 1, 1, -1, 1, 0, -1])
+    np.testing.assert_array_equal(playback.frame(99), playback.frame(playback.last_frame))
+
+
+def test_seek_and_step_clamp_to_range():
+    playback = make_playback()
+    assert playback.num_frames == 4
+    playback.seek(-5)
+    assert playback.current == 0
+    playback.step(10)
+    assert playback.current == 3
+
+
+def test_changed_faces_and_counts():
+    playback = make_playback()
+    assert sorted(playback.changed_faces(0, 2).tolist()) == [1, 2, 3, 6]
+    assert playback.claimed_count(0) == 2
+    assert playback.claimed_count(3) == 7
+
+
+def test_from_planet_requires_claim_order():
+    planet = Planet(radius=1.0, subdivision_level=0, seed=1)
+    assert GrowthPlayback.from_planet(planet) is None
+
+    planet.plate_map = PlateMap(face_to_plate=np.array([0, 1]), claim_order=np.array([0, 0]))
+    assert GrowthPlayback.from_planet(planet).num_frames == 1
+
+
+def test_mismatched_shapes_rejected():
+    with pytest.raises(ValueError):
+        GrowthPlayback(np.zeros(3, dtype=np.int32), np.zeros(4, dtype=np.int32))
@@ -0,0 +1,81 @@
+# ui/tools/mesh_viewer/growth_playback.py
+
+from typing import Optional
+import numpy as np
+
+from generation.models.planet import Planet
+
+
+class GrowthPlayback:
+    """
+    Scrubbing controller for recorded plate/craton growth.
+
+    Growth is stored as two per-face arrays: the iteration at which each face was claimed
+    and the plate that claimed it. Frames are rebuilt on demand with a vectorized threshold,
+    so memory stays O(faces) no matter how many iterations were recorded.
+    """
+
+    def __init__(self, claim_order: np.ndarray, claim_owner: np.ndarray):
+        """
+        Args:
+            claim_order (np.ndarray): Iteration at which each face was claimed (-1 = never)
+            claim_owner (np.ndarray): Plate ID that claimed each face
+        """
+        if claim_order.shape != claim_owner.shape:
+            raise ValueError("claim_order and claim_owner must have the same shape")
+        self.claim_order = claim_order
+        self.claim_owner = claim_owner
+        self.last_frame = int(claim_order.max()) if claim_order.size else 0
+        self.current = self.last_frame
+
+        # Faces sorted by claim iteration, so per-step deltas are a searchsorted slice
+        claimed = np.flatnonzero(claim_order >= 0)
+        self._order = claimed[np.argsort(claim_order[claimed], kind="stable")]
+        self._sorted_iterations = claim_order[self._order]
+
+    @classmethod
+    def from_planet(cls, planet: Planet) -> Optional["GrowthPlayback"]:
+        """Build a playback from a planet's plate map, or return None if growth wasn't recorded."""
+        plate_map = planet.plate_map if planet is not None else None
+        if plate_map is None or plate_map.claim_order is None:
+            return None
+        return cls(plate_map.claim_order, plate_map.face_to_plate)
+
+    @property
+    def num_frames(self) -> int:
+        """Number of scrubbable frames (iterations 0..last_frame inclusive)."""
+        return self.last_frame + 1
+
+    def frame(self, iteration: int) -> np.ndarray:
+        """
+        Return the per-face owner after the given iteration (-1 for unclaimed faces).
+        """
+        iteration = self._clamp(iteration)
+        claimed = (self.claim_order >= 0) & (self.claim_order <= iteration)
+        return np.where(claimed, self.claim_owner, -1)
+
+    def seek(self, iteration: int) -> np.ndarray:
+        """Move the playhead to an iteration and return that frame."""
+        self.current = self._clamp(iteration)
+        return self.frame(self.current)
+
+    def step(self, delta: int = 1) -> np.ndarray:
+        """Move the playhead by `delta` iterations and return the new frame."""
+        return self.seek(self.current + delta)
+
+    def changed_faces(self, start: int, end: int) -> np.ndarray:
+        """
+        Return the faces claimed in iterations (start, end], for incremental color updates.
+        """
+        lo, hi = sorted((self._clamp(start), self._clamp(end)))
+        first = np.searchsorted(self._sorted_iterations, lo, side="right")
+        last = np.searchsorted(self._sorted_iterations, hi, side="right")
+        return self._order[first:last]
+
+    def claimed_count(self, iteration: int) -> int:
+        """Return how many faces have been claimed by the given iteration."""
+        return int(np.searchsorted(self._sorted_iterations, self._clamp(iteration), side="right"))
+
+    def _clamp(self, iteration: int) -> int:
+        """Clamp an iteration index to the recorded range."""
+        return max(0, min(int(iteration), self.last_frame))
@@ -18,10 +18,14 @@ def main():
         "--load", type=str, required=True,
         help="Path to the .planetbin file to view"
     )
+    parser.add_argument(
+        "--preview", action="store_true",
+        help="Show the file's embedded low-resolution preview instead of the full planet"
+    )
 
     args = parser.parse_args()
 
-    mesh_data = load_mesh_render_data(args.load)
+    mesh_data = load_mesh_render_data(args.load, preview=args.preview)
 
     app = QApplication(sys.argv)
     viewer = PlanetViewerApp(mesh_data)
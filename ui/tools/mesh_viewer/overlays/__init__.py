@@ -4,9 +4,13 @@ from .base import Overlay
 from .face_index_overlay import FaceIndexOverlay
 from .face_normals_overlay import FaceNormalsOverlay
 from .craton_overlay import CratonOverlay
+from .plate_growth_overlay import PlateGrowthOverlay
+from .face_field_overlay import FaceFieldOverlay
 
 ALL_OVERLAYS = [
     FaceIndexOverlay,
     FaceNormalsOverlay,
     CratonOverlay,
+    PlateGrowthOverlay,
+    FaceFieldOverlay,
 ]
@@ -0,0 +1,92 @@
+# ui/tools/mesh_viewer/overlays/face_field_overlay.py
+
+import numpy as np
+from OpenGL.GL import *
+
+from .base import Overlay
+from ui.tools.mesh_viewer.mesh_render_data import MeshRenderData
+
+
+class FaceFieldOverlay(Overlay):
+    """
+    Overlay that colors faces by any per-face field stored in the planet file.
+
+    The available fields come from PlanetFile.fields("face"), so layers added by new stages
+    show up here without viewer changes. Floating-point fields use a blue-to-red ramp over
+    their value range; integer fields (plate, biome or nation IDs) get a fixed palette.
+    Call select_field() with one of `self.fields` to switch; elevation is shown by default.
+    """
+
+    DEFAULT_FIELD = "elevation/elevation"
+
+    def __init__(self):
+        super().__init__()
+        self.planet = None
+        self.fields: dict = {}
+        self.field: str | None = None
+        self.colors: np.ndarray | None = None
+
+    def get_name(self):
+        """Unique name used for overlay toggle and identification."""
+        return "Face Fields"
+
+    def get_category(self):
+        """Grouping category shown in the overlay menu."""
+        return "Layers"
+
+    def get_description(self):
+        """Short tooltip-style description of the overlay's purpose."""
+        return "Colors faces by a stored per-face layer (elevation, temperature, biome, ...)"
+
+    def update_data(self, mesh_data: MeshRenderData) -> None:
+        """List the planet's per-face fields and show the default one."""
+        self.planet = mesh_data.planet
+        self.fields = self.planet.fields("face") if hasattr(self.planet, "fields") else {}
+        self.colors = None
+        if self.fields:
+            self.select_field(self.DEFAULT_FIELD if self.DEFAULT_FIELD in self.fields else next(iter(self.fields)))
+
+    def select_field(self, path: str) -> None:
+        """Read one field (only that dataset) and precompute its face colors."""
+        self.field = path
+        self.colors = field_colors(self.planet.read(path))
+
+    def render(self, gl_widget):
+        """Render every face as a filled triangle in its field color."""
+        if not self.is_enabled() or self.colors is None:
+            return
+        if gl_widget.render_mode.name.lower() not in ("flat_shaded", "sunlit"):
+            return
+
+        vertices = gl_widget.mesh_data.vertices
+        faces = gl_widget.mesh_data.faces
+
+        glDisable(GL_LIGHTING)
+        glBegin(GL_TRIANGLES)
+        for face_id, face in enumerate(faces):
+            glColor3f(*self.colors[face_id])
+            for idx in face:
+                glVertex3f(*vertices[idx])
+        glEnd()
+        glEnable(GL_LIGHTING)
+
+
+def field_colors(values: np.ndarray) -> np.ndarray:
+    """
+    Map per-face values to RGB colors in [0, 1].
+
+    Args:
+        values (np.ndarray): One value per face
+
+    Returns:
+        np.ndarray: Colors of shape (num_faces, 3)
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        rng = np.random.default_rng(0)  # Fixed palette so colors don't change between loads
+        palette = rng.uniform(0.2, 1.0, size=(int(values.max()) - int(values.min()) + 1, 3))
+        return palette[values - values.min()]
+    finite = np.isfinite(values)
+    low, high = (values[finite].min(), values[finite].max()) if finite.any() else (0.0, 1.0)
+    t = np.clip((values - low) / max(high - low, 1e-12), 0.0, 1.0)
+    t[~finite] = 0.0
+    return np.stack([t, 1.0 - np.abs(2.0 * t - 1.0), 1.0 - t], axis=1)
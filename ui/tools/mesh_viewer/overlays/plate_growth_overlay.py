@@ -0,0 +1,67 @@
+# ui/tools/mesh_viewer/overlays/plate_growth_overlay.py
+
+import numpy as np
+from OpenGL.GL import *
+
+from .base import Overlay
+from ui.tools.mesh_viewer.growth_playback import GrowthPlayback
+from ui.tools.mesh_viewer.mesh_render_data import MeshRenderData
+
+
+class PlateGrowthOverlay(Overlay):
+    """
+    Overlay that colors each face by the plate that owns it at the current growth frame.
+
+    Frames come from a GrowthPlayback built from the planet's recorded claim order;
+    the viewer scrubs through them by calling seek() on `self.playback`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.playback: GrowthPlayback | None = None
+        self.palette: np.ndarray | None = None
+
+    def get_name(self):
+        """Unique name used for overlay toggle and identification."""
+        return "Plate Growth"
+
+    def get_category(self):
+        """Grouping category shown in the overlay menu."""
+        return "Tectonics"
+
+    def get_description(self):
+        """Short tooltip-style description of the overlay's purpose."""
+        return "Colors faces by owning plate at the selected growth iteration"
+
+    def update_data(self, mesh_data: MeshRenderData) -> None:
+        """Build the growth playback and a stable per-plate color palette."""
+        self.playback = GrowthPlayback.from_planet(mesh_data.planet)
+        if self.playback is None:
+            self.palette = None
+            return
+        num_plates = int(self.playback.claim_owner.max()) + 1
+        rng = np.random.default_rng(0)  # Fixed palette so colors don't change between loads
+        self.palette = rng.uniform(0.2, 1.0, size=(max(num_plates, 1), 3))
+
+    def render(self, gl_widget):
+        """
+        Render every claimed face of the current frame as a filled, plate-colored triangle.
+        """
+        if not self.is_enabled() or self.playback is None:
+            return
+        if gl_widget.render_mode.name.lower() not in ("flat_shaded", "sunlit"):
+            return
+
+        vertices = gl_widget.mesh_data.vertices
+        faces = gl_widget.mesh_data.faces
+        owners = self.playback.frame(self.playback.current)
+        claimed = np.flatnonzero(owners >= 0)
+
+        glDisable(GL_LIGHTING)
+        glBegin(GL_TRIANGLES)
+        for face_id in claimed:
+            glColor3f(*self.palette[owners[face_id]])
+            for idx in faces[face_id]:
+                glVertex3f(*vertices[idx])
+        glEnd()
+        glEnable(GL_LIGHTING)
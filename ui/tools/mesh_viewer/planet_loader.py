@@ -8,9 +8,13 @@ from shared.logging.logger import get_logger
 log = get_logger(__name__)
 
 
-def load_mesh_render_data(path: str | Path) -> MeshRenderData:
+def load_mesh_render_data(path: str | Path, preview: bool = False) -> MeshRenderData:
     """
     Load a .planetbin file and extract mesh data for rendering.
+
+    The planet stays open as a lazy PlanetFile (MeshRenderData.planet), so overlays
+    read cratons, the plate map and other layers only when they are enabled. With
+    `preview`, only the file's embedded low-resolution preview is opened.
     """
     path = Path(path)
     log.info(f"Loading .planetbin file from: {path}")
@@ -18,18 +22,22 @@ def load_mesh_render_data(path: str | Path) -> MeshRenderData:
     if not path.exists():
         raise FileNotFoundError(f"Planet file not found: {path}")
 
-    planet = Planet.load(path)
-    mesh = planet.mesh
+    # Open lazily: the viewer needs vertices and faces now; overlays read the rest on demand
+    planet = Planet.open_preview(path) if preview else Planet.open(path)
+    vertices = planet.read("mesh/vertices")
+    faces = planet.read("mesh/faces")
+    face_ids = planet.read("mesh/face_ids") if "mesh/face_ids" in planet else None
+    elevation = planet.read("elevation/elevation") if "elevation/elevation" in planet else None
 
-    log.info(f"Loaded mesh: {len(mesh.vertices)} vertices, {len(mesh.faces)} faces")
-    log.debug(f"Elevation: {'present' if planet.elevation is not None else 'absent'}; Face IDs: {'present' if mesh.face_ids is not None else 'absent'}")
-    if mesh.face_ids is not None:
-        log.debug(f"Loaded {len(mesh.face_ids)} face IDs")
+    log.info(f"Loaded mesh: {len(vertices)} vertices, {len(faces)} faces")
+    log.debug(f"Elevation: {'present' if elevation is not None else 'absent'}; Face IDs: {'present' if face_ids is not None else 'absent'}")
+    if face_ids is not None:
+        log.debug(f"Loaded {len(face_ids)} face IDs")
 
     return MeshRenderData(
-        vertices=mesh.vertices,
-        faces=mesh.faces,
-        elevation=planet.elevation,
-        face_ids=mesh.face_ids,
+        vertices=vertices,
+        faces=faces,
+        elevation=elevation,
+        face_ids=face_ids,
         planet=planet
     )
@@ -1,6 +1,6 @@
 # ui/tools/mesh_viewer/viewer_app.py
 
-from PySide6.QtWidgets import QMainWindow, QToolBar, QComboBox, QWidgetAction
+from PySide6.QtWidgets import QMainWindow, QToolBar, QComboBox, QWidgetAction, QSlider
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt
 
@@ -10,6 +10,7 @@ from shared.logging.logger import get_logger
 from ui.tools.mesh_viewer.overlays.face_index_overlay import FaceIndexOverlay
 from ui.tools.mesh_viewer.overlays.face_normals_overlay import FaceNormalsOverlay
 from ui.tools.mesh_viewer.overlays.craton_overlay import CratonOverlay
+from ui.tools.mesh_viewer.overlays.plate_growth_overlay import PlateGrowthOverlay
 
 log = get_logger(__name__)
 
@@ -38,6 +39,11 @@ class PlanetViewerApp(QMainWindow):
         self.craton_overlay = CratonOverlay()
         self.mesh_widget.overlay_manager.register(self.craton_overlay)
 
+        # Reuse the auto-registered instance so the toggle and the scrubber drive the same overlay
+        self.plate_growth_overlay = next(
+            ov for ov in self.mesh_widget.overlay_manager.get_all() if isinstance(ov, PlateGrowthOverlay)
+        )
+
         self._init_toolbar()
         log.info("Viewer window initialized.")
 
@@ -56,6 +62,17 @@ class PlanetViewerApp(QMainWindow):
         self.mesh_widget.overlay_manager.set_overlay_enabled("Cratons", enabled)
         self.mesh_widget.update()
 
+    def _toggle_plate_growth_overlay(self, enabled: bool):
+        """Enable/disable the Plate Growth overlay and refresh the view."""
+        self.mesh_widget.overlay_manager.set_overlay_enabled("Plate Growth", enabled)
+        self.mesh_widget.update()
+
+    def _scrub_plate_growth(self, iteration: int):
+        """Move the plate growth playhead to the given iteration and refresh the view."""
+        if self.plate_growth_overlay.playback is not None:
+            self.plate_growth_overlay.playback.seek(iteration)
+            self.mesh_widget.update()
+
     def _init_toolbar(self):
         """Create and populate the viewer control toolbar."""
         toolbar = QToolBar("Viewer Controls")
@@ -112,3 +129,21 @@ class PlanetViewerApp(QMainWindow):
         self.craton_overlay_action.setChecked(self.craton_overlay.is_enabled())
         self.craton_overlay_action.toggled.connect(lambda checked: self._toggle_craton_overlay(checked))
         toolbar.addAction(self.craton_overlay_action)
+
+        # Plate growth overlay toggle and iteration scrubber
+        self.plate_growth_action = QAction("Show Plate Growth", self)
+        self.plate_growth_action.setCheckable(True)
+        self.plate_growth_action.setChecked(self.plate_growth_overlay.is_enabled())
+        self.plate_growth_action.toggled.connect(lambda checked: self._toggle_plate_growth_overlay(checked))
+        toolbar.addAction(self.plate_growth_action)
+
+        playback = self.plate_growth_overlay.playback
+        if playback is not None:
+            growth_slider = QSlider(Qt.Orientation.Horizontal)
+            growth_slider.setRange(0, playback.last_frame)
+            growth_slider.setValue(playback.current)
+            growth_slider.valueChanged.connect(self._scrub_plate_growth)
+
+            growth_slider_action = QWidgetAction(self)
+            growth_slider_action.setDefaultWidget(growth_slider)
+            toolbar.addAction(growth_slider_action)